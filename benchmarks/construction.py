@@ -0,0 +1,85 @@
+"""
+Custom resource construction benchmark.
+
+Builds the custom resources of a synthetic configuration twice: with the trusted construction path used by default, and
+with output validation turned back on as `INTENSIVE_BREW_VALIDATE_OUTPUT` does. Reports the per custom resource cost of
+both and checks that they build the same resources.
+
+Usage: python -m benchmarks.construction [--size 10000] [--repeat 5]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from typing import Any
+
+from benchmarks.synthetic import synthetic_configuration
+
+from intensive_brew.core.custom_resource.utils.helpers import Helpers
+from intensive_brew.core.dto.custom_resource.locust_test_custom_resource import LocustTest
+from intensive_brew.core.dto.yaml.configuration import Configuration
+
+VALIDATE_OUTPUT_ENV = "INTENSIVE_BREW_VALIDATE_OUTPUT"
+
+
+def _build(configuration: Configuration, validate_output: bool) -> tuple[list[LocustTest], float]:
+    """Build every custom resource of the configuration, returning them along with the build duration in seconds."""
+    previous = os.environ.pop(VALIDATE_OUTPUT_ENV, None)
+    if validate_output:
+        os.environ[VALIDATE_OUTPUT_ENV] = "1"
+    try:
+        start = time.perf_counter()
+        custom_resources = Helpers.build_custom_resources(configuration)
+        return custom_resources, time.perf_counter() - start
+    finally:
+        os.environ.pop(VALIDATE_OUTPUT_ENV, None)
+        if previous is not None:
+            os.environ[VALIDATE_OUTPUT_ENV] = previous
+
+
+def run_benchmark(size: int, repeat: int, seed: int = 0) -> dict[str, Any]:
+    """
+    Benchmark validated and trusted construction, keeping the best of the repeated runs.
+
+    :param size: number of tests
+    :param repeat: number of runs of each construction path
+    :param seed: synthetic configuration seed
+    :return: Per custom resource cost of both paths, in microseconds
+    """
+    configuration = Configuration.parse_obj(synthetic_configuration(size, seed))
+
+    validated, validated_seconds = min((_build(configuration, True) for _ in range(repeat)), key=lambda run: run[1])
+    trusted, trusted_seconds = min((_build(configuration, False) for _ in range(repeat)), key=lambda run: run[1])
+    if trusted != validated:
+        raise AssertionError("Trusted construction built different custom resources.")
+
+    return {
+        "size": size,
+        "validated_per_cr_us": validated_seconds / size * 1e6,
+        "trusted_per_cr_us": trusted_seconds / size * 1e6,
+        "speedup": validated_seconds / trusted_seconds,
+    }
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=10_000, help="Number of tests.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs of each construction path, the best one is kept.")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic configuration seed.")
+    args = parser.parse_args()
+
+    # Per test build logs would dominate the construction cost
+    logging.basicConfig(level=logging.WARNING, force=True)
+
+    results = run_benchmark(args.size, args.repeat, args.seed)
+    print(  # noqa: T201
+        f"{results['size']} custom resources: validated {results['validated_per_cr_us']:.1f} us/CR, "
+        f"trusted {results['trusted_per_cr_us']:.1f} us/CR ({results['speedup']:.2f}x)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
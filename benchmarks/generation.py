@@ -0,0 +1,166 @@
+"""
+Generation stages benchmark.
+
+Generates synthetic configurations of increasing sizes and separately times every stage of a generation run: YAML load,
+`Configuration.parse_obj`, `build_custom_resources`, serialization and file writes. Results are written as JSON and can be
+compared with the results of another commit, regressions beyond the threshold make the run fail.
+
+Usage: python -m benchmarks.generation [--sizes 10 1000] [--output results.json] [--baseline previous.json]
+"""
+import argparse
+import json
+import logging
+import pathlib
+import platform
+import subprocess  # nosec B404
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from benchmarks.synthetic import write_synthetic_configuration
+
+from intensive_brew.core.codec.codecs import LIBYAML_AVAILABLE, get_codec
+from intensive_brew.core.codec.formats import DataFormat
+from intensive_brew.core.custom_resource.utils.helpers import Helpers
+from intensive_brew.core.dto.yaml.configuration import Configuration
+
+RESULTS_SCHEMA_VERSION = 1
+
+STAGES = ("yaml_load", "parse_obj", "build", "serialize", "write")
+
+DEFAULT_SIZES = (10, 1_000, 10_000, 100_000)
+
+# Relative slowdown of a stage, compared to the baseline, reported as a regression
+DEFAULT_THRESHOLD = 0.10
+
+# Absolute slowdown below which a stage is never reported, keeps timer noise of tiny sizes out of the comparison
+NOISE_FLOOR_SECONDS = 0.005
+
+T = TypeVar("T")
+
+
+def _timed(function: Callable[[], T]) -> tuple[T, float]:
+    """Run a function, returning its result and its duration in seconds."""
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def run_stages(config_file: pathlib.Path, output_dir: pathlib.Path) -> dict[str, float]:
+    """
+    Run every generation stage once.
+
+    :param config_file: configuration file
+    :param output_dir: directory the custom resources are written to
+    :return: Duration of each stage in seconds
+    """
+    codec = get_codec(DataFormat.YAML)
+
+    def load() -> Any:
+        with open(config_file) as file:
+            return codec.load(file)
+
+    raw, load_seconds = _timed(load)
+    configuration, parse_seconds = _timed(lambda: Configuration.parse_obj(raw))
+    cr_list, build_seconds = _timed(lambda: Helpers.build_custom_resources(configuration))
+    serialized, serialize_seconds = _timed(lambda: [(cr.metadata.name, Helpers.serialize_custom_resource(cr)) for cr in cr_list])
+
+    Helpers._check_or_create_output_dir(str(output_dir))
+    _, write_seconds = _timed(lambda: [Helpers.write_serialized_cr(name, config, str(output_dir)) for name, config in serialized])
+    return dict(zip(STAGES, (load_seconds, parse_seconds, build_seconds, serialize_seconds, write_seconds)))
+
+
+def run_benchmark(sizes: tuple[int, ...], repeat: int, seed: int, workdir: pathlib.Path) -> dict[str, Any]:
+    """
+    Benchmark every stage at every size, keeping the best of the repeated runs.
+
+    :param sizes: numbers of tests
+    :param repeat: number of runs per size
+    :param seed: synthetic configuration seed
+    :param workdir: scratch directory
+    :return: Results document
+    """
+    results: dict[str, Any] = {}
+    for size in sizes:
+        config_file = workdir / f"config-{size}.yaml"
+        write_synthetic_configuration(config_file, size, seed)
+
+        runs = [run_stages(config_file, workdir / f"out-{size}-{run}") for run in range(repeat)]
+        results[str(size)] = {
+            stage: {"seconds": best, "per_test_us": best / size * 1e6} for stage in STAGES for best in [min(run[stage] for run in runs)]
+        }
+    return {"schema": RESULTS_SCHEMA_VERSION, "environment": _environment(), "seed": seed, "repeat": repeat, "results": results}
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], threshold: float = DEFAULT_THRESHOLD) -> list[str]:
+    """
+    Compare results with a baseline.
+
+    :param results: current results document
+    :param baseline: results document of a previous run
+    :param threshold: relative slowdown reported as a regression
+    :return: Description of each regression
+    """
+    regressions = []
+    for size, stages in results["results"].items():
+        for stage, timing in stages.items():
+            previous = baseline["results"].get(size, {}).get(stage)
+            if previous is None:
+                continue
+            slowdown = timing["seconds"] - previous["seconds"]
+            if slowdown > NOISE_FLOOR_SECONDS and timing["seconds"] > previous["seconds"] * (1 + threshold):
+                regressions.append(f"{stage} at {size} tests: {previous['seconds']:.4f}s -> {timing['seconds']:.4f}s")
+    return regressions
+
+
+def _environment() -> dict[str, Any]:
+    """Describe the environment the benchmark ran in."""
+    try:
+        commit = subprocess.run(  # nosec B603 B607
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {"commit": commit, "python": platform.python_version(), "platform": platform.platform(), "libyaml": LIBYAML_AVAILABLE}
+
+
+def _print_table(results: dict[str, Any]) -> None:
+    """Print the per test timings of each stage."""
+    print(f"{'tests':>8} " + " ".join(f"{stage:>12}" for stage in STAGES) + "   (us per test)")  # noqa: T201
+    for size, stages in results["results"].items():
+        print(f"{size:>8} " + " ".join(f"{stages[stage]['per_test_us']:>12.1f}" for stage in STAGES))  # noqa: T201
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Numbers of tests to benchmark.")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of runs per size, the best one is kept.")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic configuration seed.")
+    parser.add_argument("--output", type=pathlib.Path, help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", type=pathlib.Path, help="Results of a previous run to compare with.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Relative slowdown reported as a regression.")
+    args = parser.parse_args()
+
+    # Per file write logs would dominate the write stage
+    logging.basicConfig(level=logging.WARNING, force=True)
+
+    with tempfile.TemporaryDirectory(prefix="intensive-brew-benchmark-") as workdir:
+        results = run_benchmark(tuple(args.sizes), args.repeat, args.seed, pathlib.Path(workdir))
+
+    _print_table(results)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)  # noqa: T201
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Custom resource memory benchmark.
+
+Measures the memory retained by the custom resources of a synthetic configuration, once as the list of LocustTest models
+returned by `build_custom_resources` and once as the compact batch returned by `build_custom_resource_batch`. Memory is
+traced with `tracemalloc`, the parsed configuration is allocated beforehand and isn't accounted for.
+
+Usage: python -m benchmarks.memory [--size 100000]
+"""
+import argparse
+import gc
+import logging
+import sys
+import tracemalloc
+from collections.abc import Callable, Sized
+from typing import Any
+
+from benchmarks.synthetic import synthetic_configuration
+
+from intensive_brew.core.custom_resource.utils.helpers import Helpers
+from intensive_brew.core.dto.yaml.configuration import Configuration
+
+
+def _retained_bytes(build: Callable[[], Sized]) -> tuple[Sized, int]:
+    """Build a collection, returning it along with the memory it retains in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        collection = build()
+        gc.collect()
+        return collection, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmark(size: int, seed: int = 0) -> dict[str, Any]:
+    """
+    Measure the memory retained per custom resource by both representations.
+
+    :param size: number of tests
+    :param seed: synthetic configuration seed
+    :return: Bytes per custom resource of both representations
+    """
+    configuration = Configuration.parse_obj(synthetic_configuration(size, seed))
+
+    models, models_bytes = _retained_bytes(lambda: Helpers.build_custom_resources(configuration))
+    del models
+    batch, batch_bytes = _retained_bytes(lambda: Helpers.build_custom_resource_batch(configuration))
+    del batch
+
+    return {
+        "size": size,
+        "models_bytes_per_cr": models_bytes / size,
+        "compact_bytes_per_cr": batch_bytes / size,
+        "reduction": 1 - batch_bytes / models_bytes,
+    }
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100_000, help="Number of tests.")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic configuration seed.")
+    args = parser.parse_args()
+
+    # Per test build logs would be traced along with the custom resources
+    logging.basicConfig(level=logging.WARNING, force=True)
+
+    results = run_benchmark(args.size, args.seed)
+    print(  # noqa: T201
+        f"{results['size']} custom resources: LocustTest models {results['models_bytes_per_cr']:.0f} B/CR, "
+        f"compact batch {results['compact_bytes_per_cr']:.0f} B/CR ({results['reduction']:.0%} less)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
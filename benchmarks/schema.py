@@ -0,0 +1,77 @@
+"""
+Configuration validation benchmark.
+
+Checks a synthetic configuration with the compiled schema validator and builds it with the configuration models, as
+`validate-configuration --schema-only` and `validate-configuration` do. Reports the per test cost of both and checks that
+they agree on the configuration being valid.
+
+Usage: python -m benchmarks.schema [--size 10000] [--repeat 5]
+"""
+import argparse
+import logging
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.synthetic import synthetic_configuration
+
+from intensive_brew.core.dto.yaml.configuration import Configuration
+from intensive_brew.core.schema.compiled_validator import validate
+
+
+def _best_of(function: Callable[[], Any], repeat: int) -> float:
+    """Run a function repeatedly, returning the duration of the fastest run in seconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def run_benchmark(size: int, repeat: int, seed: int = 0) -> dict[str, Any]:
+    """
+    Benchmark the compiled schema validator against the configuration models, keeping the best of the repeated runs.
+
+    :param size: number of tests
+    :param repeat: number of runs of each validator
+    :param seed: synthetic configuration seed
+    :return: Per test cost of both validators, in microseconds
+    """
+    raw = synthetic_configuration(size, seed)
+    errors = validate(raw)
+    if errors:
+        raise AssertionError(f"The compiled validator rejected a configuration the models accept: {errors[:5]}")
+
+    models_seconds = _best_of(lambda: Configuration.parse_obj(raw), repeat)
+    schema_seconds = _best_of(lambda: validate(raw), repeat)
+
+    return {
+        "size": size,
+        "models_per_test_us": models_seconds / size * 1e6,
+        "schema_per_test_us": schema_seconds / size * 1e6,
+        "speedup": models_seconds / schema_seconds,
+    }
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=10_000, help="Number of tests.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs of each validator, the best one is kept.")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic configuration seed.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, force=True)
+
+    results = run_benchmark(args.size, args.repeat, args.seed)
+    print(  # noqa: T201
+        f"{results['size']} tests: models {results['models_per_test_us']:.1f} us/test, "
+        f"compiled schema {results['schema_per_test_us']:.1f} us/test ({results['speedup']:.2f}x)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+CLI cold start benchmark.
+
+Runs the CLI entry point in fresh interpreters, measures it with `python -X importtime` and compares the results with the
+budget tracked in `startup_budget.json`. Exits with a non zero status when the budget is exceeded or when a module that
+must be loaded lazily is imported at startup.
+
+Usage: python benchmarks/startup.py [--repeat N] [--update-budget]
+"""
+import argparse
+import json
+import pathlib
+import statistics
+import subprocess  # nosec B404
+import sys
+import time
+
+BUDGET_FILE = pathlib.Path(__file__).with_name("startup_budget.json")
+
+# Imports the CLI and renders the help, the cheapest path users hit
+HELP_SNIPPET = "import sys; from intensive_brew.cli import app; sys.argv = ['intensive-brew', '--help']; app()"
+
+# Headroom applied to measured timings when updating the budget, absorbs noise between machines and runs
+BUDGET_HEADROOM = 1.5
+
+
+def measure_once() -> tuple[float, float, set[str]]:
+    """
+    Run the CLI help in a fresh interpreter.
+
+    :return: wall time in ms, cumulative import time of `intensive_brew.cli` in ms, imported modules
+    """
+    start = time.perf_counter()
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", HELP_SNIPPET], capture_output=True, text=True, check=False
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"CLI help failed:\n{result.stderr}")
+
+    cli_import_ms = 0.0
+    modules = set()
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        module = name.strip()
+        modules.add(module)
+        if module == "intensive_brew.cli":
+            cli_import_ms = int(cumulative) / 1000
+    return wall_ms, cli_import_ms, modules
+
+
+def main() -> int:
+    """Run the benchmark and check it against the budget."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10, help="Number of fresh interpreters to measure.")
+    parser.add_argument("--update-budget", action="store_true", help="Write the measured timings, with headroom, as the new budget.")
+    args = parser.parse_args()
+
+    budget = json.loads(BUDGET_FILE.read_text())
+    runs = [measure_once() for _ in range(args.repeat)]
+    help_wall_ms = statistics.median(run[0] for run in runs)
+    cli_import_ms = statistics.median(run[1] for run in runs)
+    imported = set().union(*(run[2] for run in runs))
+
+    results = {"help_wall_ms": round(help_wall_ms, 1), "cli_import_ms": round(cli_import_ms, 1)}
+    print(json.dumps(results, indent=2))  # noqa: T201
+
+    if args.update_budget:
+        budget.update({key: round(value * BUDGET_HEADROOM, 1) for key, value in results.items()})
+        BUDGET_FILE.write_text(json.dumps(budget, indent=2) + "\n")
+        return 0
+
+    failures = [f"{key}: {value}ms exceeds the {budget[key]}ms budget" for key, value in results.items() if value > budget[key]]
+    failures += [
+        f"{lazy_module} is imported at startup"
+        for lazy_module in budget["lazy_modules"]
+        if any(module == lazy_module or module.startswith(f"{lazy_module}.") for module in imported)
+    ]
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)  # noqa: T201
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
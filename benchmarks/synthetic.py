@@ -0,0 +1,83 @@
+"""
+Deterministic synthetic configuration generator.
+
+Produces configurations mixing vanilla, custom load shape and expert mode tests, with and without labels, annotations,
+affinity and tolerations. The same count and seed always produce the exact same configuration.
+"""
+import pathlib
+import random
+from typing import Any
+
+import yaml
+
+MODES = ("vanilla", "custom", "expert")
+
+# Optional sections, each one is enabled on roughly half of the tests
+EXTRAS = ("labels", "annotations", "affinity", "tolerations")
+
+RUN_TIMES = ("30s", "5m", "1h", "1h30m", "2h15m30s")
+
+
+def synthetic_test_config(index: int, rng: random.Random) -> dict[str, Any]:
+    """
+    Generate the raw configuration of a single test.
+
+    :param index: test index, selects the test mode
+    :param rng: seeded random generator
+    :return: Raw test configuration, as found in a configuration file
+    """
+    mode = MODES[index % len(MODES)]
+    # Expert mode doesn't need an entry point, it's still provided since the generated metadata name is derived from it
+    test_config: dict[str, Any] = {"entry_point": f"src/flow_{index}.py", "worker_replicas": rng.randint(1, 20)}
+
+    if mode == "vanilla":
+        test_config["vanilla_specs"] = {
+            "users": rng.randint(1, 10_000),
+            "spawn_rate": rng.randint(1, 100),
+            "run_time": rng.choice(RUN_TIMES),
+            "termination_timeout": rng.randint(0, 60),
+            "target_host": f"http://service-{index % 97}.perf.svc.cluster.local:8080",
+        }
+    elif mode == "custom":
+        test_config["custom_load_shapes"] = True
+    else:
+        test_config["expert_mode"] = {
+            "enabled": True,
+            "masterCommandSeed": f"--locustfile src/flow_{index}.py --users {rng.randint(1, 10_000)}",
+            "workerCommandSeed": f"--locustfile src/flow_{index}.py",
+        }
+
+    if rng.random() < 0.5:
+        test_config["image"] = f"registry.example.com/locust:2.{rng.randint(0, 20)}.0"
+    if rng.random() < 0.5:
+        test_config["configmap"] = f"flow-{index}-config"
+    if rng.random() < 0.5:
+        test_config["labels"] = {"master": {"team": f"team-{index % 50}"}, "worker": {"team": f"team-{index % 50}", "tier": "worker"}}
+    if rng.random() < 0.5:
+        test_config["annotations"] = {"master": {"owner": f"owner-{index % 13}"}, "worker": {"owner": f"owner-{index % 13}"}}
+    if rng.random() < 0.5:
+        test_config["affinity"] = {"nodeAffinity": {"requiredDuringSchedulingIgnoredDuringExecution": {"nodeGroup": "performance"}}}
+    if rng.random() < 0.5:
+        test_config["tolerations"] = [
+            {"key": "dedicated", "operator": "Equal", "value": "perf", "effect": "NoSchedule"},
+            {"key": "spot", "operator": "Exists", "effect": "NoExecute"},
+        ][: rng.randint(1, 2)]
+    return test_config
+
+
+def synthetic_configuration(count: int, seed: int = 0) -> dict[str, Any]:
+    """
+    Generate a raw configuration.
+
+    :param count: number of tests
+    :param seed: random seed
+    :return: Raw configuration, as found in a configuration file
+    """
+    rng = random.Random(seed)  # nosec B311 - not used for security purposes
+    return {"configurations": {f"team{index:06d}": synthetic_test_config(index, rng) for index in range(count)}}
+
+
+def write_synthetic_configuration(file_path: pathlib.Path, count: int, seed: int = 0) -> None:
+    """Write a synthetic configuration file."""
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    file_path.write_text(yaml.dump(synthetic_configuration(count, seed), Dumper=dumper, sort_keys=False))
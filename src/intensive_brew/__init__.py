@@ -1 +1,5 @@
 """intensive brew package."""
+import logging
+
+# Records go wherever the application embedding the package sends them, nothing is printed otherwise
+logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -0,0 +1,82 @@
+"""
+intensive brew library API.
+
+Generates custom resources in-process, e.g. from the body of an HTTP request. Nothing is read from or written to the
+filesystem, and logging is left as configured by the embedding application, records go to the `intensive_brew` loggers.
+Functions may be called concurrently from several threads: caches shared between calls are locked, every other state is
+local to a call.
+
+    >>> configuration = load_configuration(
+    ...     {"configurations": {"checkout": {"entry_point": "checkout.py", "custom_load_shapes": True, "worker_replicas": 2}}}
+    ... )
+    >>> [custom_resource.metadata.name for custom_resource in iter_custom_resources(configuration)]
+    ['checkout.checkout']
+"""
+import io
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+from intensive_brew.core.codec.codecs import get_codec
+from intensive_brew.core.codec.formats import DataFormat
+from intensive_brew.core.custom_resource.utils.helpers import Helpers
+from intensive_brew.core.dto.custom_resource.locust_test_custom_resource import LocustTest
+from intensive_brew.core.dto.yaml.configuration import Configuration
+from intensive_brew.core.yaml.matrix import MatrixExpansion
+from intensive_brew.core.yaml.sources import ConfigurationCollisionError, ConfigurationIndex
+
+__all__ = [
+    "Configuration",
+    "ConfigurationCollisionError",
+    "DataFormat",
+    "LocustTest",
+    "iter_custom_resources",
+    "load_configuration",
+    "serialize_custom_resource",
+]
+
+# Source of the tests in collision reports, configurations handed to the API don't come from a file
+API_SOURCE = "<configuration>"
+
+
+def load_configuration(source: Mapping[str, Any] | str | bytes, input_format: DataFormat = DataFormat.YAML) -> Configuration:
+    """
+    Validate a configuration.
+
+    :param source: parsed configuration, or configuration document, never a file path
+    :param input_format: format of the configuration document
+    :return: Validated configuration
+    :raises pydantic.ValidationError: if the configuration is invalid
+    """
+    if isinstance(source, bytes):
+        source = source.decode()
+    if isinstance(source, str):
+        source = get_codec(input_format).load(io.StringIO(source))
+    return Configuration.parse_obj(source)
+
+
+def iter_custom_resources(configuration: Configuration) -> Iterator[LocustTest]:
+    """
+    Build the custom resources of a configuration lazily, in configuration order.
+
+    Test matrices are expanded into one custom resource per combination.
+
+    :param configuration: validated configuration
+    :return: Iterator of custom resources
+    :raises ConfigurationCollisionError: as soon as a test would produce the same custom resource as a previous one
+    """
+    index = ConfigurationIndex()
+    for test_key, test_config in MatrixExpansion.expand(configuration.configurations.items()):
+        index.add(test_key, test_config.entry_point, API_SOURCE)
+        index.raise_on_collisions()
+        yield Helpers.build_custom_resource(test_key, test_config)
+
+
+def serialize_custom_resource(custom_resource: LocustTest, output_format: DataFormat = DataFormat.YAML) -> bytes:
+    """
+    Serialize a custom resource, as it would be written to its file.
+
+    :param custom_resource: custom resource
+    :param output_format: serialization format
+    :return: UTF-8 encoded document
+    """
+    return Helpers.serialize_custom_resource(custom_resource, output_format).encode()
@@ -1,32 +1,318 @@
-"""intensive brew CLI."""
+"""
+intensive brew CLI.
+
+Only lightweight modules are imported at module level. Each command imports the subsystem it runs (pydantic, PyYAML,
+the DTOs, ...) in its body, so that `--help` and argument errors don't pay for them.
+"""
+import dataclasses
 import logging as log
+from collections.abc import Callable
+from typing import TypeVar
 
 import typer
 
-from intensive_brew.core.custom_resource.generation import Generation
-from intensive_brew.core.yaml.validation import Validation
+from intensive_brew.core.codec.formats import DataFormat
+from intensive_brew.core.custom_resource.layout import OutputLayout
+from intensive_brew.core.custom_resource.utils.constants import DEFAULT_PIPELINE_WRITE_WORKERS, DEFAULT_WATCH_POLL_INTERVAL
+from intensive_brew.core.kubernetes.constants import DEFAULT_APPLY_CONCURRENCY, DEFAULT_APPLY_RETRIES
+from intensive_brew.core.metrics.recorder import MetricsFormat
 from intensive_brew.sys_config.config import get_logging_level
 
-log.basicConfig(level=get_logging_level(), force=True)
-
 app = typer.Typer()
 
+T = TypeVar("T")
+
+
+@app.callback()
+def main() -> None:
+    """Convert a simple YAML configuration into Locust Kubernetes Operator custom resources."""
+    log.basicConfig(level=get_logging_level(), force=True)
+
+
+def _run_with_metrics(command: Callable[[], T], timings: bool, metrics_file: str, metrics_format: MetricsFormat) -> T:
+    """Run a command, recording its metrics when requested. Metrics are reported even if the command fails."""
+    if not (timings or metrics_file):
+        return command()
+
+    from intensive_brew.core.metrics.recorder import MetricsRecorder
+
+    recorder = MetricsRecorder()
+    try:
+        with recorder:
+            return command()
+    finally:
+        if timings:
+            typer.echo(recorder.summary(), err=True)
+        if metrics_file:
+            recorder.write(metrics_file, metrics_format)
+
 
 @app.command(name="validate-configuration")
-def validate_configuration(config_file: str = typer.Option(..., "--configuration-file", "-f")) -> None:
+def validate_configuration(
+    config_files: list[str] = typer.Option(
+        ..., "--configuration-file", "-f", help="Configuration file, directory or glob, can be repeated."
+    ),
+    input_format: DataFormat = typer.Option(DataFormat.YAML, "--input-format", help="Configuration file format."),
+    fail_fast: bool = typer.Option(False, "--fail-fast", help="Stop at the first invalid test instead of reporting every error."),
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help="Number of worker processes validating tests."),
+    report_file: str = typer.Option("", "--report", help="Write a JSON report of every error to this file."),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Don't use the cache of validated configurations."),
+    timings: bool = typer.Option(False, "--timings", help="Print the wall time, CPU time and peak RSS of each stage."),
+    metrics_file: str = typer.Option("", "--metrics-file", help="Write the stage and per test metrics to this file."),
+    metrics_format: MetricsFormat = typer.Option(MetricsFormat.JSON, "--metrics-format", help="Metrics file format."),
+    schema_only: bool = typer.Option(
+        False, "--schema-only", help="Only check the files against the configuration JSON Schema, with the compiled validator."
+    ),
+) -> None:
     """Validate YAML configuration."""
-    configuration = Validation.validate(config_file)
+    if schema_only:
+        _validate_schema_only(config_files, input_format)
+        return
+
+    from intensive_brew.core.cache.configuration_cache import ConfigurationCache
+    from intensive_brew.core.yaml.sources import ConfigurationSources
 
-    if configuration:
+    cache = None if no_cache else ConfigurationCache()
+    if fail_fast:
+        valid = bool(
+            _run_with_metrics(
+                lambda: ConfigurationSources.validate(config_files, input_format, jobs, cache), timings, metrics_file, metrics_format
+            )
+        )
+    else:
+        report = _run_with_metrics(
+            lambda: ConfigurationSources.validate_all(config_files, input_format, jobs=jobs, cache=cache),
+            timings,
+            metrics_file,
+            metrics_format,
+        )
+        if report_file:
+            with open(report_file, "w") as report_output:
+                report_output.write(report.to_json())
+        if not report.is_valid:
+            typer.echo(report.summary(), err=True)
+        valid = report.is_valid
+
+    if valid:
         typer.echo("Provided configuration is valid.")
     else:
         typer.echo("Provided configuration is invalid.", err=True)
-        typer.Exit(code=1)
+        raise typer.Exit(code=1)
+
+
+def _validate_schema_only(config_files: list[str], input_format: DataFormat) -> None:
+    """Check configuration files against the configuration JSON Schema, reporting every error."""
+    from intensive_brew.core.schema.validation import SchemaValidation
+
+    errors = SchemaValidation.validate_files(config_files, input_format)
+    for file, file_errors in errors.items():
+        typer.echo("\n".join(f"{file}: {error}" for error in file_errors), err=True)
+
+    if errors:
+        typer.echo("Provided configuration is invalid.", err=True)
+        raise typer.Exit(code=1)
+    typer.echo("Provided configuration is valid.")
+
+
+@app.command(name="export-schema")
+def export_schema(
+    output_file: str = typer.Option("", "--output", "-o", help="Write the schema to this file instead of the standard output."),
+) -> None:
+    """Export the JSON Schema of the YAML configuration."""
+    import json
+
+    from intensive_brew.core.schema.schema import ConfigurationSchema
+
+    schema = json.dumps(ConfigurationSchema.build(), indent=2) + "\n"
+    if output_file:
+        with open(output_file, "w") as schema_file:
+            schema_file.write(schema)
+        log.info(f"Wrote the configuration schema at {output_file}.")
+    else:
+        typer.echo(schema, nl=False)
 
 
 @app.command(name="generate")
 def generate_custom_resource(
-    config_file: str = typer.Option(..., "--configuration-file", "-f"), output_path: str = typer.Option(..., "--output", "-o")
+    config_files: list[str] = typer.Option(
+        ..., "--configuration-file", "-f", help="Configuration file, directory or glob, can be repeated."
+    ),
+    output_path: str = typer.Option("", "--output", "-o", help="Output directory, or '-' to write a multi-document stream to stdout."),
+    output_archive: str = typer.Option(
+        "", "--output-archive", help="Write every custom resource into a single reproducible .tar.gz, .tgz, .tar or .zip archive."
+    ),
+    stream: bool = typer.Option(False, "--stream", help="Build and write each test as soon as its configuration entry is parsed."),
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help="Number of worker processes used to build custom resources."),
+    pipeline: bool = typer.Option(False, "--pipeline", help="Overlap parsing, building, serialization and file writes."),
+    write_workers: int = typer.Option(
+        DEFAULT_PIPELINE_WRITE_WORKERS, "--write-workers", min=1, help="Number of threads writing files in pipeline mode."
+    ),
+    force: bool = typer.Option(False, "--force", help="Rebuild and rewrite every test, ignoring the output directory manifest."),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Don't use the cache of validated configurations."),
+    input_format: DataFormat = typer.Option(DataFormat.YAML, "--input-format", help="Configuration file format."),
+    output_format: DataFormat = typer.Option(DataFormat.YAML, "--output-format", help="Custom resources format."),
+    layout: OutputLayout = typer.Option(
+        OutputLayout.FLAT, "--layout", help="Files placement: flat, a kustomization indexed directory per team, or hashed shards."
+    ),
+    timings: bool = typer.Option(False, "--timings", help="Print the wall time, CPU time and peak RSS of each stage."),
+    metrics_file: str = typer.Option("", "--metrics-file", help="Write the stage and per test metrics to this file."),
+    metrics_format: MetricsFormat = typer.Option(MetricsFormat.JSON, "--metrics-format", help="Metrics file format."),
 ) -> None:
     """Generate LocustTest custom resource from YAML configuration."""
-    Generation.generate(config_file, output_path)
+    if bool(output_path) == bool(output_archive):
+        raise typer.BadParameter("Exactly one of '--output' and '--output-archive' must be set.")
+    if output_archive and not output_archive.endswith((".tar.gz", ".tgz", ".tar", ".zip")):
+        raise typer.BadParameter("The archive must be a .tar.gz, .tgz, .tar or .zip file.", param_hint="'--output-archive'")
+
+    from intensive_brew.core.cache.configuration_cache import ConfigurationCache
+    from intensive_brew.core.custom_resource.generation import Generation
+
+    if output_archive:
+        if jobs > 1 or pipeline:
+            log.warning("Custom resources written to an archive are built one at a time, in configuration order.")
+        _run_with_metrics(
+            lambda: Generation.generate_archive(config_files, output_archive, input_format, output_format, layout),
+            timings,
+            metrics_file,
+            metrics_format,
+        )
+        return
+
+    # Output is tracked by a manifest so that only changed tests are rebuilt, unless a streaming mode was requested
+    _run_with_metrics(
+        lambda: Generation.generate(
+            config_files,
+            output_path,
+            stream=stream,
+            jobs=jobs,
+            pipeline=pipeline,
+            write_workers=write_workers,
+            incremental=not (stream or pipeline),
+            force=force,
+            input_format=input_format,
+            output_format=output_format,
+            cache=None if no_cache else ConfigurationCache(),
+            layout=layout,
+        ),
+        timings,
+        metrics_file,
+        metrics_format,
+    )
+
+
+@app.command(name="apply")
+def apply_custom_resources(
+    config_files: list[str] = typer.Option(
+        ..., "--configuration-file", "-f", help="Configuration file, directory or glob, can be repeated."
+    ),
+    namespace: str = typer.Option("default", "--namespace", "-n", help="Namespace the custom resources are applied to."),
+    server: str = typer.Option("", "--server", help="API server URL, read from the kubeconfig when not set."),
+    token: str = typer.Option("", "--token", envvar="INTENSIVE_BREW_KUBE_TOKEN", help="Bearer token authenticating to the API server."),
+    kubeconfig: str = typer.Option("", "--kubeconfig", help="Kubeconfig file, defaults to KUBECONFIG then ~/.kube/config."),
+    context: str = typer.Option("", "--context", help="Kubeconfig context, defaults to the current context."),
+    certificate_authority: str = typer.Option("", "--certificate-authority", help="CA bundle verifying the API server certificate."),
+    insecure_skip_tls_verify: bool = typer.Option(False, "--insecure-skip-tls-verify", help="Don't verify the API server certificate."),
+    concurrency: int = typer.Option(DEFAULT_APPLY_CONCURRENCY, "--concurrency", "-c", min=1, help="Number of concurrent requests."),
+    retries: int = typer.Option(DEFAULT_APPLY_RETRIES, "--retries", min=0, help="Number of retries on throttling and server errors."),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Have the API server validate the custom resources without persisting them."),
+    input_format: DataFormat = typer.Option(DataFormat.YAML, "--input-format", help="Configuration file format."),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Don't use the cache of validated configurations."),
+    timings: bool = typer.Option(False, "--timings", help="Print the wall time, CPU time and peak RSS of each stage."),
+    metrics_file: str = typer.Option("", "--metrics-file", help="Write the stage and per test metrics to this file."),
+    metrics_format: MetricsFormat = typer.Option(MetricsFormat.JSON, "--metrics-format", help="Metrics file format."),
+) -> None:
+    """Server-side apply the LocustTest custom resources of a YAML configuration to a Kubernetes cluster."""
+    from intensive_brew.core.cache.configuration_cache import ConfigurationCache
+    from intensive_brew.core.custom_resource.utils.helpers import Helpers
+    from intensive_brew.core.kubernetes.client import ApplyReport, KubernetesClient
+    from intensive_brew.core.kubernetes.connection import ClusterConnection
+    from intensive_brew.core.metrics.recorder import span
+    from intensive_brew.core.yaml.sources import ConfigurationSources
+
+    if server:
+        connection = ClusterConnection(
+            server, token=token, certificate_authority=certificate_authority, insecure_skip_tls_verify=insecure_skip_tls_verify
+        )
+    else:
+        connection = ClusterConnection.from_kubeconfig(kubeconfig, context)
+        overrides = {"token": token, "certificate_authority": certificate_authority, "insecure_skip_tls_verify": insecure_skip_tls_verify}
+        connection = dataclasses.replace(connection, **{key: value for key, value in overrides.items() if value})
+
+    def apply() -> ApplyReport:
+        configuration = ConfigurationSources.load(config_files, input_format, cache=None if no_cache else ConfigurationCache())
+        custom_resources = Helpers.build_custom_resources(configuration)
+        with span("apply"), KubernetesClient(connection, concurrency=concurrency, retries=retries) as client:
+            return client.apply_all(custom_resources, namespace, dry_run=dry_run)
+
+    report = _run_with_metrics(apply, timings, metrics_file, metrics_format)
+    typer.echo(report.summary())
+    if report.failed:
+        raise typer.Exit(code=1)
+
+
+@app.command(name="schedule")
+def schedule_tests(
+    config_files: list[str] = typer.Option(
+        ..., "--configuration-file", "-f", help="Configuration file, directory or glob, can be repeated."
+    ),
+    output_dir: str = typer.Option(..., "--output", "-o", help="Output directory, receiving a directory per wave and the plan."),
+    max_worker_pods: int = typer.Option(0, "--max-worker-pods", min=0, help="Cap on the total worker pods of a wave."),
+    max_users: int = typer.Option(0, "--max-users", min=0, help="Cap on the total users of a wave."),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Don't use the cache of validated configurations."),
+    input_format: DataFormat = typer.Option(DataFormat.YAML, "--input-format", help="Configuration file format."),
+    output_format: DataFormat = typer.Option(DataFormat.YAML, "--output-format", help="Custom resources format."),
+    timings: bool = typer.Option(False, "--timings", help="Print the wall time, CPU time and peak RSS of each stage."),
+    metrics_file: str = typer.Option("", "--metrics-file", help="Write the stage and per test metrics to this file."),
+    metrics_format: MetricsFormat = typer.Option(MetricsFormat.JSON, "--metrics-format", help="Metrics file format."),
+) -> None:
+    """Pack the tests of a YAML configuration into waves that don't oversubscribe the cluster, to be run one after another."""
+    if not (max_worker_pods or max_users):
+        raise typer.BadParameter("At least one of '--max-worker-pods' and '--max-users' must be set.")
+
+    from intensive_brew.core.cache.configuration_cache import ConfigurationCache
+    from intensive_brew.core.scheduling.scheduler import WaveScheduler
+
+    plan = _run_with_metrics(
+        lambda: WaveScheduler.schedule(
+            config_files,
+            output_dir,
+            max_worker_pods=max_worker_pods,
+            max_users=max_users,
+            input_format=input_format,
+            output_format=output_format,
+            cache=None if no_cache else ConfigurationCache(),
+        ),
+        timings,
+        metrics_file,
+        metrics_format,
+    )
+    typer.echo(plan.summary())
+
+
+@app.command(name="watch")
+def watch_configuration(
+    config_files: list[str] = typer.Option(
+        ..., "--configuration-file", "-f", help="Configuration file, directory or glob, can be repeated."
+    ),
+    output_path: str = typer.Option(..., "--output", "-o"),
+    polling: bool = typer.Option(False, "--polling", help="Poll the configuration files instead of relying on inotify."),
+    poll_interval: float = typer.Option(
+        DEFAULT_WATCH_POLL_INTERVAL, "--poll-interval", min=0.01, help="Number of seconds between two checks when polling."
+    ),
+    input_format: DataFormat = typer.Option(DataFormat.YAML, "--input-format", help="Configuration file format."),
+    output_format: DataFormat = typer.Option(DataFormat.YAML, "--output-format", help="Custom resources format."),
+    layout: OutputLayout = typer.Option(
+        OutputLayout.FLAT, "--layout", help="Files placement: flat, a kustomization indexed directory per team, or hashed shards."
+    ),
+) -> None:
+    """Regenerate the custom resources of changed tests whenever the configuration files change."""
+    from intensive_brew.core.custom_resource.watch import PollingFileWatcher, Watcher
+
+    file_watcher = PollingFileWatcher(config_files, poll_interval, input_format) if polling else None
+    watcher = Watcher(
+        config_files, output_path, input_format=input_format, output_format=output_format, file_watcher=file_watcher, layout=layout
+    )
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        typer.echo("Stopped watching.")
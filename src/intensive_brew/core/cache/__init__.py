@@ -0,0 +1 @@
+"""Parsed configuration cache package."""
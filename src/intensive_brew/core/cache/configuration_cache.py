@@ -0,0 +1,200 @@
+"""Parsed configuration cache package."""
+import functools
+import hashlib
+import hmac
+import logging
+import os
+import pathlib
+import pickle  # nosec B403 - entries are authenticated before being unpickled
+import secrets
+import zlib
+
+from intensive_brew.core.codec.formats import DataFormat
+from intensive_brew.core.dto.yaml.configuration import Configuration
+from intensive_brew.sys_config.config import get_cache_dir, get_cache_max_bytes, get_package_version
+
+log = logging.getLogger(__name__)
+
+# Bumped whenever the layout of cache entries changes
+CACHE_FORMAT_VERSION = 1
+
+# Leading bytes of every cache entry
+CACHE_ENTRY_MAGIC = b"IBC\x01"
+
+ENTRIES_DIR_NAME = "configurations"
+ENTRY_SUFFIX = ".bin"
+KEY_FILE_NAME = ".key"
+
+# Code deciding what a configuration file validates to, relative to the `core` package: the configuration models and
+# their validators, the codecs and the configuration loader
+VALIDATION_CODE_PATHS = ("dto", "codec", "yaml/validation.py")
+
+
+class ConfigurationCache:
+    """
+    On-disk cache of validated configurations.
+
+    Entries are keyed by the hash of the configuration file content, the package version and the code parsing and
+    validating configurations, so any change to one of them is a cache miss, even when running from source. Each entry
+    holds the pickled `Configuration`, zlib compressed and authenticated with an HMAC whose key never leaves the cache
+    directory: corrupted, truncated or foreign entries are discarded and rebuilt instead of being unpickled. The cache is
+    bounded in size, least recently used entries are evicted.
+    """
+
+    def __init__(self, cache_dir: str | None = None, max_bytes: int | None = None) -> None:
+        """
+        Initialize the cache.
+
+        :param cache_dir: cache directory, see `get_cache_dir` by default
+        :param max_bytes: maximum size of the cached entries, see `get_cache_max_bytes` by default
+        """
+        self.cache_dir = pathlib.Path(cache_dir or get_cache_dir())
+        self.max_bytes = get_cache_max_bytes() if max_bytes is None else max_bytes
+        self.entries_dir = self.cache_dir / ENTRIES_DIR_NAME
+        self._secret: bytes | None = None
+
+    def key(self, content: bytes, input_format: DataFormat = DataFormat.YAML) -> str:
+        """
+        Compute the cache key of a configuration file.
+
+        :param content: configuration file content
+        :param input_format: configuration file format
+        :return: Cache key
+        """
+        digest = hashlib.sha256(
+            f"{CACHE_FORMAT_VERSION}\0{get_package_version()}\0{_validation_code_digest()}\0{DataFormat(input_format).value}\0".encode()
+        )
+        digest.update(content)
+        return digest.hexdigest()
+
+    def load(self, key: str) -> Configuration | None:
+        """
+        Load a cached configuration.
+
+        :param key: cache key
+        :return: The cached configuration, `None` on a miss or when the entry is invalid
+        """
+        entry_path = self.entries_dir / f"{key}{ENTRY_SUFFIX}"
+        try:
+            entry = entry_path.read_bytes()
+        except FileNotFoundError:
+            log.debug(f"Configuration cache miss for {key}.")
+            return None
+        except OSError as error:
+            log.warning(f"Ignoring unreadable configuration cache entry {entry_path}: {error}")
+            return None
+
+        configuration = self._decode(entry)
+        if configuration is None:
+            log.warning(f"Discarding corrupt configuration cache entry {entry_path}.")
+            entry_path.unlink(missing_ok=True)
+            return None
+
+        # Refresh the entry's position in the eviction order
+        os.utime(entry_path)
+        log.debug(f"Configuration cache hit for {key}.")
+        return configuration
+
+    def store(self, key: str, configuration: Configuration) -> None:
+        """
+        Cache a validated configuration, failures are logged and otherwise ignored.
+
+        :param key: cache key
+        :param configuration: validated configuration
+        """
+        try:
+            self._create_dirs()
+            entry_path = self.entries_dir / f"{key}{ENTRY_SUFFIX}"
+            temporary_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+            temporary_path.write_bytes(self._encode(configuration))
+            os.replace(temporary_path, entry_path)
+            self._evict()
+        except OSError as error:
+            log.warning(f"Failed to cache configuration: {error}")
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        for entry_path in self.entries_dir.glob(f"*{ENTRY_SUFFIX}"):
+            entry_path.unlink(missing_ok=True)
+
+    def _encode(self, configuration: Configuration) -> bytes:
+        """Serialize a configuration into an authenticated entry."""
+        payload = zlib.compress(pickle.dumps(configuration, protocol=pickle.HIGHEST_PROTOCOL))
+        return CACHE_ENTRY_MAGIC + hmac.digest(self._get_secret(), payload, "sha256") + payload
+
+    def _decode(self, entry: bytes) -> Configuration | None:
+        """Deserialize an entry, `None` when it is not a valid entry written by this cache."""
+        digest_start, payload_start = len(CACHE_ENTRY_MAGIC), len(CACHE_ENTRY_MAGIC) + hashlib.sha256().digest_size
+        if not entry.startswith(CACHE_ENTRY_MAGIC) or len(entry) < payload_start:
+            return None
+
+        payload = entry[payload_start:]
+        if not hmac.compare_digest(entry[digest_start:payload_start], hmac.digest(self._get_secret(), payload, "sha256")):
+            return None
+
+        try:
+            configuration = pickle.loads(zlib.decompress(payload))  # nosec B301 - authenticated entry
+        except Exception as error:
+            log.debug(f"Failed to deserialize configuration cache entry: {error!r}")
+            return None
+        return configuration if isinstance(configuration, Configuration) else None
+
+    def _get_secret(self) -> bytes:
+        """Get the key authenticating the entries, it is created along with the cache directory."""
+        if self._secret is None:
+            self._create_dirs()
+            key_path = self.cache_dir / KEY_FILE_NAME
+            if not key_path.is_file():
+                # Linked into place so that concurrent runs all end up using the first key written
+                temporary_path = key_path.with_name(f"{KEY_FILE_NAME}.{os.getpid()}.tmp")
+                file_descriptor = os.open(temporary_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(file_descriptor, "wb") as key_file:
+                    key_file.write(secrets.token_bytes(32))
+                try:
+                    os.link(temporary_path, key_path)
+                except FileExistsError:
+                    pass
+                finally:
+                    temporary_path.unlink()
+            self._secret = key_path.read_bytes()
+        return self._secret
+
+    def _create_dirs(self) -> None:
+        """Create the cache directories, only readable by the current user."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+        self.entries_dir.mkdir(exist_ok=True, mode=0o700)
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries until the cache fits its maximum size."""
+        entries = []
+        for entry_path in self.entries_dir.glob(f"*{ENTRY_SUFFIX}"):
+            try:
+                stat = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry_path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries, key=lambda entry: entry[0]):
+            if total_bytes <= self.max_bytes:
+                break
+            log.debug(f"Evicting configuration cache entry {entry_path}.")
+            entry_path.unlink(missing_ok=True)
+            total_bytes -= size
+
+
+@functools.lru_cache(maxsize=None)
+def _validation_code_digest(core_dir: pathlib.Path = pathlib.Path(__file__).parents[1]) -> str:
+    """
+    Hash of the code parsing and validating configurations, cached configurations are invalidated whenever it changes.
+
+    Sources missing from the installed package, e.g. when only bytecode is shipped, leave the package version alone to key
+    the cache.
+    """
+    digest = hashlib.sha256()
+    for code_path in VALIDATION_CODE_PATHS:
+        path = core_dir / code_path
+        for file in sorted(path.rglob("*.py")) if path.is_dir() else [path] if path.is_file() else []:
+            digest.update(f"{file.relative_to(core_dir).as_posix()}\0".encode())
+            digest.update(file.read_bytes())
+    return digest.hexdigest()
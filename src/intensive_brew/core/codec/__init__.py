@@ -0,0 +1 @@
+"""Serialization codecs package."""
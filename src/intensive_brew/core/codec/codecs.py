@@ -0,0 +1,139 @@
+"""Serialization codecs package."""
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import IO, TYPE_CHECKING, Any
+
+import yaml
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.parser import Parser
+from yaml.reader import Reader
+from yaml.resolver import Resolver
+from yaml.scanner import Scanner
+
+from intensive_brew.core.codec.formats import DataFormat
+
+log = logging.getLogger(__name__)
+
+try:
+    from yaml import CSafeDumper, CSafeLoader
+    from yaml._yaml import CParser
+
+    LIBYAML_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    LIBYAML_AVAILABLE = False
+
+
+class StreamingLoader(Composer, SafeConstructor, Resolver):
+    """Safe loader exposing PyYAML's event / compose API, so that nodes can be composed and constructed one at a time."""
+
+    if TYPE_CHECKING:
+
+        def get_event(self) -> Any:
+            """Consume the next parser event."""
+
+        def check_event(self, *choices: type[Any]) -> bool:
+            """Check the type of the next parser event."""
+
+        def dispose(self) -> None:
+            """Release the parser resources."""
+
+
+class _PyStreamingSafeLoader(Reader, Scanner, Parser, StreamingLoader):
+    """Pure-Python streaming safe loader."""
+
+    def __init__(self, stream: IO[str]) -> None:
+        Reader.__init__(self, stream)
+        Scanner.__init__(self)
+        Parser.__init__(self)
+        Composer.__init__(self)
+        SafeConstructor.__init__(self)
+        Resolver.__init__(self)
+
+
+if LIBYAML_AVAILABLE:
+
+    class _CStreamingSafeLoader(CParser, StreamingLoader):
+        """Streaming safe loader parsing events with LibYAML while composing nodes in Python."""
+
+        def __init__(self, stream: IO[str]) -> None:
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+
+class Codec(ABC):
+    """Loads configurations and dumps custom resources in a given format."""
+
+    # * File extension of documents written with the codec
+    extension: str
+
+    @abstractmethod
+    def load(self, stream: IO[str]) -> Any:
+        """Load a single document."""
+
+    @abstractmethod
+    def dump(self, data: Any) -> str:
+        """Dump a single document, mapping keys are sorted."""
+
+
+class YamlCodec(Codec):
+    """
+    YAML codec.
+
+    Uses the LibYAML based C loader and dumper when PyYAML was built with LibYAML, falling back to the pure-Python
+    implementation otherwise. Both produce the same documents.
+    """
+
+    extension = "yaml"
+
+    def __init__(self, use_libyaml: bool = True) -> None:
+        """
+        Initialize the codec.
+
+        :param use_libyaml: use the LibYAML backend when available
+        """
+        self.use_libyaml = use_libyaml and LIBYAML_AVAILABLE
+        if use_libyaml and not LIBYAML_AVAILABLE:
+            log.debug("LibYAML is not available, using the pure-Python YAML implementation.")
+
+        self.loader: type[Any] = CSafeLoader if self.use_libyaml else yaml.SafeLoader
+        self.dumper: type[Any] = CSafeDumper if self.use_libyaml else yaml.SafeDumper
+
+    def load(self, stream: IO[str]) -> Any:
+        """Load a single YAML document."""
+        return yaml.load(stream, Loader=self.loader)  # nosec B506 - safe loaders only
+
+    def dump(self, data: Any) -> str:
+        """Dump a single YAML document."""
+        return yaml.dump(data, Dumper=self.dumper)
+
+    def streaming_loader(self, stream: IO[str]) -> StreamingLoader:
+        """Create a streaming safe loader, parsing events with LibYAML when available."""
+        if self.use_libyaml:
+            return _CStreamingSafeLoader(stream)
+        return _PyStreamingSafeLoader(stream)
+
+
+class JsonCodec(Codec):
+    """JSON codec, Kubernetes accepts JSON manifests as well as YAML ones."""
+
+    extension = "json"
+
+    def load(self, stream: IO[str]) -> Any:
+        """Load a single JSON document."""
+        return json.load(stream)
+
+    def dump(self, data: Any) -> str:
+        """Dump a single JSON document."""
+        return json.dumps(data, indent=2, sort_keys=True) + "\n"
+
+
+CODECS: dict[DataFormat, Codec] = {DataFormat.YAML: YamlCodec(), DataFormat.JSON: JsonCodec()}
+
+
+def get_codec(data_format: DataFormat | str) -> Codec:
+    """Get the codec of a data format."""
+    return CODECS[DataFormat(data_format)]
@@ -0,0 +1,9 @@
+"""Serialization codecs package."""
+from enum import Enum
+
+
+class DataFormat(str, Enum):
+    """Supported configuration and custom resource formats."""
+
+    YAML = "yaml"
+    JSON = "json"
@@ -0,0 +1,127 @@
+"""Custom resource archive package."""
+import gzip
+import io
+import logging
+import os
+import pathlib
+import tarfile
+import time
+import zipfile
+from enum import Enum
+from types import TracebackType
+from typing import BinaryIO
+
+from intensive_brew.core.custom_resource.utils.constants import ARCHIVE_FILE_MODE
+from intensive_brew.sys_config.config import get_archive_mtime
+
+log = logging.getLogger(__name__)
+
+
+class ArchiveFormat(str, Enum):
+    """Archive formats, named after their file extension."""
+
+    TAR_GZ = "tar.gz"
+    TGZ = "tgz"
+    TAR = "tar"
+    ZIP = "zip"
+
+    @staticmethod
+    def from_path(path: str) -> "ArchiveFormat":
+        """
+        Get the format of an archive from its file name.
+
+        :param path: archive path
+        :return: Archive format
+        :raises ValueError: if the extension isn't one of a supported format
+        """
+        for archive_format in ArchiveFormat:
+            if path.endswith(f".{archive_format.value}"):
+                return archive_format
+        raise ValueError(f"Unsupported archive extension, expected one of {[f'.{value.value}' for value in ArchiveFormat]}: {path}")
+
+
+class CustomResourceArchive:
+    """
+    Reproducible archive of custom resource files.
+
+    Entries are streamed into the archive as they are added, nothing else is written to disk. Every entry records the same
+    modification time, permissions and ownership, and the gzip header records neither a file name nor a timestamp, so
+    adding the same entries in the same order produces a byte-identical archive. The archive is written next to its path
+    and only moved in place once complete.
+    """
+
+    def __init__(self, path: str, mtime: int | None = None) -> None:
+        """
+        Open the archive.
+
+        :param path: archive path, its extension selects the format
+        :param mtime: modification time of the entries, read from the environment when not set
+        """
+        self.path = path
+        self.format = ArchiveFormat.from_path(path)
+        self.mtime = get_archive_mtime() if mtime is None else mtime
+        self.entries = 0
+        self._partial_path = f"{path}.part"
+
+        pathlib.Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._file: BinaryIO = open(self._partial_path, "wb")
+        self._gzip: gzip.GzipFile | None = None
+        self._tar: tarfile.TarFile | None = None
+        self._zip: zipfile.ZipFile | None = None
+        if self.format == ArchiveFormat.ZIP:
+            self._zip = zipfile.ZipFile(self._file, "w", compression=zipfile.ZIP_DEFLATED)
+        else:
+            fileobj: BinaryIO = self._file
+            if self.format in (ArchiveFormat.TAR_GZ, ArchiveFormat.TGZ):
+                self._gzip = gzip.GzipFile(filename="", mode="wb", fileobj=self._file, mtime=self.mtime)
+                fileobj = self._gzip  # type: ignore[assignment]
+            self._tar = tarfile.open(fileobj=fileobj, mode="w|", format=tarfile.PAX_FORMAT)
+
+    def add(self, name: str, content: str) -> None:
+        """
+        Stream a file into the archive.
+
+        :param name: file path inside the archive
+        :param content: file content
+        """
+        data = content.encode()
+        if self._zip is not None:
+            info = zipfile.ZipInfo(name, date_time=time.gmtime(self.mtime)[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = ARCHIVE_FILE_MODE << 16
+            self._zip.writestr(info, data)
+        elif self._tar is not None:
+            tar_info = tarfile.TarInfo(name)
+            tar_info.size = len(data)
+            tar_info.mtime = self.mtime
+            tar_info.mode = ARCHIVE_FILE_MODE
+            self._tar.addfile(tar_info, io.BytesIO(data))
+        self.entries += 1
+
+    def close(self) -> None:
+        """Complete the archive and move it in place."""
+        self._close_streams()
+        os.replace(self._partial_path, self.path)
+        log.info(f"Wrote {self.entries} entries to the archive {self.path}.")
+
+    def abort(self) -> None:
+        """Discard the incomplete archive."""
+        self._close_streams()
+        os.unlink(self._partial_path)
+
+    def _close_streams(self) -> None:
+        """Close the archive streams, innermost first."""
+        for stream in (self._zip, self._tar, self._gzip, self._file):
+            if stream is not None:
+                stream.close()
+
+    def __enter__(self) -> "CustomResourceArchive":
+        """Use the archive in a `with` block, it is completed on exit or discarded if the block fails."""
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None:
+        """Complete or discard the archive."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
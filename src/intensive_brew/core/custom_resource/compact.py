@@ -0,0 +1,160 @@
+"""Main custom resource generation package."""
+from collections.abc import Iterator, Sequence
+from typing import Any, overload
+
+from intensive_brew.core.dto.custom_resource.affinity import Affinity
+from intensive_brew.core.dto.custom_resource.annotations import Annotations
+from intensive_brew.core.dto.custom_resource.labels import Labels
+from intensive_brew.core.dto.custom_resource.locust_test_custom_resource import LocustTest
+from intensive_brew.core.dto.custom_resource.metadata import Metadata
+from intensive_brew.core.dto.custom_resource.spec import Spec
+from intensive_brew.core.dto.custom_resource.toleration import Toleration
+
+
+class CompactCustomResource:
+    """
+    Compact internal representation of a generated custom resource.
+
+    A slotted record holding the same values as a LocustTest, without the per instance `__dict__`, `__fields_set__` and
+    nested Metadata / Spec models of the pydantic representation. Nested configuration models are shared with the test
+    configuration the record was built from. Values are expected to be validated already.
+    """
+
+    # Slots holding Spec fields, named after them
+    SPEC_SLOTS = (
+        "image",
+        "master_command_seed",
+        "worker_command_seed",
+        "worker_replicas",
+        "config_map",
+        "labels",
+        "annotations",
+        "affinity",
+        "tolerations",
+    )
+
+    __slots__ = ("name", "metadata_annotations", *SPEC_SLOTS)
+
+    name: str
+    metadata_annotations: dict[str, str] | None
+    image: str
+    master_command_seed: str
+    worker_command_seed: str
+    worker_replicas: int
+    config_map: str | None
+    labels: Labels | None
+    annotations: Annotations | None
+    affinity: Affinity | None
+    tolerations: list[Toleration] | None
+
+    def __init__(
+        self,
+        name: str,
+        image: str,
+        master_command_seed: str,
+        worker_command_seed: str,
+        worker_replicas: int,
+        config_map: str | None = None,
+        labels: Labels | None = None,
+        annotations: Annotations | None = None,
+        affinity: Affinity | None = None,
+        tolerations: list[Toleration] | None = None,
+        metadata_annotations: dict[str, str] | None = None,
+    ) -> None:
+        """Initialize the record, see the Metadata and Spec fields of the same name."""
+        self.name = name
+        self.metadata_annotations = metadata_annotations
+        self.image = image
+        self.master_command_seed = master_command_seed
+        self.worker_command_seed = worker_command_seed
+        self.worker_replicas = worker_replicas
+        self.config_map = config_map
+        self.labels = labels
+        self.annotations = annotations
+        self.affinity = affinity
+        self.tolerations = tolerations
+
+    def spec_fields(self) -> dict[str, Any]:
+        """Get the Spec fields of the record, keyed by field name."""
+        return {slot: getattr(self, slot) for slot in CompactCustomResource.SPEC_SLOTS}
+
+    def to_locust_test(self) -> LocustTest:
+        """Convert the record to the public LocustTest model, without validating it again."""
+        return LocustTest.construct(
+            metadata=Metadata.construct(name=self.name, annotations=self.metadata_annotations), spec=Spec.construct(**self.spec_fields())
+        )
+
+    @staticmethod
+    def from_locust_test(custom_resource: LocustTest) -> "CompactCustomResource":
+        """Convert a LocustTest model to a record."""
+        return CompactCustomResource.from_models(custom_resource.metadata, custom_resource.spec)
+
+    @staticmethod
+    def from_models(metadata: Metadata, spec: Spec) -> "CompactCustomResource":
+        """Convert the Metadata and Spec models of a custom resource to a record."""
+        return CompactCustomResource(metadata.name, **dict(spec), metadata_annotations=metadata.annotations)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare records by value."""
+        if not isinstance(other, CompactCustomResource):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in CompactCustomResource.__slots__)
+
+    def __repr__(self) -> str:
+        """Represent the record with its values."""
+        return f"CompactCustomResource({', '.join(f'{slot}={getattr(self, slot)!r}' for slot in CompactCustomResource.__slots__)})"
+
+
+class CustomResourceBatch(Sequence[LocustTest]):
+    """
+    Sequence of generated custom resources backed by compact records.
+
+    Items are converted to LocustTest models when they are accessed and aren't kept, iterating over a batch while writing
+    each item keeps a single model alive at a time.
+    """
+
+    def __init__(self, records: list[CompactCustomResource] | None = None) -> None:
+        """
+        Initialize the batch.
+
+        :param records: compact custom resources
+        """
+        self.records = records if records is not None else []
+
+    def __len__(self) -> int:
+        """Get the number of custom resources."""
+        return len(self.records)
+
+    @overload
+    def __getitem__(self, index: int) -> LocustTest:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "CustomResourceBatch":
+        ...
+
+    def __getitem__(self, index: int | slice) -> "LocustTest | CustomResourceBatch":
+        """Get a custom resource, converted to a LocustTest model, or a sub-batch."""
+        if isinstance(index, slice):
+            return CustomResourceBatch(self.records[index])
+        return self.records[index].to_locust_test()
+
+    def __iter__(self) -> Iterator[LocustTest]:
+        """Iterate over the custom resources, converting one record at a time."""
+        for record in self.records:
+            yield record.to_locust_test()
+
+    @property
+    def names(self) -> list[str]:
+        """Get the names of the custom resources, without converting them."""
+        return [record.name for record in self.records]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another batch by records, or with any sequence of LocustTest models by value."""
+        if isinstance(other, CustomResourceBatch):
+            return self.records == other.records
+        if isinstance(other, Sequence):
+            return len(self) == len(other) and all(mine == theirs for mine, theirs in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
@@ -1,24 +1,144 @@
 """Main custom resource generation package."""
-import logging as log
+import logging
+import sys
+from collections.abc import Iterable
 
+from intensive_brew.core.cache.configuration_cache import ConfigurationCache
+from intensive_brew.core.codec.formats import DataFormat
+from intensive_brew.core.custom_resource.archive import CustomResourceArchive
+from intensive_brew.core.custom_resource.incremental import IncrementalGeneration
+from intensive_brew.core.custom_resource.layout import OutputLayout, OutputTree
+from intensive_brew.core.custom_resource.pipeline import Pipeline
+from intensive_brew.core.custom_resource.utils.constants import DEFAULT_PIPELINE_WRITE_WORKERS, STDOUT_OUTPUT
 from intensive_brew.core.custom_resource.utils.helpers import Helpers
-from intensive_brew.core.yaml.validation import Validation
+from intensive_brew.core.dto.yaml.test_config import TestConfig
+from intensive_brew.core.yaml.sources import ConfigurationSources
+
+log = logging.getLogger(__name__)
 
 
 class Generation:
     """Main custom resource generation class."""
 
     @staticmethod
-    def generate(yaml_path: str, output_path: str) -> None:
-        """Generate a LocustTest custom resource from a YAML configuration."""
+    def generate(
+        yaml_path: str | list[str],
+        output_path: str,
+        stream: bool = False,
+        jobs: int = 1,
+        pipeline: bool = False,
+        write_workers: int = DEFAULT_PIPELINE_WRITE_WORKERS,
+        incremental: bool = False,
+        force: bool = False,
+        input_format: DataFormat = DataFormat.YAML,
+        output_format: DataFormat = DataFormat.YAML,
+        cache: ConfigurationCache | None = None,
+        layout: OutputLayout = OutputLayout.FLAT,
+    ) -> None:
+        """
+        Generate a LocustTest custom resource from a YAML configuration.
+
+        The cache of validated configurations is used in batch and incremental modes, the streaming modes always parse the
+        configuration entry by entry. An `output_path` of `-` streams every custom resource to the standard output as
+        soon as it is built.
+
+        `yaml_path` may be a single path or several ones, each path being a file, a directory or a glob pattern. Tests of
+        every file are merged, colliding tests are rejected before they overwrite each other's custom resource.
+
+        Files are placed in the output directory according to `layout`, which doesn't apply to the standard output.
+        """
+        paths = [yaml_path] if isinstance(yaml_path, str) else yaml_path
+
         # Generate internal object mapping
-        log.info(f"Collecting raw configuration from file: '{yaml_path}'")
+        log.info(f"Collecting raw configuration from: {paths}")
+
+        if output_path == STDOUT_OUTPUT:
+            if jobs > 1 or pipeline:
+                log.warning("Custom resources written to the standard output are built one at a time, in configuration order.")
+            if layout != OutputLayout.FLAT:
+                log.warning("The output layout doesn't apply to custom resources written to the standard output.")
+            Generation._generate_to_stdout(paths, input_format, output_format)
+            return
 
-        yaml_configuration = Validation.generate_configuration_object(yaml_path)
+        if incremental:
+            entries: Iterable[tuple[str, TestConfig]]
+            if cache is not None:
+                entries = ConfigurationSources.load(paths, input_format, jobs, cache).configurations.items()
+            else:
+                entries = ConfigurationSources.stream_test_configs(paths, input_format)
+            IncrementalGeneration.generate(entries, output_path, force=force, jobs=jobs, output_format=output_format, layout=layout)
+            return
+
+        # Files are written without being tracked, a manifest left by an incremental run would become stale
+        IncrementalGeneration.invalidate_manifest(output_path)
+
+        if pipeline:
+            if jobs > 1:
+                log.warning("Parallel build is not supported in pipeline mode, use --write-workers to parallelize file writes.")
+            Pipeline(output_path, write_workers=write_workers, output_format=output_format, layout=layout).run(
+                ConfigurationSources.stream_test_configs(paths, input_format)
+            )
+            return
+
+        if stream:
+            if jobs > 1:
+                log.warning("Parallel build is not supported in stream mode, resources are built one at a time.")
+            Generation._generate_streaming(paths, output_path, input_format, output_format, layout)
+            return
+
+        yaml_configuration = ConfigurationSources.load(paths, input_format, jobs, cache)
         log.debug(f"Parsed YAML config:\n{yaml_configuration}")
 
         # Generating Custom Resources for collected configuration
-        cr_list = Helpers.build_custom_resources(yaml_configuration)
+        cr_list = Helpers.build_custom_resource_batch(yaml_configuration, jobs=jobs)
 
         # Write to the output directory.
-        Helpers.write_cr_files(cr_list, output_path)
+        Helpers.write_cr_files(cr_list, output_path, output_format, layout)
+
+    @staticmethod
+    def _generate_streaming(
+        paths: list[str], output_path: str, input_format: DataFormat, output_format: DataFormat, layout: OutputLayout = OutputLayout.FLAT
+    ) -> None:
+        """Build and write each custom resource as soon as its configuration entry is parsed."""
+        # Create output directory if it doesn't exist, nested directories are created as tests reach them
+        tree = OutputTree(output_path, layout)
+        tree.prepare()
+
+        for test_key, test_config in ConfigurationSources.stream_test_configs(paths, input_format):
+            Helpers.write_cr_file(Helpers.build_custom_resource(test_key, test_config), output_path, output_format, tree)
+
+        tree.write_index()
+
+    @staticmethod
+    def generate_archive(
+        yaml_path: str | list[str],
+        archive_path: str,
+        input_format: DataFormat = DataFormat.YAML,
+        output_format: DataFormat = DataFormat.YAML,
+        layout: OutputLayout = OutputLayout.FLAT,
+    ) -> int:
+        """
+        Generate the LocustTest custom resources of a YAML configuration into a single archive.
+
+        Each custom resource is streamed into the archive as soon as it is built, in configuration order, without any file
+        being written besides the archive. Identical configurations produce byte-identical archives.
+
+        :param yaml_path: configuration files, directories or glob patterns
+        :param archive_path: archive path, `.tar.gz`, `.tgz`, `.tar` or `.zip`
+        :param input_format: configuration files format
+        :param output_format: custom resources format
+        :param layout: placement of the files in the archive
+        :return: Number of archived custom resources
+        """
+        paths = [yaml_path] if isinstance(yaml_path, str) else yaml_path
+        log.info(f"Collecting raw configuration from: {paths}")
+
+        entries = ConfigurationSources.stream_test_configs(paths, input_format)
+        with CustomResourceArchive(archive_path) as archive:
+            return Helpers.write_cr_archive(Helpers.iter_custom_resources(entries), archive, output_format, layout)
+
+    @staticmethod
+    def _generate_to_stdout(paths: list[str], input_format: DataFormat, output_format: DataFormat) -> None:
+        """Stream the custom resources to the standard output, one document per test, without any file being written."""
+        entries = ConfigurationSources.stream_test_configs(paths, input_format)
+        Helpers.write_cr_stream(Helpers.iter_custom_resources(entries), sys.stdout, output_format)
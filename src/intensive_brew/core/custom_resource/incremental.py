@@ -0,0 +1,192 @@
+"""Main custom resource generation package."""
+import hashlib
+import logging
+import os
+import pathlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from pydantic import ValidationError
+
+from intensive_brew.core.codec.formats import DataFormat
+from intensive_brew.core.custom_resource.layout import OutputLayout, OutputTree
+from intensive_brew.core.custom_resource.utils.helpers import Helpers
+from intensive_brew.core.dto.manifest.manifest import MANIFEST_VERSION, Manifest, ManifestEntry
+from intensive_brew.core.dto.yaml.configuration import Configuration
+from intensive_brew.core.dto.yaml.test_config import TestConfig
+from intensive_brew.sys_config.config import get_package_version
+
+log = logging.getLogger(__name__)
+
+# Kept without a `.yaml` / `.json` extension so that `kubectl apply -f <output_dir>` ignores it
+MANIFEST_FILE_NAME = ".intensive-brew.manifest"
+
+
+@dataclass
+class IncrementalSummary:
+    """Outcome of an incremental generation run."""
+
+    # Tests whose configuration didn't change, nothing was built
+    skipped: int = 0
+
+    # Tests that were rebuilt but produced the exact same file, which was left untouched
+    unchanged: int = 0
+
+    # Files (re)written
+    written: int = 0
+
+    # Files removed because their test is no longer configured
+    pruned: int = 0
+
+
+class IncrementalGeneration:
+    """
+    Incremental custom resource generation.
+
+    A manifest kept in the output directory maps each test key to a hash of its normalized configuration and of the emitted
+    custom resource. Only new or changed tests are rebuilt, only files whose content changed are rewritten and files of
+    removed tests are pruned. Untouched files keep their modification time.
+    """
+
+    @staticmethod
+    def generate(
+        entries: Iterable[tuple[str, TestConfig]],
+        output_dir: str,
+        force: bool = False,
+        jobs: int = 1,
+        output_format: DataFormat = DataFormat.YAML,
+        layout: OutputLayout = OutputLayout.FLAT,
+    ) -> IncrementalSummary:
+        """
+        Incrementally generate custom resources into the output directory.
+
+        :param entries: (test key, TestConfig) pairs
+        :param output_dir: output directory
+        :param force: rebuild and rewrite every test regardless of the manifest, removed tests are still pruned
+        :param jobs: number of worker processes used to build changed tests
+        :param output_format: custom resources format
+        :param layout: placement of the files in the output directory
+        :return: Run summary
+        """
+        tree = OutputTree(output_dir, layout)
+        tree.prepare()
+        summary = IncrementalSummary()
+        previous = IncrementalGeneration.load_manifest(output_dir)
+        manifest = Manifest(generator_version=get_package_version())
+
+        # Collect tests whose configuration changed since the last run
+        changed: dict[str, TestConfig] = {}
+        config_hashes: dict[str, str] = {}
+        for test_key, test_config in entries:
+            config_hash = IncrementalGeneration.hash_test_config(test_key, test_config, output_format, layout)
+            previous_entry = previous.entries.get(test_key)
+            if (
+                not force
+                and previous_entry is not None
+                and previous_entry.config_hash == config_hash
+                and os.path.isfile(os.path.join(output_dir, previous_entry.file_name))
+            ):
+                log.debug(f"Configuration of test {test_key} is unchanged, skipping.")
+                manifest.entries[test_key] = previous_entry
+                changed.pop(test_key, None)
+                summary.skipped += 1
+            else:
+                changed[test_key] = test_config
+                config_hashes[test_key] = config_hash
+
+        # Build changed tests, configurations are already validated
+        cr_list = Helpers.build_custom_resource_batch(Configuration.construct(configurations=changed), jobs=jobs)
+        tree.prepare(cr_list.names)
+        for test_key, custom_resource in zip(changed, cr_list):
+            config = Helpers.serialize_custom_resource(custom_resource, output_format)
+            cr_hash = hashlib.sha256(config.encode()).hexdigest()
+            # Path relative to the output directory
+            file_name = tree.relative_path(
+                custom_resource.metadata.name, Helpers.cr_file_name(custom_resource.metadata.name, output_format)
+            )
+            previous_entry = previous.entries.get(test_key)
+
+            if (
+                not force
+                and previous_entry is not None
+                and previous_entry.cr_hash == cr_hash
+                and previous_entry.file_name == file_name
+                and os.path.isfile(os.path.join(output_dir, file_name))
+            ):
+                log.debug(f"Custom resource of test {test_key} is unchanged, leaving {file_name} untouched.")
+                summary.unchanged += 1
+            else:
+                Helpers.write_serialized_cr(custom_resource.metadata.name, config, output_dir, output_format, tree)
+                summary.written += 1
+
+            manifest.entries[test_key] = ManifestEntry(config_hash=config_hashes[test_key], cr_hash=cr_hash, file_name=file_name)
+
+        # Prune files that are no longer produced by any test
+        current_files = {entry.file_name for entry in manifest.entries.values()}
+        pruned_directories = set()
+        for test_key, previous_entry in previous.entries.items():
+            if previous_entry.file_name not in current_files:
+                log.info(f"Pruning custom resource of removed test {test_key}: {previous_entry.file_name}.")
+                pathlib.Path(output_dir, previous_entry.file_name).unlink(missing_ok=True)
+                pruned_directories.add(previous_entry.file_name.rpartition("/")[0])
+                summary.pruned += 1
+        tree.remove_empty_directories(pruned_directories)
+
+        # The index lists every test, including the skipped ones
+        manifest.index_files = tree.write_index(sorted(current_files))
+        # Indexes written in a previous layout would still list the pruned files
+        for index_file in sorted(set(previous.index_files) - set(manifest.index_files)):
+            log.info(f"Pruning kustomization index of a previous layout: {index_file}.")
+            pathlib.Path(output_dir, index_file).unlink(missing_ok=True)
+        IncrementalGeneration.save_manifest(manifest, output_dir)
+        log.info(
+            f"Incremental generation: {summary.written} written, {summary.unchanged} unchanged, "
+            f"{summary.skipped} skipped, {summary.pruned} pruned."
+        )
+        return summary
+
+    @staticmethod
+    def hash_test_config(
+        test_key: str, test_config: TestConfig, output_format: DataFormat = DataFormat.YAML, layout: OutputLayout = OutputLayout.FLAT
+    ) -> str:
+        """Hash a normalized test configuration, together with the generator version, format and layout producing its file."""
+        normalized = (
+            f"{get_package_version()}\0{DataFormat(output_format).value}\0{OutputLayout(layout).value}\0"
+            f"{test_key}\0{test_config.json(sort_keys=True)}"
+        )
+        return hashlib.sha256(normalized.encode()).hexdigest()
+
+    @staticmethod
+    def load_manifest(output_dir: str) -> Manifest:
+        """Load the manifest of an output directory, an empty manifest is returned when missing, unreadable or outdated."""
+        manifest_path = pathlib.Path(output_dir, MANIFEST_FILE_NAME)
+        empty_manifest = Manifest(generator_version=get_package_version())
+        if not manifest_path.is_file():
+            return empty_manifest
+
+        try:
+            manifest = Manifest.parse_file(manifest_path)
+        except (OSError, ValueError, ValidationError) as error:
+            log.warning(f"Ignoring unreadable manifest {manifest_path}: {error}")
+            return empty_manifest
+
+        if manifest.version != MANIFEST_VERSION:
+            log.info(f"Ignoring manifest {manifest_path} written with layout version {manifest.version}.")
+            return empty_manifest
+        return manifest
+
+    @staticmethod
+    def save_manifest(manifest: Manifest, output_dir: str) -> None:
+        """Atomically write the manifest of an output directory."""
+        manifest_path = pathlib.Path(output_dir, MANIFEST_FILE_NAME)
+        temporary_path = manifest_path.with_name(f"{MANIFEST_FILE_NAME}.tmp")
+        temporary_path.write_text(manifest.json(indent=2, sort_keys=True))
+        os.replace(temporary_path, manifest_path)
+
+    @staticmethod
+    def invalidate_manifest(output_dir: str) -> None:
+        """Drop the manifest of an output directory that is about to be written without it."""
+        manifest_path = pathlib.Path(output_dir, MANIFEST_FILE_NAME)
+        if manifest_path.is_file():
+            log.debug(f"Invalidating manifest {manifest_path}.")
+            manifest_path.unlink()
@@ -0,0 +1,167 @@
+"""
+Output layout package.
+
+Kept free of heavy dependencies, the CLI imports the layouts to declare its options.
+"""
+import hashlib
+import logging
+import pathlib
+import threading
+from collections import defaultdict
+from collections.abc import Iterable
+from enum import Enum
+
+from intensive_brew.core.custom_resource.utils.constants import KUSTOMIZATION_FILE_NAME, KUSTOMIZATION_TEMPLATE, SHARD_PREFIX_LENGTH
+
+log = logging.getLogger(__name__)
+
+
+class OutputLayout(str, Enum):
+    """Placement of the custom resource files in the output directory."""
+
+    # Every file in the output directory
+    FLAT = "flat"
+
+    # A directory per team, each with a kustomization index
+    TEAM = "team"
+
+    # A directory per hashed prefix of the resource name, spreading files evenly
+    SHARDED = "sharded"
+
+
+class OutputTree:
+    """
+    Custom resource files of an output directory, placed according to a layout.
+
+    Directories are created once, up front when the resource names are known beforehand or on the first file written to
+    them otherwise. The tree is shared by the writer threads of the pipeline.
+    """
+
+    def __init__(self, output_dir: str, layout: OutputLayout = OutputLayout.FLAT) -> None:
+        """
+        Initialize the tree.
+
+        :param output_dir: output directory
+        :param layout: placement of the files
+        """
+        self.output_dir = output_dir
+        self.layout = OutputLayout(layout)
+        # Paths of the files written through the tree, relative to the output directory
+        self.files: list[str] = []
+        self._directories: set[str] = set()
+        self._lock = threading.Lock()
+
+    def directory(self, name: str) -> str:
+        """
+        Get the directory of a custom resource, relative to the output directory.
+
+        :param name: resource name, `<team>.<test>`
+        :return: Directory, empty in the flat layout
+        """
+        if self.layout == OutputLayout.TEAM:
+            return name.split(".", 1)[0]
+        if self.layout == OutputLayout.SHARDED:
+            return hashlib.sha256(name.encode()).hexdigest()[:SHARD_PREFIX_LENGTH]
+        return ""
+
+    def relative_path(self, name: str, file_name: str) -> str:
+        """Get the path of a custom resource file, relative to the output directory."""
+        directory = self.directory(name)
+        return f"{directory}/{file_name}" if directory else file_name
+
+    def prepare(self, names: Iterable[str] = ()) -> None:
+        """
+        Create the output directory, and the directories of the given resources, once.
+
+        :param names: names of the resources about to be written
+        """
+        directories = {""} | {self.directory(name) for name in names}
+        with self._lock:
+            for directory in sorted(directories - self._directories):
+                pathlib.Path(self.output_dir, directory).mkdir(parents=True, exist_ok=True)
+            self._directories |= directories
+
+    def path(self, name: str, file_name: str) -> str:
+        """
+        Get the path of a custom resource file, creating its directory on first use.
+
+        :param name: resource name
+        :param file_name: file name
+        :return: File path
+        """
+        directory = self.directory(name)
+        with self._lock:
+            if directory not in self._directories:
+                pathlib.Path(self.output_dir, directory).mkdir(parents=True, exist_ok=True)
+                self._directories.add(directory)
+        return f"{self.output_dir}/{self.add(name, file_name)}"
+
+    def add(self, name: str, file_name: str) -> str:
+        """
+        Record a custom resource file placed in the tree, without creating anything on disk.
+
+        :param name: resource name
+        :param file_name: file name
+        :return: File path, relative to the output directory
+        """
+        relative_path = self.relative_path(name, file_name)
+        with self._lock:
+            self.files.append(relative_path)
+        return relative_path
+
+    def write_index(self, relative_paths: Iterable[str] | None = None) -> list[str]:
+        """
+        Write the kustomization index of each team directory, and of the output directory listing them.
+
+        :param relative_paths: files to index, relative to the output directory, defaults to the files recorded in the tree
+        :return: Written index files, relative to the output directory
+        """
+        index = self.index(relative_paths)
+        for relative_path, content in index.items():
+            pathlib.Path(self.output_dir, relative_path).write_text(content)
+        if index:
+            log.info(f"Wrote the kustomization index of {len(index) - 1} team directories.")
+        return list(index)
+
+    def index(self, relative_paths: Iterable[str] | None = None) -> dict[str, str]:
+        """
+        Get the kustomization index of each team directory, and of the output directory listing them.
+
+        Only the team layout is indexed.
+
+        :param relative_paths: files to index, relative to the output directory, defaults to the files recorded in the tree
+        :return: Kustomization file contents, keyed by path relative to the output directory, in path order
+        """
+        if self.layout != OutputLayout.TEAM:
+            return {}
+
+        resources: defaultdict[str, list[str]] = defaultdict(list)
+        for relative_path in self.files if relative_paths is None else relative_paths:
+            directory, _, file_name = relative_path.rpartition("/")
+            resources[directory].append(file_name)
+        resources[""] = [directory for directory in resources if directory]
+
+        return {
+            f"{directory}/{KUSTOMIZATION_FILE_NAME}" if directory else KUSTOMIZATION_FILE_NAME: OutputTree._kustomization(file_names)
+            for directory, file_names in sorted(resources.items())
+        }
+
+    def remove_empty_directories(self, directories: Iterable[str]) -> None:
+        """
+        Remove directories left without custom resources, along with their index.
+
+        :param directories: directories, relative to the output directory
+        """
+        for directory in set(directories) - {""}:
+            path = pathlib.Path(self.output_dir, directory)
+            if path.is_dir() and all(entry.name == KUSTOMIZATION_FILE_NAME for entry in path.iterdir()):
+                log.info(f"Removing empty output directory {path}.")
+                (path / KUSTOMIZATION_FILE_NAME).unlink(missing_ok=True)
+                path.rmdir()
+                self._directories.discard(directory)
+
+    @staticmethod
+    def _kustomization(resources: Iterable[str]) -> str:
+        """Get the kustomization index of a directory."""
+        listing = "".join(f"\n  - {resource}" for resource in sorted(resources)) or " []"
+        return KUSTOMIZATION_TEMPLATE.format(resources=listing)
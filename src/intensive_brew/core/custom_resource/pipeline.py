@@ -0,0 +1,229 @@
+"""Main custom resource generation package."""
+import contextvars
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from intensive_brew.core.codec.formats import DataFormat
+from intensive_brew.core.custom_resource.layout import OutputLayout, OutputTree
+from intensive_brew.core.custom_resource.utils.constants import DEFAULT_PIPELINE_QUEUE_SIZE, DEFAULT_PIPELINE_WRITE_WORKERS
+from intensive_brew.core.custom_resource.utils.helpers import Helpers
+from intensive_brew.core.dto.custom_resource.locust_test_custom_resource import LocustTest
+from intensive_brew.core.dto.yaml.test_config import TestConfig
+
+log = logging.getLogger(__name__)
+
+# Marks the end of the items flowing through a stage queue
+_END_OF_STREAM = object()
+
+# Interval at which blocked stages check whether the pipeline was aborted
+_ABORT_POLL_INTERVAL = 0.1
+
+
+class PipelineAborted(Exception):
+    """Raised inside a stage when another stage failed."""
+
+
+@dataclass
+class StageStats:
+    """Counters of a single pipeline stage."""
+
+    name: str
+    processed: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def throughput(self) -> float:
+        """Items processed per second of stage busy time."""
+        return self.processed / self.busy_seconds if self.busy_seconds else 0.0
+
+    def record(self, busy_seconds: float) -> None:
+        """Record a processed item."""
+        with self._lock:
+            self.processed += 1
+            self.busy_seconds += busy_seconds
+
+    def observe_queue_depth(self, depth: int) -> None:
+        """Record the depth of the stage's input queue."""
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+
+
+class Pipeline:
+    """
+    Pipelined custom resource generation engine.
+
+    Parsing, building, serialization and writing run concurrently and are connected through bounded queues, a slow stage
+    applies backpressure on the stages feeding it. File writes are fanned out over a thread pool so that I/O bound writes
+    overlap with the CPU bound build and serialization stages.
+    """
+
+    STAGES = ("parse", "build", "serialize", "write")
+
+    def __init__(
+        self,
+        output_dir: str,
+        queue_size: int = DEFAULT_PIPELINE_QUEUE_SIZE,
+        write_workers: int = DEFAULT_PIPELINE_WRITE_WORKERS,
+        output_format: DataFormat = DataFormat.YAML,
+        layout: OutputLayout = OutputLayout.FLAT,
+    ) -> None:
+        """
+        Initialize the pipeline.
+
+        :param output_dir: directory the custom resources are written to
+        :param queue_size: maximum number of items waiting in front of each stage
+        :param write_workers: number of threads writing files
+        :param output_format: custom resources format
+        :param layout: placement of the files in the output directory
+        """
+        self.output_dir = output_dir
+        self.tree = OutputTree(output_dir, layout)
+        self.output_format = output_format
+        self.write_workers = write_workers
+        self.stats = {stage: StageStats(stage) for stage in self.STAGES}
+        self._queues: dict[str, queue.Queue[Any]] = {stage: queue.Queue(maxsize=queue_size) for stage in self.STAGES[1:]}
+        self._aborted = threading.Event()
+        self._errors: list[Exception] = []
+
+    def queue_depths(self) -> dict[str, int]:
+        """Snapshot of the number of items currently waiting in front of each stage."""
+        return {stage: stage_queue.qsize() for stage, stage_queue in self._queues.items()}
+
+    def run(self, entries: Iterable[tuple[str, TestConfig]]) -> dict[str, StageStats]:
+        """
+        Generate and write a custom resource for each configuration entry.
+
+        :param entries: (test key, TestConfig) pairs, typically streamed from the configuration file
+        :return: Per-stage counters
+        """
+        self.tree.prepare()
+
+        # Stages run in a copy of the caller's context, reporting to its active metrics recorder
+        threads = [
+            threading.Thread(target=self._guard_in_context(), args=(self._parse, entries), name="pipeline-parse"),
+            threading.Thread(
+                target=self._guard_in_context(), args=(self._transform, "build", "serialize", self._build), name="pipeline-build"
+            ),
+            threading.Thread(
+                target=self._guard_in_context(), args=(self._transform, "serialize", "write", self._serialize), name="pipeline-serialize"
+            ),
+        ]
+        for thread in threads:
+            thread.start()
+
+        with ThreadPoolExecutor(max_workers=self.write_workers, thread_name_prefix="pipeline-write") as executor:
+            for _ in range(self.write_workers):
+                executor.submit(self._guard_in_context(), self._write)
+
+        for thread in threads:
+            thread.join()
+
+        if self._errors:
+            raise self._errors[0]
+        self.tree.write_index()
+
+        for stage in self.stats.values():
+            log.info(
+                f"Pipeline stage '{stage.name}': {stage.processed} items, {stage.throughput:.1f} items/s, "
+                f"max queue depth {stage.max_queue_depth}."
+            )
+        return self.stats
+
+    def _guard_in_context(self) -> Callable[..., None]:
+        """Get `_guard` bound to a copy of the current context, each thread needs its own copy."""
+        context = contextvars.copy_context()
+        return lambda *args: context.run(self._guard, *args)
+
+    def _guard(self, stage: Callable[..., None], *args: Any) -> None:
+        """Run a stage, aborting the whole pipeline if it fails."""
+        try:
+            stage(*args)
+        except PipelineAborted:
+            pass
+        except Exception as error:
+            log.error(f"Pipeline stage failed: {error!r}")
+            self._errors.append(error)
+            self._aborted.set()
+
+    def _parse(self, entries: Iterable[tuple[str, TestConfig]]) -> None:
+        """Feed configuration entries into the build stage."""
+        stats = self.stats["parse"]
+        try:
+            iterator = iter(entries)
+            while True:
+                start = time.perf_counter()
+                entry = next(iterator, _END_OF_STREAM)
+                if entry is _END_OF_STREAM:
+                    break
+                stats.record(time.perf_counter() - start)
+                self._put("build", entry)
+        finally:
+            self._put("build", _END_OF_STREAM, abortable=False)
+
+    def _transform(self, stage: str, next_stage: str, function: Callable[[Any], Any]) -> None:
+        """Apply a stage function to each item of its queue and forward the result."""
+        stats = self.stats[stage]
+        try:
+            while (item := self._get(stage)) is not _END_OF_STREAM:
+                start = time.perf_counter()
+                result = function(item)
+                stats.record(time.perf_counter() - start)
+                self._put(next_stage, result)
+        finally:
+            # Every writer thread needs its own end marker
+            for _ in range(self.write_workers if next_stage == "write" else 1):
+                self._put(next_stage, _END_OF_STREAM, abortable=False)
+
+    @staticmethod
+    def _build(entry: tuple[str, TestConfig]) -> LocustTest:
+        """Build stage."""
+        return Helpers.build_custom_resource(*entry)
+
+    def _serialize(self, custom_resource: LocustTest) -> tuple[str, str]:
+        """Serialize stage."""
+        return custom_resource.metadata.name, Helpers.serialize_custom_resource(custom_resource, self.output_format)
+
+    def _write(self) -> None:
+        """Write stage, one instance runs on each writer thread."""
+        stats = self.stats["write"]
+        while (item := self._get("write")) is not _END_OF_STREAM:
+            start = time.perf_counter()
+            name, config = item
+            Helpers.write_serialized_cr(name, config, self.output_dir, self.output_format, self.tree)
+            stats.record(time.perf_counter() - start)
+
+    def _put(self, stage: str, item: Any, abortable: bool = True) -> None:
+        """Put an item in front of a stage, blocking while its queue is full."""
+        stage_queue = self._queues[stage]
+        while True:
+            if abortable and self._aborted.is_set():
+                raise PipelineAborted()
+            try:
+                stage_queue.put(item, timeout=_ABORT_POLL_INTERVAL)
+            except queue.Full:
+                # Downstream stages stopped consuming, drop the item so that shutdown can't dead-lock
+                if not abortable and self._aborted.is_set():
+                    return
+                continue
+            if item is not _END_OF_STREAM:
+                self.stats[stage].observe_queue_depth(stage_queue.qsize())
+            return
+
+    def _get(self, stage: str) -> Any:
+        """Get the next item waiting in front of a stage."""
+        stage_queue = self._queues[stage]
+        while True:
+            if self._aborted.is_set():
+                raise PipelineAborted()
+            try:
+                return stage_queue.get(timeout=_ABORT_POLL_INTERVAL)
+            except queue.Empty:
+                continue
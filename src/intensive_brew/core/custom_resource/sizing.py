@@ -0,0 +1,83 @@
+"""Worker replicas sizing package."""
+import functools
+import logging
+import math
+from dataclasses import dataclass
+
+from intensive_brew.core.custom_resource.utils.constants import (
+    AUTO_WORKER_REPLICAS,
+    WORKER_REPLICAS_ANNOTATION,
+    WORKER_REPLICAS_REASON_ANNOTATION,
+)
+from intensive_brew.core.dto.yaml.test_config import TestConfig
+from intensive_brew.core.dto.yaml.worker_capacity import WorkerCapacity
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SizingDecision:
+    """Worker replica count chosen for a test, along with the reasoning behind it."""
+
+    replicas: int
+    reason: str
+
+    @property
+    def annotations(self) -> dict[str, str]:
+        """Get the annotations recording the decision, built anew for each custom resource as decisions are shared."""
+        return {WORKER_REPLICAS_ANNOTATION: str(self.replicas), WORKER_REPLICAS_REASON_ANNOTATION: self.reason}
+
+
+class WorkerSizing:
+    """
+    Worker replicas sizing.
+
+    With `worker_replicas: auto`, enough workers are requested for each of them to stay within its capacity, both in users
+    simulated and in users spawned per second. The target users and spawn rate are read from the vanilla specs of the test,
+    or from the hints of the `worker_capacity` section when the test has none, e.g. in expert mode.
+    """
+
+    @staticmethod
+    def decide(test_config: TestConfig) -> SizingDecision | None:
+        """
+        Size the workers of a test.
+
+        :param test_config: Test configuration
+        :return: Sizing decision, None when the test doesn't request automatic sizing
+        """
+        if test_config.worker_replicas != AUTO_WORKER_REPLICAS:
+            return None
+
+        capacity = test_config.worker_capacity or WorkerCapacity()
+        vanilla_specs = test_config.vanilla_specs
+        if vanilla_specs is not None and not (test_config.expert_mode and test_config.expert_mode.enabled):
+            users, spawn_rate = vanilla_specs.users, vanilla_specs.spawn_rate
+        else:
+            # Presence of the hints is checked along with the test configuration
+            users, spawn_rate = capacity.users, capacity.spawn_rate or 0  # type: ignore[assignment]
+
+        return WorkerSizing.size(users, spawn_rate, capacity.users_per_worker, capacity.spawn_rate_per_worker)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def size(users: int, spawn_rate: int, users_per_worker: int, spawn_rate_per_worker: int) -> SizingDecision:
+        """
+        Size the workers of a test from its target load and the per worker capacity.
+
+        :param users: target number of users
+        :param spawn_rate: target users spawn rate
+        :param users_per_worker: number of users a single worker simulates
+        :param spawn_rate_per_worker: number of users a single worker spawns per second
+        :return: Sizing decision, cached so that tests sized alike share it
+        """
+        for_users = math.ceil(users / users_per_worker)
+        for_spawn_rate = math.ceil(spawn_rate / spawn_rate_per_worker)
+        replicas = max(for_users, for_spawn_rate, 1)
+
+        reason = (
+            f"users {users} / {users_per_worker} per worker = {for_users}, "
+            f"spawn rate {spawn_rate} / {spawn_rate_per_worker} per worker = {for_spawn_rate}"
+        )
+        log.debug(f"Sized {replicas} worker replicas: {reason}.")
+
+        return SizingDecision(replicas=replicas, reason=reason)
@@ -8,3 +8,41 @@ VANILLA_SPECS_COMMAND_TEMPLATE = "--locustfile {file} --host {host_url} --users
 WORKER_COMMAND_TEMPLATE = CUSTOM_LOAD_SHAPE_COMMAND_TEMPLATE
 
 DEFAULT_CONTAINER_TEST_DIR = "/lotest/src/"
+
+# Number of chunks each worker process receives when building custom resources in parallel, smooths out uneven chunks
+PARALLEL_CHUNKS_PER_JOB = 4
+
+# Maximum number of items waiting in front of each stage of the generation pipeline
+DEFAULT_PIPELINE_QUEUE_SIZE = 64
+
+# Number of threads writing custom resource files in the generation pipeline
+DEFAULT_PIPELINE_WRITE_WORKERS = 8
+
+# Number of seconds between two checks of the configuration file in watch mode, when inotify is not available
+DEFAULT_WATCH_POLL_INTERVAL = 0.5
+
+# Number of seconds watch mode waits for further writes to the configuration file before regenerating
+DEFAULT_WATCH_DEBOUNCE = 0.05
+
+# Output path designating the standard output, custom resources are written to it as a multi-document stream
+STDOUT_OUTPUT = "-"
+
+# Separator written before each YAML document of a multi-document stream
+YAML_DOCUMENT_SEPARATOR = "---\n"
+
+# Value of `worker_replicas` sizing the workers from the target users and spawn rate of the test
+AUTO_WORKER_REPLICAS = "auto"
+
+# Custom resource annotations recording the sized worker replica count and how it was chosen
+WORKER_REPLICAS_ANNOTATION = "intensive-brew/worker-replicas"
+WORKER_REPLICAS_REASON_ANNOTATION = "intensive-brew/worker-replicas-reason"
+
+# Number of hexadecimal digits of the resource name hash naming its directory in the sharded layout, 256 directories
+SHARD_PREFIX_LENGTH = 2
+
+# Kustomization index written to each directory of the team layout, `kubectl apply -k <output_dir>` applies every test
+KUSTOMIZATION_FILE_NAME = "kustomization.yaml"
+KUSTOMIZATION_TEMPLATE = "apiVersion: kustomize.config.k8s.io/v1beta1\nkind: Kustomization\nresources:{resources}\n"
+
+# Permissions of every archive entry
+ARCHIVE_FILE_MODE = 0o644
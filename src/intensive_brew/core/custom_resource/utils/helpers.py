@@ -1,57 +1,162 @@
 """Main custom resource generation package."""
-import logging as log
+import logging
+import math
 import pathlib
 import re
-
-import yaml
-
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Any
+
+from intensive_brew.core.codec.codecs import JsonCodec, YamlCodec, get_codec
+from intensive_brew.core.codec.formats import DataFormat
+from intensive_brew.core.custom_resource.archive import CustomResourceArchive
+from intensive_brew.core.custom_resource.compact import CompactCustomResource, CustomResourceBatch
+from intensive_brew.core.custom_resource.layout import OutputLayout, OutputTree
+from intensive_brew.core.custom_resource.sizing import SizingDecision, WorkerSizing
 from intensive_brew.core.custom_resource.utils.constants import (
     CUSTOM_LOAD_SHAPE_COMMAND_TEMPLATE,
     DEFAULT_CONTAINER_TEST_DIR,
+    PARALLEL_CHUNKS_PER_JOB,
     VANILLA_SPECS_COMMAND_TEMPLATE,
     WORKER_COMMAND_TEMPLATE,
+    YAML_DOCUMENT_SEPARATOR,
 )
+from intensive_brew.core.custom_resource.utils.serializer import CustomResourceSerializer
 from intensive_brew.core.dto.custom_resource.locust_test_custom_resource import LocustTest
 from intensive_brew.core.dto.custom_resource.metadata import Metadata
 from intensive_brew.core.dto.custom_resource.spec import Spec
 from intensive_brew.core.dto.yaml.configuration import Configuration
 from intensive_brew.core.dto.yaml.test_config import TestConfig
+from intensive_brew.core.metrics.recorder import record_output, record_test, span
+from intensive_brew.sys_config.config import get_output_validation
+
+log = logging.getLogger(__name__)
 
 
 class Helpers:
     """Generation helpers class."""
 
     @staticmethod
-    def build_custom_resources(configuration: Configuration) -> list[LocustTest]:
+    def build_custom_resources(configuration: Configuration, jobs: int = 1) -> list[LocustTest]:
         """
         Build a list of LocustTest objects.
 
         Generate a list of LocustTest objects based on the passed configuration.
         :param configuration: tests configurations
+        :param jobs: number of worker processes, resources are built in-process when set to 1
         :return: List of Custom Resource objects
         """
+        return list(Helpers.build_custom_resource_batch(configuration, jobs=jobs))
+
+    @staticmethod
+    def build_custom_resource_batch(configuration: Configuration, jobs: int = 1) -> CustomResourceBatch:
+        """
+        Build a batch of custom resources.
+
+        Same as `build_custom_resources`, but resources are kept as compact records and only converted to LocustTest objects
+        as they are accessed, which keeps the memory footprint of large configurations low.
+        :param configuration: tests configurations
+        :param jobs: number of worker processes, resources are built in-process when set to 1
+        :return: Batch of Custom Resource objects
+        """
         log.info("Generating Custom Resources for collected configuration.")
 
-        # Init return list
-        cr_list = []
+        if jobs > 1 and len(configuration.configurations) > 1:
+            return Helpers._build_custom_resources_in_parallel(configuration, jobs)
+
+        return CustomResourceBatch(Helpers._build_chunk(configuration.configurations.items()))
+
+    @staticmethod
+    def iter_custom_resources(entries: Iterable[tuple[str, TestConfig]]) -> Iterator[LocustTest]:
+        """
+        Build LocustTest objects lazily.
+
+        Generator form of `build_custom_resources`, each custom resource is built when requested so that it can be written
+        before the next configuration entry is even parsed.
+        :param entries: (test key, test configuration) pairs
+        :return: Iterator of Custom Resource objects
+        """
+        trusted = not get_output_validation()
+        for test_key, test_config in entries:
+            yield Helpers.build_custom_resource(test_key, test_config, trusted)
+
+    @staticmethod
+    def _build_custom_resources_in_parallel(configuration: Configuration, jobs: int) -> CustomResourceBatch:
+        """
+        Build a batch of custom resources across a process pool.
+
+        Configuration entries are split into ordered chunks, results are collected back in the original configuration order.
+        :param configuration: tests configurations
+        :param jobs: number of worker processes
+        :return: Batch of Custom Resource objects
+        """
+        entries = list(configuration.configurations.items())
+        chunk_size = math.ceil(len(entries) / (jobs * PARALLEL_CHUNKS_PER_JOB))
+        chunks = [entries[index : index + chunk_size] for index in range(0, len(entries), chunk_size)]
+        log.info(f"Building {len(entries)} Custom Resources in {len(chunks)} chunks across {jobs} processes.")
 
-        for test_key, test_config in configuration.configurations.items():
-            # Generate `metadata` as defined in the CRD
-            resource_metadata = Helpers._generate_cr_metadata(test_key, test_config)
+        # Worker processes don't report to the recorder, only the overall build time is recorded
+        with span("build"), ProcessPoolExecutor(max_workers=jobs) as executor:
+            return CustomResourceBatch([record for chunk in executor.map(Helpers._build_chunk, chunks) for record in chunk])
 
-            # Generate resource `spec` block as defined in the CRD
-            resource_spec = Helpers._generate_cr_spec(test_config)
+    @staticmethod
+    def _build_chunk(entries: Iterable[tuple[str, TestConfig]]) -> list[CompactCustomResource]:
+        """Build the compact custom resources of a chunk of configuration entries."""
+        trusted = not get_output_validation()
+        return [Helpers.build_compact_custom_resource(test_key, test_config, trusted) for test_key, test_config in entries]
 
-            # Generate CR
-            custom_resource = LocustTest(metadata=resource_metadata, spec=resource_spec)
+    @staticmethod
+    def build_custom_resource(test_key: str, test_config: TestConfig, trusted: bool | None = None) -> LocustTest:
+        """
+        Build a single LocustTest object.
+
+        The test configuration is already validated, so the custom resource models are constructed without being validated
+        again, unless output validation is turned on for debugging with `INTENSIVE_BREW_VALIDATE_OUTPUT`.
 
-            log.info(f"Generated Custom resource for test: {test_key}.")
-            log.debug(f"Custom resource: {custom_resource}")
+        :param test_key: Team name
+        :param test_config: Test configuration
+        :param trusted: skip output validation, read from the environment when not set
+        :return: Custom Resource object
+        """
+        return Helpers.build_compact_custom_resource(test_key, test_config, trusted).to_locust_test()
 
-            # Append CR to CR return list
-            cr_list.append(custom_resource)
+    @staticmethod
+    def build_compact_custom_resource(test_key: str, test_config: TestConfig, trusted: bool | None = None) -> CompactCustomResource:
+        """
+        Build a single custom resource as a compact record.
 
-        return cr_list
+        :param test_key: Team name
+        :param test_config: Test configuration
+        :param trusted: skip output validation, read from the environment when not set
+        :return: Compact Custom Resource
+        """
+        if trusted is None:
+            trusted = not get_output_validation()
+        with span("build") as build_span:
+            name = Helpers.cr_name(test_key, test_config.entry_point)  # type: ignore[arg-type]
+            # Decided once, both the annotations and the replica count are derived from it
+            decision = WorkerSizing.decide(test_config)
+            annotations = Helpers._generate_cr_annotations(decision)
+            spec_fields = Helpers._generate_cr_spec_fields(test_config, decision)
+
+            # Both are optional in the configuration but required in the spec, only validation reports them missing
+            if trusted and spec_fields["image"] is not None and spec_fields["worker_replicas"] is not None:
+                record = CompactCustomResource(name, **spec_fields, metadata_annotations=annotations)
+            else:
+                # Built from the validated models, the record holds the values that were checked
+                record = CompactCustomResource.from_models(
+                    Metadata(name=name, annotations=annotations), Helpers._validated_spec(spec_fields)
+                )
+
+        if build_span is not None:
+            record_test(name, build_span.wall_seconds)
+
+        log.info(f"Generated Custom resource for test: {test_key}.")
+        if log.isEnabledFor(logging.DEBUG):
+            # The representation of the whole resource costs more than building it
+            log.debug(f"Custom resource: {record}")
+
+        return record
 
     @staticmethod
     def _generate_cr_metadata(test_key: str, test_config: TestConfig) -> Metadata:
@@ -64,11 +169,33 @@ class Helpers:
         :param test_config: Team Configuration
         :return: Metadata object
         """
+        name = Helpers.cr_name(test_key, test_config.entry_point)  # type: ignore[arg-type]
+        return Metadata(name=name, annotations=Helpers._generate_cr_annotations(WorkerSizing.decide(test_config)))
+
+    @staticmethod
+    def _generate_cr_annotations(decision: SizingDecision | None) -> dict[str, str] | None:
+        """
+        Generate the annotations of a custom resource.
+
+        :param decision: Worker sizing decision of the test
+        :return: Worker sizing annotations, None when workers aren't sized automatically
+        """
+        return decision.annotations if decision is not None else None
+
+    @staticmethod
+    def cr_name(test_key: str, entry_point: str) -> str:
+        """
+        Generate the name of a custom resource.
+
+        :param test_key: Team name
+        :param entry_point: Test entry point
+        :return: Resource name
+        """
         # Operations performed:
         # .split('/')[-1]       >> Split the string on path separator "/" and capture the file name
         # .replace('.py', '')   >> Remove ".py" from the file name
         # .replace("_", "-")    >> Replace any underscore with a '-'
-        test_name = test_config.entry_point.split("/")[-1].replace(".py", "").replace("_", "-")  # type: ignore[union-attr]
+        test_name = entry_point.split("/")[-1].replace(".py", "").replace("_", "-")
 
         # Detect camel case word boundary start and replace it with a '-'.
         # Examples:
@@ -81,10 +208,10 @@ class Helpers:
         #   - ACame>l5<Case
         test_name = re.sub(r"([a-z\d])([A-Z])", r"\1-\2", test_name)
 
-        log.debug(f"Generated test name from the original {test_config.entry_point}, is: {test_name}")
+        log.debug(f"Generated test name from the original {entry_point}, is: {test_name}")
 
         # Resource name matching CRD required pattern: <teamName>.<testName>
-        return Metadata(name=f"{test_key.lower()}.{test_name}")
+        return f"{test_key.lower()}.{test_name}"
 
     @staticmethod
     def _generate_cr_spec(test_config: TestConfig) -> Spec:
@@ -96,6 +223,17 @@ class Helpers:
         :param test_config: Test Configuration
         :return: Spec object
         """
+        return Helpers._validated_spec(Helpers._generate_cr_spec_fields(test_config, WorkerSizing.decide(test_config)))
+
+    @staticmethod
+    def _generate_cr_spec_fields(test_config: TestConfig, decision: SizingDecision | None) -> dict[str, Any]:
+        """
+        Generate the fields of a custom resource spec.
+
+        :param test_config: Test Configuration
+        :param decision: Worker sizing decision of the test
+        :return: Spec fields, keyed by field name
+        """
         # Image
         image = test_config.image
 
@@ -104,7 +242,7 @@ class Helpers:
         worker_command_seed = Helpers._generate_worker_command_seed(test_config)
 
         # Workers replica count
-        worker_replicas = test_config.worker_replicas
+        worker_replicas = decision.replicas if decision is not None else test_config.worker_replicas
 
         # Config map
         config_map = test_config.configmap
@@ -121,17 +259,22 @@ class Helpers:
         # Taint tolerations
         tolerations = test_config.tolerations
 
-        return Spec(
-            image=image,  # type: ignore[arg-type]
-            masterCommandSeed=master_command_seed,
-            workerCommandSeed=worker_command_seed,
-            workerReplicas=worker_replicas,  # type: ignore[arg-type]
-            configMap=config_map,
-            annotations=annotations,
-            labels=labels,
-            affinity=affinity,
-            tolerations=tolerations,
-        )
+        return {
+            "image": image,
+            "master_command_seed": master_command_seed,
+            "worker_command_seed": worker_command_seed,
+            "worker_replicas": worker_replicas,
+            "config_map": config_map,
+            "annotations": annotations,
+            "labels": labels,
+            "affinity": affinity,
+            "tolerations": tolerations,
+        }
+
+    @staticmethod
+    def _validated_spec(spec_fields: dict[str, Any]) -> Spec:
+        """Validate spec fields, keyed by field name."""
+        return Spec(**{Spec.__fields__[name].alias: value for name, value in spec_fields.items()})
 
     @staticmethod
     def _generate_master_command_seed(test_config: TestConfig) -> str:
@@ -199,22 +342,122 @@ class Helpers:
         return command_seed
 
     @staticmethod
-    def write_cr_files(cr_list: list[LocustTest], output_dir: str) -> None:
-        """Write a collection of yaml files to the desired output directory."""
-        # Create output directory if it doesn't exist
-        Helpers._check_or_create_output_dir(output_dir)
+    def write_cr_files(
+        cr_list: Iterable[LocustTest],
+        output_dir: str,
+        output_format: DataFormat = DataFormat.YAML,
+        layout: OutputLayout = OutputLayout.FLAT,
+    ) -> None:
+        """Write a collection of yaml files to the desired output directory, placed according to the layout."""
+        tree = OutputTree(output_dir, layout)
+
+        # Create output directories, all at once when the names are known without converting the resources
+        tree.prepare(cr_list.names if isinstance(cr_list, CustomResourceBatch) else ())
 
         # Loop over the provided custom resource list
         for custom_resource in cr_list:
-            complete_file_path = f"{output_dir}/{custom_resource.metadata.name}.yaml"
-            config = yaml.dump(custom_resource.dict(by_alias=True, exclude_none=True))
-            log.info(f"Writing configuration for test:{custom_resource.metadata.name} at {complete_file_path}.")
-            log.debug(f"Configuration \n{config}")
-
-            # Write to CR file
-            with open(complete_file_path, "w") as cr_file:
-                # Writing data to a file
-                cr_file.write(config)
+            Helpers.write_cr_file(custom_resource, output_dir, output_format, tree)
+
+        tree.write_index()
+
+    @staticmethod
+    def write_cr_file(
+        custom_resource: LocustTest, output_dir: str, output_format: DataFormat = DataFormat.YAML, tree: OutputTree | None = None
+    ) -> None:
+        """Write a single custom resource file into an existing output directory, or into its place in the output tree."""
+        config = Helpers.serialize_custom_resource(custom_resource, output_format)
+        Helpers.write_serialized_cr(custom_resource.metadata.name, config, output_dir, output_format, tree)
+
+    @staticmethod
+    def serialize_custom_resource(custom_resource: LocustTest, output_format: DataFormat = DataFormat.YAML) -> str:
+        """Serialize a custom resource to its yaml (or json) representation."""
+        codec = get_codec(output_format)
+        with span("serialize"):
+            if isinstance(codec, YamlCodec):
+                # Emitted straight from the models, skipping the `.dict()` deep copy
+                return CustomResourceSerializer.dump(custom_resource, codec.dumper)
+
+            if isinstance(codec, JsonCodec):
+                return CustomResourceSerializer.dump_json(custom_resource)
+
+            return codec.dump(custom_resource.dict(by_alias=True, exclude_none=True))
+
+    @staticmethod
+    def cr_file_name(name: str, output_format: DataFormat = DataFormat.YAML) -> str:
+        """Get the file name of a custom resource, relative to the output directory."""
+        return f"{name}.{get_codec(output_format).extension}"
+
+    @staticmethod
+    def write_serialized_cr(
+        name: str, config: str, output_dir: str, output_format: DataFormat = DataFormat.YAML, tree: OutputTree | None = None
+    ) -> None:
+        """Write an already serialized custom resource into an existing output directory, or into its place in the output tree."""
+        file_name = Helpers.cr_file_name(name, output_format)
+        complete_file_path = tree.path(name, file_name) if tree is not None else f"{output_dir}/{file_name}"
+        log.info(f"Writing configuration for test:{name} at {complete_file_path}.")
+        log.debug(f"Configuration \n{config}")
+
+        # Write to CR file
+        with span("write"), open(complete_file_path, "w") as cr_file:
+            # Writing data to a file
+            cr_file.write(config)
+        record_output(name, config)
+
+    @staticmethod
+    def write_cr_stream(custom_resources: Iterable[LocustTest], stream: IO[str], output_format: DataFormat = DataFormat.YAML) -> int:
+        """
+        Write custom resources as a single multi-document stream, e.g. to pipe them into `kubectl apply -f -`.
+
+        YAML documents are separated by `---`, JSON documents are concatenated. The stream is flushed after each document.
+        :param custom_resources: custom resources, consumed one at a time
+        :param stream: text stream to write to
+        :param output_format: documents format
+        :return: Number of written documents
+        """
+        separator = YAML_DOCUMENT_SEPARATOR if DataFormat(output_format) == DataFormat.YAML else ""
+        count = 0
+        for custom_resource in custom_resources:
+            config = Helpers.serialize_custom_resource(custom_resource, output_format)
+            with span("write"):
+                stream.write(separator + config)
+                stream.flush()
+            record_output(custom_resource.metadata.name, config)
+            count += 1
+
+        log.info(f"Wrote {count} custom resources to the output stream.")
+        return count
+
+    @staticmethod
+    def write_cr_archive(
+        custom_resources: Iterable[LocustTest],
+        archive: CustomResourceArchive,
+        output_format: DataFormat = DataFormat.YAML,
+        layout: OutputLayout = OutputLayout.FLAT,
+    ) -> int:
+        """
+        Stream custom resources into an archive, placed according to the layout, followed by the layout index.
+
+        :param custom_resources: custom resources, consumed one at a time
+        :param archive: archive to write to
+        :param output_format: files format
+        :param layout: placement of the files in the archive
+        :return: Number of written custom resources
+        """
+        tree = OutputTree("", layout)
+        count = 0
+        for custom_resource in custom_resources:
+            name = custom_resource.metadata.name
+            config = Helpers.serialize_custom_resource(custom_resource, output_format)
+            with span("write"):
+                archive.add(tree.add(name, Helpers.cr_file_name(name, output_format)), config)
+            record_output(name, config)
+            count += 1
+
+        for relative_path, content in tree.index().items():
+            archive.add(relative_path, content)
+
+        log.info(f"Wrote {count} custom resources to the archive.")
+        return count
 
     @staticmethod
     def _check_or_create_output_dir(output_dir: str) -> None:
@@ -0,0 +1,248 @@
+"""Main custom resource generation package."""
+import functools
+import json
+import threading
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import yaml
+from pydantic import BaseModel
+from yaml.events import (
+    DocumentEndEvent,
+    DocumentStartEvent,
+    Event,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+    StreamEndEvent,
+    StreamStartEvent,
+)
+from yaml.nodes import ScalarNode
+from yaml.resolver import Resolver
+
+from intensive_brew.core.dto.custom_resource.locust_test_custom_resource import LocustTest
+from intensive_brew.core.dto.custom_resource.spec import Spec
+
+STR_TAG = "tag:yaml.org,2002:str"
+INT_TAG = "tag:yaml.org,2002:int"
+BOOL_TAG = "tag:yaml.org,2002:bool"
+MAP_TAG = "tag:yaml.org,2002:map"
+SEQ_TAG = "tag:yaml.org,2002:seq"
+
+# Implicit resolvers are class level, resolving scalars doesn't depend on any instance state
+_RESOLVER = Resolver()
+
+# Spec fields holding blocks usually shared between tests, their serialized fragment is rendered once per block instance
+FRAGMENT_FIELDS = ("affinity", "annotations", "labels", "tolerations")
+
+# Maximum number of cached fragments, the cache is reset beyond it
+DEFAULT_FRAGMENT_CACHE_MAX_ENTRIES = 4096
+
+
+class FragmentCache:
+    """
+    Cache of serialized configuration blocks.
+
+    Fragments are keyed by block instance, interned blocks shared by many tests are only serialized once. The block is kept
+    referenced along with its fragment, so that its identity can't be reused by another object while it's cached.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_FRAGMENT_CACHE_MAX_ENTRIES) -> None:
+        """
+        Initialize an empty cache.
+
+        :param max_entries: maximum number of cached fragments
+        """
+        self.max_entries = max_entries
+        self.misses = 0
+        self._fragments: dict[tuple[int, str], tuple[Any, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, value: Any, key: str, render: Callable[[], str]) -> str:
+        """
+        Get the fragment of a block, rendering it on a miss.
+
+        :param value: block
+        :param key: fragment flavour, e.g. format and field alias
+        :param render: function rendering the fragment
+        :return: Fragment
+        """
+        cache_key = (id(value), key)
+        cached = self._fragments.get(cache_key)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+
+        fragment = render()
+        with self._lock:
+            self.misses += 1
+            if len(self._fragments) >= self.max_entries:
+                self._fragments.clear()
+            self._fragments[cache_key] = (value, fragment)
+        return fragment
+
+    def clear(self) -> None:
+        """Forget every fragment."""
+        with self._lock:
+            self._fragments.clear()
+
+
+FRAGMENTS = FragmentCache()
+
+
+class CustomResourceSerializer:
+    """
+    Direct LocustTest serializer.
+
+    Walks the custom resource models and feeds the matching YAML events straight to the emitter. Unlike
+    `yaml.dump(custom_resource.dict(by_alias=True, exclude_none=True))` no intermediate dict tree nor representation node
+    graph is allocated, while the emitted document is byte for byte the same.
+    """
+
+    @staticmethod
+    def dump(custom_resource: LocustTest, dumper: type[Any] = yaml.SafeDumper) -> str:
+        """
+        Serialize a custom resource to YAML.
+
+        :param custom_resource: custom resource to serialize
+        :param dumper: PyYAML dumper class providing the emitter
+        :return: YAML document
+        """
+        fragments: list[tuple[str, Any]] = []
+        document: str = yaml.emit(CustomResourceSerializer._document_events(custom_resource, fragments), Dumper=dumper)
+
+        # Blocks were emitted as placeholders, each one is replaced by the cached fragment emitted at the same position
+        for index, (alias, value) in enumerate(fragments):
+            render = functools.partial(CustomResourceSerializer._yaml_fragment, alias, value, dumper)
+            fragment = FRAGMENTS.get(value, f"yaml:{dumper.__name__}:{alias}", render)
+            document = document.replace(f": {_placeholder(index)}\n", f":{fragment}", 1)
+        return document
+
+    @staticmethod
+    def dump_json(custom_resource: LocustTest) -> str:
+        """
+        Serialize a custom resource to JSON, as `JsonCodec` dumps it.
+
+        :param custom_resource: custom resource to serialize
+        :return: JSON document
+        """
+        data = custom_resource.dict(by_alias=True, exclude_none=True, exclude={"spec": set(FRAGMENT_FIELDS)})
+        fragments: list[tuple[str, Any]] = []
+        for field_name in FRAGMENT_FIELDS:
+            value = getattr(custom_resource.spec, field_name)
+            if value is not None:
+                alias = Spec.__fields__[field_name].alias
+                data["spec"][alias] = _placeholder(len(fragments))
+                fragments.append((alias, value))
+
+        document = json.dumps(data, indent=2, sort_keys=True) + "\n"
+        for index, (alias, value) in enumerate(fragments):
+            fragment = FRAGMENTS.get(value, f"json:{alias}", functools.partial(CustomResourceSerializer._json_fragment, value))
+            document = document.replace(f'"{_placeholder(index)}"', fragment, 1)
+        return document
+
+    @staticmethod
+    def _yaml_fragment(alias: str, value: Any, dumper: type[Any]) -> str:
+        """Emit a spec block at its position in the document, returning the text following its key."""
+        events = [
+            StreamStartEvent(encoding=None),
+            DocumentStartEvent(explicit=None, version=None, tags=None),
+            MappingStartEvent(anchor=None, tag=MAP_TAG, implicit=True, flow_style=False),
+            _scalar("spec"),
+            MappingStartEvent(anchor=None, tag=MAP_TAG, implicit=True, flow_style=False),
+            _scalar(alias),
+            *CustomResourceSerializer._value_events(value),
+            MappingEndEvent(),
+            MappingEndEvent(),
+            DocumentEndEvent(explicit=None),
+            StreamEndEvent(),
+        ]
+        text: str = yaml.emit(events, Dumper=dumper)
+        prefix = f"spec:\n  {alias}:"
+        if not text.startswith(prefix):
+            raise ValueError(f"Unexpected fragment layout for spec field '{alias}'.")
+        return text[len(prefix) :]
+
+    @staticmethod
+    def _json_fragment(value: Any) -> str:
+        """Dump a spec block, indented at its depth in the document."""
+        data = (
+            [item.dict(by_alias=True, exclude_none=True) for item in value]
+            if isinstance(value, list)
+            else value.dict(by_alias=True, exclude_none=True)
+        )
+        return json.dumps(data, indent=2, sort_keys=True).replace("\n", "\n    ")
+
+    @staticmethod
+    def _document_events(custom_resource: LocustTest, fragments: list[tuple[str, Any]]) -> Iterator[Event]:
+        """Generate the YAML events of the custom resource document, spec blocks are replaced by placeholders."""
+        yield StreamStartEvent(encoding=None)
+        yield DocumentStartEvent(explicit=None, version=None, tags=None)
+        yield from CustomResourceSerializer._model_events(custom_resource, fragments)
+        yield DocumentEndEvent(explicit=None)
+        yield StreamEndEvent()
+
+    @staticmethod
+    def _model_events(model: BaseModel, fragments: list[tuple[str, Any]] | None = None) -> Iterator[Event]:
+        """
+        Generate the events of a model, as dumped by alias with `None` values pruned.
+
+        When a fragments list is given, spec blocks are emitted as placeholder scalars and collected in the list instead.
+        """
+        yield MappingStartEvent(anchor=None, tag=MAP_TAG, implicit=True, flow_style=False)
+        for alias, field_name in _sorted_fields(type(model)):
+            value = getattr(model, field_name)
+            if value is not None:
+                yield _scalar(alias)
+                if fragments is not None and isinstance(model, Spec) and field_name in FRAGMENT_FIELDS:
+                    yield _scalar(_placeholder(len(fragments)))
+                    fragments.append((alias, value))
+                elif isinstance(value, BaseModel):
+                    yield from CustomResourceSerializer._model_events(value, fragments)
+                else:
+                    yield from CustomResourceSerializer._value_events(value)
+        yield MappingEndEvent()
+
+    @staticmethod
+    def _value_events(value: Any) -> Iterator[Event]:
+        """Generate the events of a field value."""
+        if isinstance(value, str):
+            yield _scalar(value)
+        elif isinstance(value, bool):
+            yield ScalarEvent(anchor=None, tag=BOOL_TAG, implicit=(True, False), value="true" if value else "false")
+        elif isinstance(value, int):
+            yield ScalarEvent(anchor=None, tag=INT_TAG, implicit=(True, False), value=str(value))
+        elif isinstance(value, BaseModel):
+            yield from CustomResourceSerializer._model_events(value)
+        elif isinstance(value, dict):
+            yield MappingStartEvent(anchor=None, tag=MAP_TAG, implicit=True, flow_style=False)
+            for key in sorted(value):
+                yield _scalar(key)
+                yield from CustomResourceSerializer._value_events(value[key])
+            yield MappingEndEvent()
+        elif isinstance(value, list):
+            yield SequenceStartEvent(anchor=None, tag=SEQ_TAG, implicit=True, flow_style=False)
+            for item in value:
+                yield from CustomResourceSerializer._value_events(item)
+            yield SequenceEndEvent()
+        else:
+            raise TypeError(f"Unsupported custom resource value type: {type(value).__name__}")
+
+
+@functools.lru_cache(maxsize=None)
+def _sorted_fields(model_class: type[BaseModel]) -> tuple[tuple[str, str], ...]:
+    """Get the (alias, field name) pairs of a model, in the order `yaml.dump` emits them."""
+    return tuple(sorted((field.alias, field_name) for field_name, field in model_class.__fields__.items()))
+
+
+@functools.lru_cache(maxsize=4096)
+def _scalar(value: str) -> ScalarEvent:
+    """Get the event of a string scalar, quoted by the emitter whenever it would otherwise resolve to another type."""
+    implicit = (_RESOLVER.resolve(ScalarNode, value, (True, False)) == STR_TAG, True)  # type: ignore[no-untyped-call]
+    return ScalarEvent(anchor=None, tag=STR_TAG, implicit=implicit, value=value)
+
+
+def _placeholder(index: int) -> str:
+    """Get the placeholder of the n-th fragment of a document."""
+    return f"__intensive_brew_fragment_{index}__"
@@ -0,0 +1,310 @@
+"""Main custom resource generation package."""
+import ctypes
+import ctypes.util
+import logging
+import os
+import pathlib
+import select
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+from intensive_brew.core.codec.formats import DataFormat
+from intensive_brew.core.custom_resource.incremental import IncrementalGeneration
+from intensive_brew.core.custom_resource.layout import OutputLayout, OutputTree
+from intensive_brew.core.custom_resource.utils.constants import DEFAULT_WATCH_DEBOUNCE, DEFAULT_WATCH_POLL_INTERVAL
+from intensive_brew.core.custom_resource.utils.helpers import Helpers
+from intensive_brew.core.dto.yaml.test_config import TestConfig
+from intensive_brew.core.yaml.sources import GLOB_CHARACTERS, ConfigurationSources
+
+log = logging.getLogger(__name__)
+
+# inotify event masks, see `man 7 inotify`
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+# struct inotify_event {int wd; uint32_t mask; uint32_t cookie; uint32_t len; char name[];}
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class FileWatcher(ABC):
+    """Waits for changes of the watched configuration files."""
+
+    @abstractmethod
+    def wait_for_change(self, timeout: float) -> bool:
+        """
+        Block until a watched file changes.
+
+        :param timeout: maximum number of seconds to wait
+        :return: whether the file changed
+        """
+
+    def close(self) -> None:
+        """Release the watcher resources."""
+
+
+class PollingFileWatcher(FileWatcher):
+    """
+    File watcher comparing the `stat` signature of the configuration files at a fixed interval.
+
+    Paths are expanded again on every check, so that files added to a watched directory, or newly matching a watched glob
+    pattern, are detected as well.
+    """
+
+    def __init__(
+        self, paths: str | list[str], poll_interval: float = DEFAULT_WATCH_POLL_INTERVAL, input_format: DataFormat = DataFormat.YAML
+    ) -> None:
+        """
+        Initialize the watcher.
+
+        :param paths: watched files, directories or glob patterns
+        :param poll_interval: number of seconds between two checks
+        :param input_format: configuration files format, selects the files watched in directories
+        """
+        self.paths = [paths] if isinstance(paths, str) else paths
+        self.poll_interval = poll_interval
+        self.input_format = input_format
+        self._signature = self._stat()
+
+    def _stat(self) -> dict[str, tuple[int, int, int] | None]:
+        """Get the signature of every configuration file, `None` for the files that don't exist."""
+        try:
+            files = ConfigurationSources.expand(self.paths, self.input_format)
+        except FileNotFoundError:
+            return {}
+
+        signature: dict[str, tuple[int, int, int] | None] = {}
+        for file in files:
+            try:
+                stat = os.stat(file)
+            except FileNotFoundError:
+                signature[file] = None
+                continue
+            signature[file] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        return signature
+
+    def wait_for_change(self, timeout: float) -> bool:
+        """Poll the files until their signature changes."""
+        deadline = time.monotonic() + timeout
+        while True:
+            signature = self._stat()
+            if signature != self._signature:
+                self._signature = signature
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(self.poll_interval, remaining))
+
+
+class InotifyFileWatcher(FileWatcher):
+    """
+    Linux inotify based file watcher.
+
+    The parent directory is watched so that editors replacing the file through a rename are detected as well.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        """
+        Initialize the watcher.
+
+        :param file_path: watched file path
+        :raises OSError: when inotify is not available
+        """
+        self.file_path = os.path.abspath(file_path)
+        library = ctypes.util.find_library("c")
+        if library is None:
+            raise OSError("The C library could not be located.")
+        libc = ctypes.CDLL(library, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not supported on this platform.")
+
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed.")
+
+        directory, self._file_name = os.path.split(self.file_path)
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f"inotify_add_watch failed for {directory}.")
+
+    def wait_for_change(self, timeout: float) -> bool:
+        """Wait for an inotify event concerning the watched file."""
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            readable, _, _ = select.select([self._fd], [], [], remaining)
+            if readable and self._file_name in self._read_event_names():
+                return True
+        return False
+
+    def _read_event_names(self) -> set[str]:
+        """Read all pending events and collect the names of the files they concern."""
+        names: set[str] = set()
+        try:
+            buffer = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return names
+
+        offset = 0
+        while offset < len(buffer):
+            _, _, _, name_length = _INOTIFY_EVENT.unpack_from(buffer, offset)
+            offset += _INOTIFY_EVENT.size
+            names.add(os.fsdecode(buffer[offset : offset + name_length].rstrip(b"\0")))
+            offset += name_length
+        return names
+
+    def close(self) -> None:
+        """Close the inotify file descriptor."""
+        os.close(self._fd)
+
+
+@dataclass
+class WatchSummary:
+    """Outcome of a single regeneration."""
+
+    written: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+
+class Watcher:
+    """
+    Long-running generation watching the configuration files.
+
+    The previously parsed configurations are kept in memory. On every change the files are parsed again and diffed against
+    them, only the tests whose entries changed are rebuilt and rewritten and the files of removed tests are deleted. Tests
+    colliding with each other are rejected as in every other generation mode.
+    """
+
+    def __init__(
+        self,
+        config_files: str | list[str],
+        output_dir: str,
+        input_format: DataFormat = DataFormat.YAML,
+        output_format: DataFormat = DataFormat.YAML,
+        file_watcher: FileWatcher | None = None,
+        debounce: float = DEFAULT_WATCH_DEBOUNCE,
+        layout: OutputLayout = OutputLayout.FLAT,
+    ) -> None:
+        """
+        Initialize the watcher.
+
+        :param config_files: configuration files, directories or glob patterns
+        :param output_dir: output directory
+        :param input_format: configuration files format
+        :param output_format: custom resources format
+        :param file_watcher: change detection backend, inotify with a polling fallback by default
+        :param debounce: number of seconds to wait for further writes before regenerating
+        :param layout: placement of the files in the output directory
+        """
+        self.paths = [config_files] if isinstance(config_files, str) else config_files
+        self.output_dir = output_dir
+        self.input_format = input_format
+        self.output_format = output_format
+        self.file_watcher = file_watcher or Watcher.create_file_watcher(self.paths, input_format)
+        self.debounce = debounce
+        self.layout = layout
+        self._configurations: dict[str, TestConfig] = {}
+        self._file_names: dict[str, str] = {}
+
+    @staticmethod
+    def create_file_watcher(paths: list[str], input_format: DataFormat = DataFormat.YAML) -> FileWatcher:
+        """
+        Create a file watcher for the configuration files.
+
+        A single configuration file is watched through inotify, falling back to polling when inotify is not available.
+        Several paths, directories and glob patterns are polled, so that files added to them are picked up.
+        """
+        if len(paths) == 1 and not any(character in paths[0] for character in GLOB_CHARACTERS) and not os.path.isdir(paths[0]):
+            try:
+                return InotifyFileWatcher(paths[0])
+            except OSError as error:
+                log.info(f"inotify is not available ({error}), falling back to polling.")
+        return PollingFileWatcher(paths, input_format=input_format)
+
+    def run(self, stop: threading.Event | None = None, timeout: float = DEFAULT_WATCH_POLL_INTERVAL) -> None:
+        """
+        Generate every custom resource, then regenerate the affected ones whenever the configuration changes.
+
+        :param stop: event ending the watch, the watch runs until interrupted when omitted
+        :param timeout: maximum number of seconds between two checks of the stop event
+        """
+        stop = stop or threading.Event()
+        self.refresh()
+        log.info(f"Watching {self.paths} for changes.")
+        try:
+            while not stop.is_set():
+                if self.file_watcher.wait_for_change(timeout):
+                    # Coalesce the burst of events editors produce while saving
+                    time.sleep(self.debounce)
+                    while self.file_watcher.wait_for_change(0):
+                        pass
+                    self.refresh()
+        finally:
+            self.file_watcher.close()
+
+    def refresh(self) -> WatchSummary | None:
+        """
+        Parse the configuration and regenerate the tests whose entries changed.
+
+        Invalid and colliding configurations are reported and otherwise ignored, the previous output is kept until the next
+        change.
+        :return: Regeneration summary, `None` when the configuration could not be processed
+        """
+        started = time.perf_counter()
+        try:
+            # Duplicated test keys are rejected as collisions while streaming, before they could overwrite each other
+            configurations = dict(ConfigurationSources.stream_test_configs(self.paths, self.input_format))
+            summary = self._apply(configurations)
+        except Exception as error:
+            log.error(f"Failed to regenerate custom resources from {self.paths}: {error}")
+            return None
+
+        elapsed = (time.perf_counter() - started) * 1000
+        log.info(f"Regenerated {len(summary.written)} and removed {len(summary.removed)} custom resources in {elapsed:.1f}ms.")
+        return summary
+
+    def _apply(self, configurations: dict[str, TestConfig]) -> WatchSummary:
+        """Write the changed tests and remove the deleted ones."""
+        summary = WatchSummary()
+        tree = OutputTree(self.output_dir, self.layout)
+        tree.prepare()
+        if not self._file_names:
+            # Files are written without being tracked, a manifest left by an incremental run would become stale
+            IncrementalGeneration.invalidate_manifest(self.output_dir)
+
+        # Paths of the files, relative to the output directory
+        file_names = {}
+        for test_key, test_config in configurations.items():
+            if test_key in self._file_names and self._configurations.get(test_key) == test_config:
+                file_names[test_key] = self._file_names[test_key]
+                continue
+
+            custom_resource = Helpers.build_custom_resource(test_key, test_config)
+            Helpers.write_cr_file(custom_resource, self.output_dir, self.output_format, tree)
+            name = custom_resource.metadata.name
+            file_names[test_key] = tree.relative_path(name, Helpers.cr_file_name(name, self.output_format))
+            summary.written.append(test_key)
+
+        # Delete files of removed tests, and of tests whose resource name changed
+        current_files = set(file_names.values())
+        for test_key, file_name in self._file_names.items():
+            if file_name not in current_files:
+                pathlib.Path(self.output_dir, file_name).unlink(missing_ok=True)
+                summary.removed.append(test_key)
+        tree.remove_empty_directories(file_name.rpartition("/")[0] for file_name in self._file_names.values())
+
+        # The index lists every test, including the unchanged ones
+        tree.write_index(sorted(current_files))
+
+        self._configurations = configurations
+        self._file_names = file_names
+        return summary
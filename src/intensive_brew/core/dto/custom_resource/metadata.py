@@ -12,3 +12,4 @@ class Metadata(BaseModel):
         frozen = True
 
     name: str
+    annotations: dict[str, str] | None = None
@@ -0,0 +1 @@
+"""Generation manifest DTO package."""
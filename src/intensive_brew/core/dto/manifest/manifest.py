@@ -0,0 +1,39 @@
+"""Generation manifest DTO package."""
+from pydantic import BaseModel
+
+# Bumped whenever the manifest layout changes, older manifests are then ignored
+MANIFEST_VERSION = 1
+
+
+class ManifestEntry(BaseModel):
+    """State of a single generated test."""
+
+    class Config:
+        """Pydantic config inner class."""
+
+        frozen = True
+
+    # * Hash of the normalized test configuration
+    config_hash: str
+
+    # * Hash of the emitted custom resource
+    cr_hash: str
+
+    # * Custom resource file name, relative to the output directory
+    file_name: str
+
+
+class Manifest(BaseModel):
+    """Generation manifest stored in the output directory."""
+
+    # * Manifest layout version
+    version: int = MANIFEST_VERSION
+
+    # * Version of the package that generated the output
+    generator_version: str
+
+    # * Generated tests state by test key
+    entries: dict[str, ManifestEntry] = {}
+
+    # * Kustomization index files, relative to the output directory
+    index_files: list[str] = []
@@ -0,0 +1,37 @@
+"""Utils package for dtos."""
+import re
+
+# Number of seconds in each duration unit, units accepted by the locust `--run-time` switch
+DURATION_UNITS = {"h": 3600, "m": 60, "s": 1}
+
+# Duration made of (number value + time unit) combinations only, e.g. (300s, 20m, 1h30m)
+DURATION_PATTERN = re.compile(r"(?:\d+[hms])+")
+DURATION_PART_PATTERN = re.compile(r"(\d+)([hms])")
+
+
+def parse_duration(value: str) -> int:
+    """
+    Normalize a duration, e.g. `1h30m`, to a number of seconds.
+
+    :param value: duration
+    :return: Number of seconds
+    :raises ValueError: if the value isn't made of (number value + time unit) combinations only
+    """
+    if not DURATION_PATTERN.fullmatch(value):
+        raise ValueError(f"Invalid duration, expected e.g. (300s, 20m, 3h, 1h30m, etc..). Provided value: {value}")
+    return sum(int(number) * DURATION_UNITS[unit] for number, unit in DURATION_PART_PATTERN.findall(value))
+
+
+def format_duration(seconds: int) -> str:
+    """
+    Format a number of seconds as a duration, e.g. `1h30m`.
+
+    :param seconds: number of seconds
+    :return: Duration, in the largest units first
+    """
+    parts = []
+    for unit, unit_seconds in DURATION_UNITS.items():
+        number, seconds = divmod(seconds, unit_seconds)
+        if number:
+            parts.append(f"{number}{unit}")
+    return "".join(parts) or "0s"
@@ -0,0 +1,72 @@
+"""Utils package for dtos."""
+import json
+import threading
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+# Maximum number of distinct blocks kept, the table is reset beyond it so that long-running processes don't grow unbounded
+DEFAULT_INTERN_MAX_ENTRIES = 4096
+
+
+class Interner:
+    """
+    Table of canonical configuration blocks.
+
+    Tests usually share the same labels, annotations, affinity and tolerations, often through YAML anchors, yet validation
+    creates a copy of each block per test. Interning replaces equal blocks by a single shared instance, so that memory
+    scales with the number of distinct blocks and later stages can cache work per block instance.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_INTERN_MAX_ENTRIES) -> None:
+        """
+        Initialize an empty table.
+
+        :param max_entries: maximum number of distinct blocks kept
+        """
+        self.max_entries = max_entries
+        self._values: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def intern(self, value: T | None) -> T | None:
+        """
+        Get the canonical instance of a block.
+
+        :param value: frozen model, or list of frozen models
+        :return: First seen block equal to the value, the value itself if none was seen
+        """
+        if value is None:
+            return value
+
+        key = Interner.key(value)
+        with self._lock:
+            canonical = self._values.get(key)
+            if canonical is None:
+                if len(self._values) >= self.max_entries:
+                    self._values.clear()
+                canonical = self._values[key] = value
+        return canonical
+
+    @staticmethod
+    def key(value: Any) -> str:
+        """Get the key of a block, equal blocks of the same type share the same key."""
+        if isinstance(value, list):
+            return "list:" + json.dumps([Interner.key(item) for item in value])
+        if isinstance(value, BaseModel):
+            return f"{type(value).__qualname__}:{json.dumps(value.dict(), sort_keys=True)}"
+        raise TypeError(f"Unsupported block type: {type(value).__name__}")
+
+    def __len__(self) -> int:
+        """Get the number of distinct blocks."""
+        return len(self._values)
+
+    def clear(self) -> None:
+        """Forget every block."""
+        with self._lock:
+            self._values.clear()
+
+
+# Process wide table, shared by every parsed configuration
+INTERNER = Interner()
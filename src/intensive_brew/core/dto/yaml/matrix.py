@@ -0,0 +1,39 @@
+"""DTO package."""
+from pydantic import AnyUrl, BaseModel, validator
+
+
+class Matrix(BaseModel):
+    """Test matrix, the test is expanded into one test per combination of the listed values."""
+
+    class Config:
+        """Pydantic config inner class."""
+
+        allow_mutation = False
+
+    # * Number of users
+    users: list[int] | None = None
+
+    # * Users spawn rate
+    spawn_rate: list[int] | None = None
+
+    # * Test duration
+    run_time: list[str] | None = None
+
+    # * Number of seconds to wait for simulated users to complete their tasks before exiting
+    termination_timeout: list[int] | None = None
+
+    # * Target URL of the test
+    target_host: list[AnyUrl] | None = None
+
+    # * Worker replicas
+    worker_replicas: list[int] | None = None
+
+    @validator("*")
+    def check_axis(cls, param_value):  # type: ignore[no-untyped-def] # noqa: N805
+        """Validate that an axis lists distinct values."""
+        if param_value is not None:
+            if not param_value:
+                raise ValueError("A matrix axis must list at least one value.")
+            if len(set(param_value)) != len(param_value):
+                raise ValueError(f"A matrix axis must list distinct values. Provided values: {param_value}")
+        return param_value
@@ -1,13 +1,18 @@
 """DTO package."""
+from typing import Literal
+
 from pydantic import BaseModel, validator
 
 from intensive_brew.core.dto.custom_resource.affinity import Affinity
 from intensive_brew.core.dto.custom_resource.annotations import Annotations
 from intensive_brew.core.dto.custom_resource.labels import Labels
 from intensive_brew.core.dto.custom_resource.toleration import Toleration
+from intensive_brew.core.dto.utils.interning import INTERNER
 from intensive_brew.core.dto.utils.validator_utils import is_expert
 from intensive_brew.core.dto.yaml.expert_mode import ExpertMode
+from intensive_brew.core.dto.yaml.matrix import Matrix
 from intensive_brew.core.dto.yaml.vanilla_specs import VanillaSpecs
+from intensive_brew.core.dto.yaml.worker_capacity import WorkerCapacity
 
 
 class TestConfig(BaseModel):
@@ -31,8 +36,11 @@ class TestConfig(BaseModel):
     # * Locust container image
     image: str | None = "locustio/locust:latest"
 
-    # * Worker replicas
-    worker_replicas: int | None = 5
+    # * Worker replicas, `auto` sizes them from the target load and the worker capacity
+    worker_replicas: int | Literal["auto"] | None = 5
+
+    # * Per worker capacity, used when `worker_replicas` is `auto`
+    worker_capacity: WorkerCapacity | None = None
 
     # * Test configuration map
     configmap: str | None = None
@@ -49,6 +57,9 @@ class TestConfig(BaseModel):
     # * Affinity
     affinity: Affinity | None = None
 
+    # * Test matrix, expanded over `vanilla_specs` fields and `worker_replicas`
+    matrix: Matrix | None = None
+
     @validator("entry_point", always=True)
     def check_entry_point(cls, param_value: str, values):  # type: ignore[no-untyped-def] # noqa: N805
         """Validate entry point if expert mode is not enabled."""
@@ -62,3 +73,36 @@ class TestConfig(BaseModel):
         if (not is_expert(values)) and (values["custom_load_shapes"] is False) and (param_value is None):
             raise ValueError("The section 'vanilla_specs' must be provided.")
         return param_value
+
+    @validator("worker_capacity", always=True)
+    def check_worker_capacity(cls, param_value: WorkerCapacity | None, values):  # type: ignore[no-untyped-def] # noqa: N805
+        """Validate that automatically sized workers have a target number of users to size them from."""
+        # Invalid sections are already reported
+        if values.get("worker_replicas") == "auto" and "expert_mode" in values and "vanilla_specs" in values:
+            has_vanilla_specs = not is_expert(values) and values["vanilla_specs"] is not None
+            if not has_vanilla_specs and (param_value is None or param_value.users is None):
+                raise ValueError("'worker_replicas: auto' requires a 'vanilla_specs' section, or the target 'users' in 'worker_capacity'.")
+        return param_value
+
+    @validator("labels", "annotations", "affinity", "tolerations")
+    def intern_shared_blocks(cls, param_value, values):  # type: ignore[no-untyped-def] # noqa: N805
+        """Share a single instance of blocks that are equal across tests."""
+        return INTERNER.intern(param_value)
+
+    @validator("matrix")
+    def check_matrix(cls, param_value: Matrix | None, values):  # type: ignore[no-untyped-def] # noqa: N805
+        """Validate that matrix values over `vanilla_specs` fields produce valid vanilla specs."""
+        if param_value is None:
+            return param_value
+
+        vanilla_axes = {name: axis for name, axis in param_value if axis is not None and name != "worker_replicas"}
+        # Invalid sections are already reported
+        if vanilla_axes and "expert_mode" in values and "vanilla_specs" in values:
+            if is_expert(values) or values.get("vanilla_specs") is None:
+                raise ValueError("A matrix over 'vanilla_specs' fields requires a 'vanilla_specs' section and no expert mode.")
+            # Values are checked one axis at a time, combinations are never materialized
+            base = values["vanilla_specs"].dict()
+            for name, axis in vanilla_axes.items():
+                for axis_value in axis:
+                    VanillaSpecs(**{**base, name: axis_value})
+        return param_value
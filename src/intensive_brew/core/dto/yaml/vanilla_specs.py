@@ -3,6 +3,8 @@ import re
 
 from pydantic import AnyUrl, BaseModel, validator
 
+from intensive_brew.core.dto.utils.duration import parse_duration
+
 
 class VanillaSpecs(BaseModel):
     """Base specs for test."""
@@ -51,4 +53,11 @@ class VanillaSpecs(BaseModel):
                 f"The field 'run_time' must be populated with a valid duration, e.g. (300s, 20m, 3h, 1h30m, etc..). Provided value: {param_value}"
             )
 
+        # Rejects leftovers between combinations, the run time must be normalized to seconds when scheduling tests
+        parse_duration(param_value)
         return param_value
+
+    @property
+    def run_time_seconds(self) -> int:
+        """Test duration, in seconds."""
+        return parse_duration(self.run_time)
@@ -0,0 +1,27 @@
+"""DTO package."""
+from pydantic import BaseModel, PositiveInt
+
+# Default per worker capacity when sizing workers, Locust advises against spawn rates above 100 users per second per worker
+DEFAULT_USERS_PER_WORKER = 1000
+DEFAULT_SPAWN_RATE_PER_WORKER = 100
+
+
+class WorkerCapacity(BaseModel):
+    """Per worker capacity model, used to size the workers when `worker_replicas` is `auto`."""
+
+    class Config:
+        """Pydantic config inner class."""
+
+        allow_mutation = False
+
+    # * Number of users a single worker simulates without becoming the bottleneck
+    users_per_worker: PositiveInt = DEFAULT_USERS_PER_WORKER
+
+    # * Number of users a single worker spawns per second
+    spawn_rate_per_worker: PositiveInt = DEFAULT_SPAWN_RATE_PER_WORKER
+
+    # * Target number of users, hint for tests without vanilla specs e.g. expert mode
+    users: PositiveInt | None = None
+
+    # * Target users spawn rate, hint for tests without vanilla specs e.g. expert mode
+    spawn_rate: PositiveInt | None = None
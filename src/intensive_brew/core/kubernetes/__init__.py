@@ -0,0 +1 @@
+"""Kubernetes API client package."""
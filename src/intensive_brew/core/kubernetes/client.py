@@ -0,0 +1,286 @@
+"""Kubernetes API client package."""
+import http.client
+import json
+import logging
+import queue
+import random
+import statistics
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from urllib.parse import quote, urlencode
+
+from intensive_brew.core.dto.custom_resource.locust_test_custom_resource import LocustTest
+from intensive_brew.core.kubernetes.connection import ClusterConnection
+from intensive_brew.core.kubernetes.constants import (
+    APPLY_PATCH_CONTENT_TYPE,
+    DEFAULT_APPLY_BACKOFF,
+    DEFAULT_APPLY_CONCURRENCY,
+    DEFAULT_APPLY_RETRIES,
+    DEFAULT_APPLY_TIMEOUT,
+    FIELD_MANAGER,
+    MAX_APPLY_BACKOFF,
+    RETRYABLE_STATUSES,
+)
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class ApiResponse:
+    """Response of the API server."""
+
+    status: int
+    body: bytes
+    retry_after: float | None = None
+
+
+class ConnectionPool:
+    """
+    Pool of keep-alive connections to the API server.
+
+    Connections are opened on demand, up to the pool size, and reused by the following requests. A connection whose
+    request failed is discarded rather than returned to the pool.
+    """
+
+    def __init__(
+        self, connection: ClusterConnection, size: int = DEFAULT_APPLY_CONCURRENCY, timeout: float = DEFAULT_APPLY_TIMEOUT
+    ) -> None:
+        """
+        Initialize the pool.
+
+        :param connection: API server address and credentials
+        :param size: maximum number of open connections
+        :param timeout: connect and read timeout of each request, in seconds
+        """
+        self.connection = connection
+        self.timeout = timeout
+        self.ssl_context = connection.ssl_context()
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue()
+        # One slot per connection, acquiring a slot bounds the number of concurrent requests
+        self._slots: queue.Queue[None] = queue.Queue()
+        for _ in range(size):
+            self._slots.put(None)
+
+    def _connect(self) -> http.client.HTTPConnection:
+        """Open a new connection."""
+        if self.ssl_context is not None:
+            return http.client.HTTPSConnection(self.connection.host, self.connection.port, timeout=self.timeout, context=self.ssl_context)
+        return http.client.HTTPConnection(self.connection.host, self.connection.port, timeout=self.timeout)
+
+    def request(self, method: str, path: str, body: bytes, headers: dict[str, str]) -> ApiResponse:
+        """
+        Send a request over a pooled connection.
+
+        :param method: HTTP method
+        :param path: request path, relative to the API server path prefix
+        :param body: request body
+        :param headers: request headers, the authorization header is added when a token is configured
+        :return: API server response
+        """
+        if self.connection.token:
+            headers = {**headers, "Authorization": f"Bearer {self.connection.token}"}
+
+        self._slots.get()
+        try:
+            try:
+                http_connection = self._idle.get_nowait()
+            except queue.Empty:
+                http_connection = self._connect()
+
+            try:
+                http_connection.request(method, self.connection.path_prefix + path, body=body, headers=headers)
+                response = http_connection.getresponse()
+                response_body = response.read()
+            except (OSError, http.client.HTTPException):
+                http_connection.close()
+                raise
+
+            if response.will_close:
+                http_connection.close()
+            else:
+                self._idle.put(http_connection)
+            return ApiResponse(response.status, response_body, ConnectionPool._retry_after(response.getheader("Retry-After")))
+        finally:
+            self._slots.put(None)
+
+    @staticmethod
+    def _retry_after(value: str | None) -> float | None:
+        """Parse a `Retry-After` header given in seconds, HTTP dates are ignored."""
+        try:
+            return float(value) if value else None
+        except ValueError:
+            return None
+
+    def close(self) -> None:
+        """Close the idle connections."""
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
+
+
+@dataclass
+class ApplyResult:
+    """Outcome of the server-side apply of a single custom resource."""
+
+    name: str
+    # * HTTP status of the last attempt, 0 when the API server couldn't be reached
+    status: int
+    latency_seconds: float
+    attempts: int
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the custom resource was applied."""
+        return 200 <= self.status < 300
+
+
+@dataclass
+class ApplyReport:
+    """Outcome of the server-side apply of a collection of custom resources."""
+
+    results: list[ApplyResult] = field(default_factory=list)
+
+    @property
+    def failed(self) -> list[ApplyResult]:
+        """Results of the custom resources that couldn't be applied."""
+        return [result for result in self.results if not result.ok]
+
+    def summary(self) -> str:
+        """Human readable per-resource latencies, followed by their distribution."""
+        lines = [
+            f"{result.name}: {result.status or 'unreachable'} in {result.latency_seconds * 1000:.1f} ms"
+            + (f" after {result.attempts} attempts" if result.attempts > 1 else "")
+            + (f" - {result.error}" if result.error else "")
+            for result in self.results
+        ]
+        latencies = sorted(result.latency_seconds * 1000 for result in self.results)
+        if latencies:
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            lines.append(
+                f"Applied {len(self.results) - len(self.failed)}/{len(self.results)} custom resources, latency "
+                f"p50 {statistics.median(latencies):.1f} ms, p95 {p95:.1f} ms, max {latencies[-1]:.1f} ms."
+            )
+        return "\n".join(lines)
+
+
+class KubernetesClient:
+    """Minimal Kubernetes API client, server-side applies custom resources over a shared connection pool."""
+
+    def __init__(
+        self,
+        connection: ClusterConnection,
+        concurrency: int = DEFAULT_APPLY_CONCURRENCY,
+        retries: int = DEFAULT_APPLY_RETRIES,
+        backoff: float = DEFAULT_APPLY_BACKOFF,
+        timeout: float = DEFAULT_APPLY_TIMEOUT,
+        field_manager: str = FIELD_MANAGER,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the client.
+
+        :param connection: API server address and credentials
+        :param concurrency: number of concurrent requests, and of pooled connections
+        :param retries: number of retries of a request answered with a retryable status or failing to connect
+        :param backoff: delay before the first retry, doubled on each following one
+        :param timeout: timeout of each request, in seconds
+        :param field_manager: field manager owning the applied fields
+        :param sleep: function waiting between retries
+        """
+        self.pool = ConnectionPool(connection, size=concurrency, timeout=timeout)
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.field_manager = field_manager
+        self.sleep = sleep
+
+    def __enter__(self) -> "KubernetesClient":
+        """Use the client as a context manager, closing its connections on exit."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the pooled connections."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.pool.close()
+
+    @staticmethod
+    def resource_path(custom_resource: LocustTest, namespace: str) -> str:
+        """Get the API path of a namespaced custom resource."""
+        group_version = custom_resource.api_version
+        plural = f"{custom_resource.kind.lower()}s"
+        return f"/apis/{group_version}/namespaces/{quote(namespace)}/{plural}/{quote(custom_resource.metadata.name)}"
+
+    def server_side_apply(self, custom_resource: LocustTest, namespace: str, dry_run: bool = False) -> ApplyResult:
+        """
+        Server-side apply a custom resource, retrying with exponential backoff while the API server is overloaded.
+
+        :param custom_resource: custom resource to apply
+        :param namespace: namespace of the custom resource
+        :param dry_run: have the API server validate the request without persisting it
+        :return: Apply outcome, failures are reported rather than raised
+        """
+        query = {"fieldManager": self.field_manager, "force": "true"}
+        if dry_run:
+            query["dryRun"] = "All"
+        path = f"{KubernetesClient.resource_path(custom_resource, namespace)}?{urlencode(query)}"
+        body = json.dumps(custom_resource.dict(by_alias=True, exclude_none=True)).encode()
+        headers = {"Content-Type": APPLY_PATCH_CONTENT_TYPE, "Accept": "application/json"}
+        name = custom_resource.metadata.name
+
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            retry_after = None
+            try:
+                response = self.pool.request("PATCH", path, body, headers)
+            except (OSError, http.client.HTTPException) as error:
+                status, error_message = 0, str(error) or type(error).__name__
+            else:
+                if response.status not in RETRYABLE_STATUSES:
+                    error_message = "" if 200 <= response.status < 300 else KubernetesClient._error_message(response.body)
+                    return ApplyResult(name, response.status, time.perf_counter() - start, attempt, error_message)
+                status, error_message, retry_after = response.status, KubernetesClient._error_message(response.body), response.retry_after
+
+            if attempt > self.retries:
+                return ApplyResult(name, status, time.perf_counter() - start, attempt, error_message)
+
+            delay = retry_after if retry_after is not None else self._backoff_delay(attempt)
+            log.debug(f"Apply of '{name}' failed with {status or error_message}, retrying in {delay:.2f}s.")
+            self.sleep(delay)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with jitter, so that throttled workers don't retry in lockstep."""
+        delay = min(self.backoff * 2.0 ** (attempt - 1), MAX_APPLY_BACKOFF)
+        return delay * random.uniform(0.5, 1.0)  # nosec B311 - not used for security
+
+    @staticmethod
+    def _error_message(body: bytes) -> str:
+        """Extract the message of a `Status` error response."""
+        try:
+            return str(json.loads(body)["message"])
+        except (ValueError, KeyError, TypeError):
+            return body.decode(errors="replace")[:200]
+
+    def apply_all(self, custom_resources: Iterable[LocustTest], namespace: str, dry_run: bool = False) -> ApplyReport:
+        """
+        Server-side apply custom resources concurrently.
+
+        :param custom_resources: custom resources to apply
+        :param namespace: namespace of the custom resources
+        :param dry_run: have the API server validate the requests without persisting them
+        :return: Report of every apply, in the order of the custom resources
+        """
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            results = list(
+                executor.map(lambda custom_resource: self.server_side_apply(custom_resource, namespace, dry_run), custom_resources)
+            )
+
+        report = ApplyReport(results)
+        log.info(f"Applied {len(results) - len(report.failed)}/{len(results)} custom resources to namespace '{namespace}'.")
+        return report
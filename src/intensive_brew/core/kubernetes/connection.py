@@ -0,0 +1,132 @@
+"""Kubernetes API client package."""
+import base64
+import logging
+import os
+import ssl
+import tempfile
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+from intensive_brew.core.kubernetes.constants import DEFAULT_KUBECONFIG
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ClusterConnection:
+    """Address and credentials of a Kubernetes API server."""
+
+    server: str
+    token: str = ""
+    certificate_authority: str = ""
+    certificate_authority_data: bytes = b""
+    client_certificate: str = ""
+    client_key: str = ""
+    client_certificate_data: bytes = b""
+    client_key_data: bytes = b""
+    insecure_skip_tls_verify: bool = False
+
+    @property
+    def is_https(self) -> bool:
+        """Whether the API server is reached over TLS."""
+        return urlsplit(self.server).scheme == "https"
+
+    @property
+    def host(self) -> str:
+        """API server host."""
+        return urlsplit(self.server).hostname or ""
+
+    @property
+    def port(self) -> int:
+        """API server port."""
+        return urlsplit(self.server).port or (443 if self.is_https else 80)
+
+    @property
+    def path_prefix(self) -> str:
+        """Path the API server is served under, when behind a proxy."""
+        return urlsplit(self.server).path.rstrip("/")
+
+    def ssl_context(self) -> ssl.SSLContext | None:
+        """Create the TLS context of the connections, None for plain HTTP servers."""
+        if not self.is_https:
+            return None
+
+        context = ssl.create_default_context()
+        if self.insecure_skip_tls_verify:
+            log.warning("TLS verification of the API server certificate is disabled.")
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        elif self.certificate_authority:
+            context.load_verify_locations(cafile=self.certificate_authority)
+        elif self.certificate_authority_data:
+            context.load_verify_locations(cadata=self.certificate_authority_data.decode())
+
+        if self.client_certificate:
+            context.load_cert_chain(self.client_certificate, self.client_key or None)
+        elif self.client_certificate_data:
+            # `ssl` only loads client certificates from files, they are removed as soon as they are loaded
+            with tempfile.TemporaryDirectory() as directory:
+                certificate, key = os.path.join(directory, "client.crt"), os.path.join(directory, "client.key")
+                for path, data in ((certificate, self.client_certificate_data), (key, self.client_key_data)):
+                    with open(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), "wb") as file:
+                        file.write(data)
+                context.load_cert_chain(certificate, key if self.client_key_data else None)
+
+        return context
+
+    @staticmethod
+    def from_kubeconfig(kubeconfig: str = "", context: str = "") -> "ClusterConnection":
+        """
+        Read the connection of a kubeconfig context.
+
+        :param kubeconfig: kubeconfig file, defaults to the first file of `KUBECONFIG` then to `~/.kube/config`
+        :param context: context name, defaults to the current context
+        :return: Cluster connection
+        :raises ValueError: when the context, its cluster or its user can't be found
+        """
+        import yaml
+
+        path = kubeconfig or os.environ.get("KUBECONFIG", "").split(os.pathsep)[0] or os.path.expanduser(DEFAULT_KUBECONFIG)
+        with open(path) as kubeconfig_file:
+            config = yaml.safe_load(kubeconfig_file) or {}
+
+        context_name = context or config.get("current-context", "")
+        cluster_context = ClusterConnection._named(config, "contexts", "context", context_name)
+        cluster = ClusterConnection._named(config, "clusters", "cluster", cluster_context.get("cluster", ""))
+        user = ClusterConnection._named(config, "users", "user", cluster_context["user"]) if cluster_context.get("user") else {}
+        log.debug(f"Using kubeconfig '{path}', context '{context_name}'.")
+
+        # Relative file references are resolved against the kubeconfig directory
+        base_dir = os.path.dirname(os.path.abspath(path))
+
+        def file(key: str, section: dict[str, Any]) -> str:
+            return os.path.join(base_dir, section[key]) if section.get(key) else ""
+
+        def data(key: str, section: dict[str, Any]) -> bytes:
+            return base64.b64decode(section[key]) if section.get(key) else b""
+
+        token = user.get("token", "")
+        if not token and user.get("tokenFile"):
+            with open(file("tokenFile", user)) as token_file:
+                token = token_file.read().strip()
+
+        return ClusterConnection(
+            server=cluster["server"],
+            token=token,
+            certificate_authority=file("certificate-authority", cluster),
+            certificate_authority_data=data("certificate-authority-data", cluster),
+            client_certificate=file("client-certificate", user),
+            client_key=file("client-key", user),
+            client_certificate_data=data("client-certificate-data", user),
+            client_key_data=data("client-key-data", user),
+            insecure_skip_tls_verify=bool(cluster.get("insecure-skip-tls-verify", False)),
+        )
+
+    @staticmethod
+    def _named(config: dict[str, Any], section: str, key: str, name: str) -> dict[str, Any]:
+        """Find a named entry of a kubeconfig section."""
+        for entry in config.get(section) or []:
+            if entry.get("name") == name:
+                return dict(entry.get(key) or {})
+        raise ValueError(f"No {key} named '{name}' in the kubeconfig.")
@@ -0,0 +1,27 @@
+"""Constants for Kubernetes API client package."""
+
+# Field manager recorded by the API server for fields owned by server-side applies
+FIELD_MANAGER = "intensive-brew"
+
+# Content type of server-side apply patches, JSON documents are valid YAML ones
+APPLY_PATCH_CONTENT_TYPE = "application/apply-patch+yaml"
+
+# Default number of concurrent requests, and of pooled connections, to the API server
+DEFAULT_APPLY_CONCURRENCY = 8
+
+# Default number of retries of a request answered with a retryable status
+DEFAULT_APPLY_RETRIES = 5
+
+# Delay before the first retry, doubled on each following one
+DEFAULT_APPLY_BACKOFF = 0.2
+
+# Upper bound of the delay between two retries
+MAX_APPLY_BACKOFF = 10.0
+
+# Number of seconds to wait for the API server before a request is considered failed
+DEFAULT_APPLY_TIMEOUT = 30.0
+
+# Statuses answered by an overloaded or temporarily unavailable API server
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+DEFAULT_KUBECONFIG = "~/.kube/config"
@@ -0,0 +1 @@
+"""Generation metrics package."""
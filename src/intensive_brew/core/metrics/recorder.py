@@ -0,0 +1,252 @@
+"""Generation metrics package."""
+import contextlib
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from typing import Any
+
+try:
+    import resource
+
+    RESOURCE_AVAILABLE = True
+except ImportError:  # pragma: no cover - not available on Windows
+    RESOURCE_AVAILABLE = False
+
+# `ru_maxrss` is reported in kilobytes on Linux and in bytes on macOS
+_MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+PROMETHEUS_PREFIX = "intensive_brew"
+
+
+class MetricsFormat(str, Enum):
+    """Supported metrics output formats."""
+
+    JSON = "json"
+    PROMETHEUS = "prometheus"
+
+
+@dataclass
+class Span:
+    """A single timed section of a run, timings are available once its context exits."""
+
+    name: str
+    wall_seconds: float = 0.0
+    # CPU time of the thread running the span, work done in child processes is not accounted
+    cpu_seconds: float = 0.0
+    # Peak resident set size of the process when the span ended
+    peak_rss_bytes: int | None = None
+    recorder: "MetricsRecorder | None" = field(default=None, repr=False, compare=False)
+    _wall_start: float = field(default=0.0, repr=False, compare=False)
+    _cpu_start: float = field(default=0.0, repr=False, compare=False)
+
+    def __enter__(self) -> "Span":
+        """Start timing."""
+        self._wall_start, self._cpu_start = time.perf_counter(), time.thread_time()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Stop timing and report to the recorder."""
+        self.wall_seconds = time.perf_counter() - self._wall_start
+        self.cpu_seconds = time.thread_time() - self._cpu_start
+        self.peak_rss_bytes = peak_rss_bytes()
+        if self.recorder is not None:
+            self.recorder._record_span(self)
+
+
+@dataclass
+class StageMetrics:
+    """Aggregated spans of a stage."""
+
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_rss_bytes: int | None = None
+
+
+@dataclass
+class TestMetrics:
+    """Metrics of a single test custom resource."""
+
+    # Needed so the pytest runner ignore this class from test collection
+    __test__ = False
+
+    build_seconds: float | None = None
+    output_bytes: int | None = None
+
+
+@dataclass
+class MetricsRecorder:
+    """
+    Records where the time of a run goes.
+
+    Instrumented code reports spans and per test metrics through the module level `span`, `record_test` and
+    `record_output` functions, which are no-ops unless a recorder is active, i.e. inside its `with` block. The active
+    recorder is scoped to the current context: threads running concurrently each report to their own recorder, and worker
+    threads report to the recorder of the context they were started from. Embedding code can time its own sections with
+    `span` as well and attach hooks called with every finished span.
+    """
+
+    stages: dict[str, StageMetrics] = field(default_factory=dict)
+    tests: dict[str, TestMetrics] = field(default_factory=dict)
+    hooks: list[Callable[[Span], None]] = field(default_factory=list)
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _tokens: list["contextvars.Token[MetricsRecorder | None]"] = field(default_factory=list, repr=False)
+
+    def __enter__(self) -> "MetricsRecorder":
+        """Make the recorder the one instrumented code of the current context reports to."""
+        self._tokens.append(_active_recorder.set(self))
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Restore the previously active recorder."""
+        _active_recorder.reset(self._tokens.pop())
+
+    def add_hook(self, hook: Callable[[Span], None]) -> None:
+        """Call a hook with every span finished from now on."""
+        self.hooks.append(hook)
+
+    def span(self, name: str) -> Span:
+        """
+        Time a section of the run.
+
+        :param name: stage the span is aggregated into
+        :return: The span context
+        """
+        return Span(name, recorder=self)
+
+    def _record_span(self, span: Span) -> None:
+        """Aggregate a finished span into its stage and call the hooks."""
+        with self._lock:
+            stage = self.stages.setdefault(span.name, StageMetrics())
+            stage.calls += 1
+            stage.wall_seconds += span.wall_seconds
+            stage.cpu_seconds += span.cpu_seconds
+            if span.peak_rss_bytes is not None:
+                stage.peak_rss_bytes = max(stage.peak_rss_bytes or 0, span.peak_rss_bytes)
+        for hook in self.hooks:
+            hook(span)
+
+    def record_test(self, name: str, build_seconds: float | None = None, output_bytes: int | None = None) -> None:
+        """Record metrics of a single test custom resource, only the provided values are updated."""
+        with self._lock:
+            test = self.tests.setdefault(name, TestMetrics())
+            if build_seconds is not None:
+                test.build_seconds = build_seconds
+            if output_bytes is not None:
+                test.output_bytes = output_bytes
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the recorded metrics as plain data."""
+        return {
+            "wall_seconds": time.perf_counter() - self._started,
+            "peak_rss_bytes": peak_rss_bytes(),
+            "stages": {name: asdict(stage) for name, stage in self.stages.items()},
+            "tests": {name: asdict(test) for name, test in self.tests.items()},
+        }
+
+    def to_json(self) -> str:
+        """Render the recorded metrics as JSON."""
+        return json.dumps(self.to_dict(), indent=2) + "\n"
+
+    def to_prometheus(self) -> str:
+        """
+        Render the recorded metrics in the Prometheus text exposition format, as read by the node exporter textfile collector.
+
+        Per test metrics are aggregated, one series per test would not scale to large configurations.
+        """
+        metrics = self.to_dict()
+        lines: list[str] = []
+
+        def add(name: str, help_text: str, samples: list[tuple[str, float | int | None]]) -> None:
+            lines.extend([f"# HELP {PROMETHEUS_PREFIX}_{name} {help_text}", f"# TYPE {PROMETHEUS_PREFIX}_{name} gauge"])
+            lines.extend(f"{PROMETHEUS_PREFIX}_{name}{labels} {value}" for labels, value in samples if value is not None)
+
+        stages = metrics["stages"].items()
+        add("run_wall_seconds", "Wall time of the run.", [("", metrics["wall_seconds"])])
+        add("run_peak_rss_bytes", "Peak resident set size of the run.", [("", metrics["peak_rss_bytes"])])
+        add("stage_calls", "Number of spans recorded for each stage.", [(f'{{stage="{name}"}}', stage["calls"]) for name, stage in stages])
+        add(
+            "stage_wall_seconds",
+            "Wall time spent in each stage.",
+            [(f'{{stage="{name}"}}', stage["wall_seconds"]) for name, stage in stages],
+        )
+        add("stage_cpu_seconds", "CPU time spent in each stage.", [(f'{{stage="{name}"}}', stage["cpu_seconds"]) for name, stage in stages])
+        add(
+            "stage_peak_rss_bytes",
+            "Peak resident set size at the end of each stage.",
+            [(f'{{stage="{name}"}}', stage["peak_rss_bytes"]) for name, stage in stages],
+        )
+
+        build_seconds = [test.build_seconds for test in self.tests.values() if test.build_seconds is not None]
+        output_bytes = [test.output_bytes for test in self.tests.values() if test.output_bytes is not None]
+        add("tests", "Number of tests with recorded metrics.", [("", len(self.tests))])
+        add("test_build_seconds_max", "Slowest custom resource build.", [("", max(build_seconds, default=None))])
+        add("test_output_bytes_total", "Size of the written custom resources.", [("", sum(output_bytes))])
+        add("test_output_bytes_max", "Largest written custom resource.", [("", max(output_bytes, default=None))])
+        return "\n".join(lines) + "\n"
+
+    def render(self, metrics_format: MetricsFormat = MetricsFormat.JSON) -> str:
+        """Render the recorded metrics in the given format."""
+        return self.to_prometheus() if MetricsFormat(metrics_format) == MetricsFormat.PROMETHEUS else self.to_json()
+
+    def write(self, file_path: str, metrics_format: MetricsFormat = MetricsFormat.JSON) -> None:
+        """Atomically write the recorded metrics, textfile collectors must never read a partially written file."""
+        temporary_path = f"{file_path}.tmp"
+        with open(temporary_path, "w") as metrics_file:
+            metrics_file.write(self.render(metrics_format))
+        os.replace(temporary_path, file_path)
+
+    def summary(self) -> str:
+        """Human readable table of the time spent in each stage."""
+        lines = [f"{'stage':<16}{'calls':>10}{'wall (s)':>12}{'cpu (s)':>12}{'peak rss (MiB)':>16}"]
+        for name, stage in self.stages.items():
+            rss = f"{stage.peak_rss_bytes / 2**20:.1f}" if stage.peak_rss_bytes is not None else "-"
+            lines.append(f"{name:<16}{stage.calls:>10}{stage.wall_seconds:>12.4f}{stage.cpu_seconds:>12.4f}{rss:>16}")
+        lines.append(f"{'total':<16}{'':>10}{time.perf_counter() - self._started:>12.4f}")
+        return "\n".join(lines)
+
+
+# Recorder instrumented code of the current context reports to, worker threads are started in a copy of their parent's
+# context so that their spans are collected as well
+_active_recorder: contextvars.ContextVar[MetricsRecorder | None] = contextvars.ContextVar("active_recorder", default=None)
+
+
+def peak_rss_bytes() -> int | None:
+    """Get the peak resident set size of the process, `None` when it can't be measured."""
+    if not RESOURCE_AVAILABLE:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_UNIT
+
+
+def active_recorder() -> MetricsRecorder | None:
+    """Get the active recorder, if any."""
+    return _active_recorder.get()
+
+
+def span(name: str) -> contextlib.AbstractContextManager[Span | None]:
+    """Time a section of the run with the active recorder, does nothing when no recorder is active."""
+    recorder = _active_recorder.get()
+    if recorder is None:
+        return contextlib.nullcontext()
+    return recorder.span(name)
+
+
+def record_test(name: str, build_seconds: float | None = None) -> None:
+    """Record the build time of a test custom resource with the active recorder."""
+    recorder = _active_recorder.get()
+    if recorder is not None:
+        recorder.record_test(name, build_seconds=build_seconds)
+
+
+def record_output(name: str, serialized: str) -> None:
+    """Record the size of a written custom resource with the active recorder."""
+    recorder = _active_recorder.get()
+    if recorder is not None:
+        recorder.record_test(name, output_bytes=len(serialized.encode()))
@@ -0,0 +1 @@
+"""Test scheduling package."""
@@ -0,0 +1,10 @@
+"""Constants for test scheduling package."""
+
+# Directory of each wave in the schedule output directory, numbered from 1 in run order
+WAVE_DIRECTORY_TEMPLATE = "wave-{index:03d}"
+
+# Matches wave directories, including the ones left by a previous schedule of more waves
+WAVE_DIRECTORY_PATTERN = r"wave-\d{3,}"
+
+# Ordered plan of the waves, written to the schedule output directory
+PLAN_FILE_NAME = "plan.json"
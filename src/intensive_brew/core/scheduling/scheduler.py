@@ -0,0 +1,297 @@
+"""Wave scheduling package."""
+import json
+import logging
+import math
+import pathlib
+import re
+import shutil
+from dataclasses import dataclass, field
+from typing import Any
+
+from intensive_brew.core.cache.configuration_cache import ConfigurationCache
+from intensive_brew.core.codec.formats import DataFormat
+from intensive_brew.core.custom_resource.compact import CompactCustomResource, CustomResourceBatch
+from intensive_brew.core.custom_resource.utils.helpers import Helpers
+from intensive_brew.core.dto.utils.duration import format_duration
+from intensive_brew.core.dto.yaml.test_config import TestConfig
+from intensive_brew.core.metrics.recorder import span
+from intensive_brew.core.scheduling.constants import PLAN_FILE_NAME, WAVE_DIRECTORY_PATTERN, WAVE_DIRECTORY_TEMPLATE
+from intensive_brew.core.yaml.sources import ConfigurationSources
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ScheduledTest:
+    """Load a single test puts on the cluster, and for how long."""
+
+    # Position of the test in the configuration
+    index: int
+    test_key: str
+    name: str
+    worker_pods: int
+    users: int
+    # Unknown for tests without vanilla specs, e.g. custom load shapes
+    duration_seconds: int | None
+
+    @staticmethod
+    def from_test_config(index: int, test_key: str, test_config: TestConfig, record: CompactCustomResource) -> "ScheduledTest":
+        """
+        Describe the load of a test.
+
+        :param index: position of the test in the configuration
+        :param test_key: test key
+        :param test_config: test configuration
+        :param record: custom resource built from the test configuration, holding the resolved worker replicas
+        :return: Scheduled test
+        """
+        vanilla_specs = test_config.vanilla_specs
+        if vanilla_specs is not None and not (test_config.expert_mode and test_config.expert_mode.enabled):
+            users, duration_seconds = vanilla_specs.users, vanilla_specs.run_time_seconds
+        else:
+            hint = test_config.worker_capacity.users if test_config.worker_capacity is not None else None
+            users, duration_seconds = hint or 0, None
+        return ScheduledTest(index, test_key, record.name, record.worker_replicas, users, duration_seconds)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the plan entry of the test."""
+        return {
+            "test": self.test_key,
+            "name": self.name,
+            "worker_pods": self.worker_pods,
+            "users": self.users,
+            "duration_seconds": self.duration_seconds,
+        }
+
+
+@dataclass
+class Wave:
+    """Tests running at the same time."""
+
+    index: int
+    tests: list[ScheduledTest] = field(default_factory=list)
+
+    @property
+    def directory(self) -> str:
+        """Directory of the wave, relative to the schedule output directory."""
+        return WAVE_DIRECTORY_TEMPLATE.format(index=self.index)
+
+    @property
+    def worker_pods(self) -> int:
+        """Total number of worker pods of the wave."""
+        return sum(test.worker_pods for test in self.tests)
+
+    @property
+    def users(self) -> int:
+        """Total number of users of the wave."""
+        return sum(test.users for test in self.tests)
+
+    @property
+    def duration_seconds(self) -> int:
+        """Duration of the wave, that of its longest test of known duration."""
+        return max((test.duration_seconds or 0 for test in self.tests), default=0)
+
+
+@dataclass
+class SchedulePlan:
+    """Ordered waves of a schedule, each wave is run once the previous one is over."""
+
+    # Caps on the total worker pods and users of a wave, 0 when not capped
+    max_worker_pods: int
+    max_users: int
+    waves: list[Wave] = field(default_factory=list)
+
+    @property
+    def duration_seconds(self) -> int:
+        """Duration of the whole schedule."""
+        return sum(wave.duration_seconds for wave in self.waves)
+
+    def over_capacity(self, wave: Wave) -> bool:
+        """Check if a wave exceeds the caps, only happens to a wave holding a single test larger than them."""
+        return bool(self.max_worker_pods and wave.worker_pods > self.max_worker_pods) or bool(
+            self.max_users and wave.users > self.max_users
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the plan, as written to the plan file."""
+        return {
+            "max_worker_pods": self.max_worker_pods or None,
+            "max_users": self.max_users or None,
+            "duration_seconds": self.duration_seconds,
+            "waves": [
+                {
+                    "wave": wave.index,
+                    "directory": wave.directory,
+                    "duration_seconds": wave.duration_seconds,
+                    "worker_pods": wave.worker_pods,
+                    "users": wave.users,
+                    "over_capacity": self.over_capacity(wave),
+                    "tests": [test.to_dict() for test in wave.tests],
+                }
+                for wave in self.waves
+            ],
+        }
+
+    def to_json(self) -> str:
+        """Serialize the plan to JSON."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def summary(self) -> str:
+        """Human readable summary of the waves."""
+        lines = [
+            f"{wave.directory}: {len(wave.tests)} tests, {wave.worker_pods} worker pods, {wave.users} users, "
+            f"{format_duration(wave.duration_seconds)}" + (" (over capacity)" if self.over_capacity(wave) else "")
+            for wave in self.waves
+        ]
+        tests = sum(len(wave.tests) for wave in self.waves)
+        lines.append(f"Scheduled {tests} tests in {len(self.waves)} waves, lasting {format_duration(self.duration_seconds)}.")
+        return "\n".join(lines)
+
+
+class _CapacityTree:
+    """
+    Segment tree over the remaining capacity of the waves.
+
+    Leaves hold the remaining worker pods and users of each wave, waves not opened yet being empty, inner nodes hold the
+    largest remaining capacity below them. The first wave a test fits in is found by descending the leftmost branch with
+    enough capacity, in O(log n) when a single cap is set.
+    """
+
+    def __init__(self, size: int, max_worker_pods: float, max_users: float) -> None:
+        """
+        Initialize the tree.
+
+        :param size: maximum number of waves
+        :param max_worker_pods: worker pods capacity of a wave
+        :param max_users: users capacity of a wave
+        """
+        self.leaves = 1 << max(size - 1, 0).bit_length()
+        self.worker_pods = [max_worker_pods] * (2 * self.leaves)
+        self.users = [max_users] * (2 * self.leaves)
+
+    def first_fit(self, worker_pods: int, users: int) -> int | None:
+        """Get the index of the first wave with enough remaining capacity, None if even an empty wave is too small."""
+        nodes = [1]
+        while nodes:
+            node = nodes.pop()
+            # With both caps set, a branch may hold enough of each in different waves, its right sibling is tried next
+            if self.worker_pods[node] < worker_pods or self.users[node] < users:
+                continue
+            if node >= self.leaves:
+                return node - self.leaves
+            nodes.extend((2 * node + 1, 2 * node))
+        return None
+
+    def consume(self, index: int, worker_pods: float, users: float) -> None:
+        """Remove capacity from a wave."""
+        node = index + self.leaves
+        self.worker_pods[node] -= worker_pods
+        self.users[node] -= users
+        node //= 2
+        while node:
+            self.worker_pods[node] = max(self.worker_pods[2 * node], self.worker_pods[2 * node + 1])
+            self.users[node] = max(self.users[2 * node], self.users[2 * node + 1])
+            node //= 2
+
+
+class WaveScheduler:
+    """
+    Capacity aware test scheduler.
+
+    Tests are bin-packed into waves whose total worker pods and users stay under the configured caps, so that tests run
+    wave after wave without oversubscribing the cluster.
+    """
+
+    @staticmethod
+    def schedule(
+        paths: list[str],
+        output_dir: str,
+        max_worker_pods: int = 0,
+        max_users: int = 0,
+        input_format: DataFormat = DataFormat.YAML,
+        output_format: DataFormat = DataFormat.YAML,
+        cache: ConfigurationCache | None = None,
+    ) -> SchedulePlan:
+        """
+        Schedule the tests of a configuration, writing the custom resources of each wave to its own directory.
+
+        :param paths: configuration files, directories or glob patterns
+        :param output_dir: output directory
+        :param max_worker_pods: cap on the total worker pods of a wave, 0 when not capped
+        :param max_users: cap on the total users of a wave, 0 when not capped
+        :param input_format: configuration files format
+        :param output_format: custom resources format
+        :param cache: cache of validated configurations
+        :return: Schedule plan
+        """
+        configuration = ConfigurationSources.load(paths, input_format, cache=cache)
+        batch = Helpers.build_custom_resource_batch(configuration)
+
+        tests = [
+            ScheduledTest.from_test_config(index, test_key, test_config, record)
+            for index, ((test_key, test_config), record) in enumerate(zip(configuration.configurations.items(), batch.records))
+        ]
+        unknown = [test.test_key for test in tests if test.duration_seconds is None]
+        if unknown:
+            log.warning(f"Duration of tests without vanilla specs is unknown, their wave may last longer than planned: {unknown}")
+
+        with span("schedule"):
+            plan = WaveScheduler.pack(tests, max_worker_pods, max_users)
+        WaveScheduler.write(plan, batch, output_dir, output_format)
+        return plan
+
+    @staticmethod
+    def pack(tests: list[ScheduledTest], max_worker_pods: int = 0, max_users: int = 0) -> SchedulePlan:
+        """
+        Bin-pack tests into waves, first fit by decreasing duration.
+
+        Tests are placed longest first, into the first wave they fit in. A wave thus lasts as long as the test that opened
+        it, and tests of similar durations share waves. Sorting dominates, packing takes O(n log n) overall. A test larger
+        than the caps on its own gets a wave to itself.
+
+        :param tests: tests to schedule
+        :param max_worker_pods: cap on the total worker pods of a wave, 0 when not capped
+        :param max_users: cap on the total users of a wave, 0 when not capped
+        :return: Schedule plan
+        """
+        plan = SchedulePlan(max_worker_pods, max_users)
+        tree = _CapacityTree(len(tests), max_worker_pods or math.inf, max_users or math.inf)
+
+        for test in sorted(tests, key=lambda test: (-(test.duration_seconds or 0), -test.worker_pods, -test.users)):
+            index = tree.first_fit(test.worker_pods, test.users)
+            if index is None:
+                log.warning(f"Test {test.test_key} exceeds the wave capacity on its own, it is scheduled alone.")
+                index = len(plan.waves)
+                tree.consume(index, math.inf, math.inf)
+            else:
+                tree.consume(index, test.worker_pods, test.users)
+
+            if index == len(plan.waves):
+                plan.waves.append(Wave(index + 1))
+            plan.waves[index].tests.append(test)
+
+        return plan
+
+    @staticmethod
+    def write(plan: SchedulePlan, batch: CustomResourceBatch, output_dir: str, output_format: DataFormat = DataFormat.YAML) -> None:
+        """
+        Write the custom resources of each wave to its own directory, along with the plan.
+
+        :param plan: schedule plan
+        :param batch: custom resources, in configuration order
+        :param output_dir: output directory
+        :param output_format: custom resources format
+        """
+        output_path = pathlib.Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        # Waves left by a previous schedule would be run along with the current ones
+        for path in output_path.iterdir():
+            if path.is_dir() and re.fullmatch(WAVE_DIRECTORY_PATTERN, path.name):
+                shutil.rmtree(path)
+
+        for wave in plan.waves:
+            Helpers.write_cr_files((batch[test.index] for test in wave.tests), str(output_path / wave.directory), output_format)
+
+        (output_path / PLAN_FILE_NAME).write_text(plan.to_json())
+        log.info(f"Wrote the {len(plan.waves)} waves plan at {output_path / PLAN_FILE_NAME}.")
@@ -0,0 +1 @@
+"""Configuration schema package."""
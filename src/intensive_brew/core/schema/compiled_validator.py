@@ -0,0 +1,751 @@
+"""
+Configuration validator, compiled from the configuration JSON Schema.
+
+Generated by `intensive_brew.core.schema.compiler`, do not edit. Regenerate it with `poe generate-validator`.
+"""
+import re
+from collections.abc import Callable
+from typing import Any
+
+_Validator = Callable[[Any, str, list[str]], bool]
+
+# URI with a scheme and a host, surrounding whitespace is ignored
+_URI = re.compile(r"[a-zA-Z][a-zA-Z0-9+\-.]+://(?:[^\s/?#@]*@)?(?:\[[0-9a-fA-F:.]+\]|[^\s/:?#@\[\]]+)(?::\d+)?(?:[/?#]\S*)?")
+
+_NO_PROPERTIES: dict[str, _Validator] = {}
+
+
+def validate(data: Any) -> list[str]:
+    """
+    Validate a configuration against the configuration JSON Schema.
+
+    :param data: configuration, as loaded from a YAML or JSON file
+    :return: Validation errors, `<path>: <message>`, empty when the configuration is valid
+    """
+    errors: list[str] = []
+    _validate_0(data, "$", errors)
+    # A value may fail the same check through several subschemas
+    return list(dict.fromkeys(errors))
+
+
+def _fail(errors: list[str], path: str, message: str) -> bool:
+    """Record an error."""
+    errors.append(f"{path}: {message}")
+    return False
+
+
+def _check(condition: bool, errors: list[str], path: str, message: str) -> bool:
+    """Record an error unless the condition holds."""
+    return condition or _fail(errors, path, message)
+
+
+def _is_integer(data: Any) -> bool:
+    """Check if a value is a JSON integer."""
+    return isinstance(data, int) and not isinstance(data, bool)
+
+
+def _is_number(data: Any) -> bool:
+    """Check if a value is a JSON number."""
+    return isinstance(data, (int, float)) and not isinstance(data, bool)
+
+
+def _equals(data: Any, value: Any) -> bool:
+    """Compare two values as JSON values, booleans are not equal to numbers."""
+    return isinstance(data, bool) == isinstance(value, bool) and bool(data == value)
+
+
+def _check_required(data: Any, names: tuple[str, ...], path: str, errors: list[str]) -> bool:
+    """Check that an object has the required properties."""
+    missing = [name for name in names if name not in data] if isinstance(data, dict) else []
+    for name in missing:
+        _fail(errors, path, f"'{name}' is a required property")
+    return not missing
+
+
+def _check_properties(data: Any, properties: dict[str, _Validator], path: str, errors: list[str]) -> bool:
+    """Check the declared properties of an object."""
+    valid = True
+    if isinstance(data, dict):
+        # Objects usually set a few of their declared properties, only those are looked up
+        for name, value in data.items():
+            validator = properties.get(name)
+            if validator is not None:
+                valid = validator(value, f"{path}.{name}", errors) and valid
+    return valid
+
+
+def _check_additional_properties(data: Any, properties: dict[str, _Validator], validator: _Validator, path: str, errors: list[str]) -> bool:
+    """Check the properties of an object that aren't declared."""
+    valid = True
+    if isinstance(data, dict):
+        for name, value in data.items():
+            if name not in properties:
+                valid = validator(value, f"{path}.{name}", errors) and valid
+    return valid
+
+
+def _check_items(data: Any, validator: _Validator, path: str, errors: list[str]) -> bool:
+    """Check the items of an array."""
+    valid = True
+    if isinstance(data, list):
+        for index, item in enumerate(data):
+            valid = validator(item, f"{path}[{index}]", errors) and valid
+    return valid
+
+
+def _check_min_items(data: Any, minimum: int, path: str, errors: list[str]) -> bool:
+    """Check the length of an array."""
+    return not isinstance(data, list) or _check(len(data) >= minimum, errors, path, f"should have at least {minimum} items")
+
+
+def _check_unique_items(data: Any, path: str, errors: list[str]) -> bool:
+    """Check that the items of an array are distinct."""
+    if not isinstance(data, list):
+        return True
+    unique = all(not _equals(item, other) for index, item in enumerate(data) for other in data[index + 1 :])
+    return _check(unique, errors, path, "has non-unique items")
+
+
+def _check_length(data: Any, minimum: int, maximum: int | None, path: str, errors: list[str]) -> bool:
+    """Check the length of a string."""
+    if not isinstance(data, str):
+        return True
+    valid = _check(len(data) >= minimum, errors, path, f"should have at least {minimum} characters")
+    return _check(maximum is None or len(data) <= maximum, errors, path, f"should have at most {maximum} characters") and valid
+
+
+def _check_minimum(data: Any, minimum: float, exclusive: bool, path: str, errors: list[str]) -> bool:
+    """Check the lower bound of a number."""
+    if not _is_number(data):
+        return True
+    if exclusive:
+        return _check(data > minimum, errors, path, f"should be greater than {minimum}")
+    return _check(data >= minimum, errors, path, f"should be greater than or equal to {minimum}")
+
+
+def _check_pattern(data: Any, pattern: re.Pattern[str], path: str, errors: list[str]) -> bool:
+    """Check that a string matches a pattern."""
+    return not isinstance(data, str) or _check(bool(pattern.search(data)), errors, path, f"does not match '{pattern.pattern}'")
+
+
+def _check_uri(data: Any, path: str, errors: list[str]) -> bool:
+    """Check that a string is a URI."""
+    return not isinstance(data, str) or _check(bool(_URI.fullmatch(data.strip())), errors, path, "is not a valid URI")
+
+
+def _check_enum(data: Any, values: tuple[Any, ...], path: str, errors: list[str]) -> bool:
+    """Check that a value is one of the allowed values."""
+    return _check(any(_equals(data, value) for value in values), errors, path, f"is not one of {list(values)}")
+
+
+def _check_const(data: Any, value: Any, path: str, errors: list[str]) -> bool:
+    """Check that a value is the allowed value."""
+    return _check(_equals(data, value), errors, path, f"should be {value!r}")
+
+
+def _check_any_of(data: Any, validators: tuple[_Validator, ...], path: str, errors: list[str]) -> bool:
+    """Check that a value is valid under at least one of the schemas."""
+    valid = any(validator(data, path, []) for validator in validators)
+    return _check(valid, errors, path, "is not valid under any of the given schemas")
+
+
+def _check_nullable(data: Any, validator: _Validator, path: str, errors: list[str]) -> bool:
+    """Check a value that may be null."""
+    return data is None or validator(data, path, errors)
+
+
+def _check_not(data: Any, validator: _Validator, path: str, errors: list[str]) -> bool:
+    """Check that a value is not valid under the schema."""
+    return _check(not validator(data, path, []), errors, path, "should not be valid under the given schema")
+
+
+def _check_if(
+    data: Any, condition: _Validator, then: _Validator | None, otherwise: _Validator | None, path: str, errors: list[str]
+) -> bool:
+    """Check a value against the schema selected by the condition."""
+    validator = then if condition(data, path, []) else otherwise
+    return validator is None or validator(data, path, errors)
+
+
+def _validate_any(data: Any, path: str, errors: list[str]) -> bool:
+    """Accept any value."""
+    return True
+
+
+def _reject(data: Any, path: str, errors: list[str]) -> bool:
+    """Reject any value."""
+    return _fail(errors, path, "is not allowed")
+
+
+def _validate_5(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, bool):
+        return _fail(errors, path, "is not of type 'boolean'")
+    return True
+
+
+def _validate_6(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, str):
+        return _fail(errors, path, "is not of type 'string'")
+    return True
+
+
+def _validate_4(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, dict):
+        return _fail(errors, path, "is not of type 'object'")
+    valid = _check_required(data, _REQUIRED_4, path, errors)
+    valid = _check_properties(data, _PROPERTIES_4, path, errors) and valid
+    return valid
+
+
+def _validate_3(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_nullable(data, _validate_4, path, errors)
+
+
+def _validate_7(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_nullable(data, _validate_6, path, errors)
+
+
+def _validate_8(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_nullable(data, _validate_5, path, errors)
+
+
+def _validate_11(data: Any, path: str, errors: list[str]) -> bool:
+    if not _is_integer(data):
+        return _fail(errors, path, "is not of type 'integer'")
+    return True
+
+
+def _validate_12(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, str):
+        return _fail(errors, path, "is not of type 'string'")
+    return _check_pattern(data, _PATTERN_12, path, errors)
+
+
+def _validate_13(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, str):
+        return _fail(errors, path, "is not of type 'string'")
+    valid = _check_length(data, 1, 65536, path, errors)
+    valid = _check_uri(data, path, errors) and valid
+    return valid
+
+
+def _validate_10(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, dict):
+        return _fail(errors, path, "is not of type 'object'")
+    valid = _check_required(data, _REQUIRED_10, path, errors)
+    valid = _check_properties(data, _PROPERTIES_10, path, errors) and valid
+    return valid
+
+
+def _validate_9(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_nullable(data, _validate_10, path, errors)
+
+
+def _validate_16(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, str):
+        return _fail(errors, path, "is not of type 'string'")
+    return _check_enum(data, _ENUM_16, path, errors)
+
+
+def _validate_15(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_any_of(data, _ANY_OF_15, path, errors)
+
+
+def _validate_14(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_nullable(data, _validate_15, path, errors)
+
+
+def _validate_19(data: Any, path: str, errors: list[str]) -> bool:
+    if not _is_integer(data):
+        return _fail(errors, path, "is not of type 'integer'")
+    return _check_minimum(data, 0, True, path, errors)
+
+
+def _validate_20(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_nullable(data, _validate_19, path, errors)
+
+
+def _validate_18(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, dict):
+        return _fail(errors, path, "is not of type 'object'")
+    return _check_properties(data, _PROPERTIES_18, path, errors)
+
+
+def _validate_17(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_nullable(data, _validate_18, path, errors)
+
+
+def _validate_23(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, dict):
+        return _fail(errors, path, "is not of type 'object'")
+    return _check_additional_properties(data, _NO_PROPERTIES, _validate_6, path, errors)
+
+
+def _validate_22(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, dict):
+        return _fail(errors, path, "is not of type 'object'")
+    return _check_properties(data, _PROPERTIES_22, path, errors)
+
+
+def _validate_21(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_nullable(data, _validate_22, path, errors)
+
+
+def _validate_25(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, dict):
+        return _fail(errors, path, "is not of type 'object'")
+    return _check_properties(data, _PROPERTIES_25, path, errors)
+
+
+def _validate_24(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_nullable(data, _validate_25, path, errors)
+
+
+def _validate_29(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, str):
+        return _fail(errors, path, "is not of type 'string'")
+    return _check_enum(data, _ENUM_29, path, errors)
+
+
+def _validate_30(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, str):
+        return _fail(errors, path, "is not of type 'string'")
+    return _check_enum(data, _ENUM_30, path, errors)
+
+
+def _validate_28(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, dict):
+        return _fail(errors, path, "is not of type 'object'")
+    valid = _check_required(data, _REQUIRED_28, path, errors)
+    valid = _check_properties(data, _PROPERTIES_28, path, errors) and valid
+    return valid
+
+
+def _validate_27(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, list):
+        return _fail(errors, path, "is not of type 'array'")
+    return _check_items(data, _validate_28, path, errors)
+
+
+def _validate_26(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_nullable(data, _validate_27, path, errors)
+
+
+def _validate_34(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, dict):
+        return _fail(errors, path, "is not of type 'object'")
+    return _check_properties(data, _PROPERTIES_34, path, errors)
+
+
+def _validate_33(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_nullable(data, _validate_34, path, errors)
+
+
+def _validate_32(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, dict):
+        return _fail(errors, path, "is not of type 'object'")
+    return _check_properties(data, _PROPERTIES_32, path, errors)
+
+
+def _validate_31(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_nullable(data, _validate_32, path, errors)
+
+
+def _validate_38(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, list):
+        return _fail(errors, path, "is not of type 'array'")
+    valid = _check_items(data, _validate_11, path, errors)
+    valid = _check_min_items(data, 1, path, errors) and valid
+    valid = _check_unique_items(data, path, errors) and valid
+    return valid
+
+
+def _validate_37(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_nullable(data, _validate_38, path, errors)
+
+
+def _validate_40(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, list):
+        return _fail(errors, path, "is not of type 'array'")
+    valid = _check_items(data, _validate_12, path, errors)
+    valid = _check_min_items(data, 1, path, errors) and valid
+    valid = _check_unique_items(data, path, errors) and valid
+    return valid
+
+
+def _validate_39(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_nullable(data, _validate_40, path, errors)
+
+
+def _validate_42(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, list):
+        return _fail(errors, path, "is not of type 'array'")
+    valid = _check_items(data, _validate_13, path, errors)
+    valid = _check_min_items(data, 1, path, errors) and valid
+    valid = _check_unique_items(data, path, errors) and valid
+    return valid
+
+
+def _validate_41(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_nullable(data, _validate_42, path, errors)
+
+
+def _validate_36(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, dict):
+        return _fail(errors, path, "is not of type 'object'")
+    return _check_properties(data, _PROPERTIES_36, path, errors)
+
+
+def _validate_35(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_nullable(data, _validate_36, path, errors)
+
+
+def _validate_46(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_const(data, True, path, errors)
+
+
+def _validate_45(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, dict):
+        return _fail(errors, path, "is not of type 'object'")
+    valid = _check_required(data, _REQUIRED_45, path, errors)
+    valid = _check_properties(data, _PROPERTIES_45, path, errors) and valid
+    return valid
+
+
+def _validate_44(data: Any, path: str, errors: list[str]) -> bool:
+    valid = _check_required(data, _REQUIRED_44, path, errors)
+    valid = _check_properties(data, _PROPERTIES_44, path, errors) and valid
+    return valid
+
+
+def _validate_47(data: Any, path: str, errors: list[str]) -> bool:
+    valid = _check_required(data, _REQUIRED_47, path, errors)
+    valid = _check_properties(data, _PROPERTIES_47, path, errors) and valid
+    return valid
+
+
+def _validate_43(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_if(data, _validate_44, None, _validate_47, path, errors)
+
+
+def _validate_52(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_const(data, False, path, errors)
+
+
+def _validate_51(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_not(data, _validate_52, path, errors)
+
+
+def _validate_50(data: Any, path: str, errors: list[str]) -> bool:
+    valid = _check_required(data, _REQUIRED_50, path, errors)
+    valid = _check_properties(data, _PROPERTIES_50, path, errors) and valid
+    return valid
+
+
+def _validate_49(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_any_of(data, _ANY_OF_49, path, errors)
+
+
+def _validate_54(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, dict):
+        return _fail(errors, path, "is not of type 'object'")
+    return True
+
+
+def _validate_53(data: Any, path: str, errors: list[str]) -> bool:
+    valid = _check_required(data, _REQUIRED_53, path, errors)
+    valid = _check_properties(data, _PROPERTIES_53, path, errors) and valid
+    return valid
+
+
+def _validate_48(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_if(data, _validate_49, None, _validate_53, path, errors)
+
+
+def _validate_57(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_const(data, "auto", path, errors)
+
+
+def _validate_56(data: Any, path: str, errors: list[str]) -> bool:
+    valid = _check_required(data, _REQUIRED_56, path, errors)
+    valid = _check_properties(data, _PROPERTIES_56, path, errors) and valid
+    return valid
+
+
+def _validate_59(data: Any, path: str, errors: list[str]) -> bool:
+    valid = _check_required(data, _REQUIRED_59, path, errors)
+    valid = _check_properties(data, _PROPERTIES_59, path, errors) and valid
+    valid = _check_not(data, _validate_44, path, errors) and valid
+    return valid
+
+
+def _validate_61(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, dict):
+        return _fail(errors, path, "is not of type 'object'")
+    valid = _check_required(data, _REQUIRED_61, path, errors)
+    valid = _check_properties(data, _PROPERTIES_61, path, errors) and valid
+    return valid
+
+
+def _validate_60(data: Any, path: str, errors: list[str]) -> bool:
+    valid = _check_required(data, _REQUIRED_60, path, errors)
+    valid = _check_properties(data, _PROPERTIES_60, path, errors) and valid
+    return valid
+
+
+def _validate_58(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_any_of(data, _ANY_OF_58, path, errors)
+
+
+def _validate_55(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_if(data, _validate_56, _validate_58, None, path, errors)
+
+
+def _validate_66(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, list):
+        return _fail(errors, path, "is not of type 'array'")
+    return True
+
+
+def _validate_65(data: Any, path: str, errors: list[str]) -> bool:
+    valid = _check_required(data, _REQUIRED_65, path, errors)
+    valid = _check_properties(data, _PROPERTIES_65, path, errors) and valid
+    return valid
+
+
+def _validate_67(data: Any, path: str, errors: list[str]) -> bool:
+    valid = _check_required(data, _REQUIRED_67, path, errors)
+    valid = _check_properties(data, _PROPERTIES_67, path, errors) and valid
+    return valid
+
+
+def _validate_68(data: Any, path: str, errors: list[str]) -> bool:
+    valid = _check_required(data, _REQUIRED_68, path, errors)
+    valid = _check_properties(data, _PROPERTIES_68, path, errors) and valid
+    return valid
+
+
+def _validate_69(data: Any, path: str, errors: list[str]) -> bool:
+    valid = _check_required(data, _REQUIRED_69, path, errors)
+    valid = _check_properties(data, _PROPERTIES_69, path, errors) and valid
+    return valid
+
+
+def _validate_70(data: Any, path: str, errors: list[str]) -> bool:
+    valid = _check_required(data, _REQUIRED_70, path, errors)
+    valid = _check_properties(data, _PROPERTIES_70, path, errors) and valid
+    return valid
+
+
+def _validate_64(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, dict):
+        return _fail(errors, path, "is not of type 'object'")
+    return _check_any_of(data, _ANY_OF_64, path, errors)
+
+
+def _validate_63(data: Any, path: str, errors: list[str]) -> bool:
+    valid = _check_required(data, _REQUIRED_63, path, errors)
+    valid = _check_properties(data, _PROPERTIES_63, path, errors) and valid
+    return valid
+
+
+def _validate_62(data: Any, path: str, errors: list[str]) -> bool:
+    return _check_if(data, _validate_63, _validate_59, None, path, errors)
+
+
+def _validate_2(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, dict):
+        return _fail(errors, path, "is not of type 'object'")
+    valid = _check_properties(data, _PROPERTIES_2, path, errors)
+    valid = _validate_43(data, path, errors) and valid
+    valid = _validate_48(data, path, errors) and valid
+    valid = _validate_55(data, path, errors) and valid
+    valid = _validate_62(data, path, errors) and valid
+    return valid
+
+
+def _validate_1(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, dict):
+        return _fail(errors, path, "is not of type 'object'")
+    return _check_additional_properties(data, _NO_PROPERTIES, _validate_2, path, errors)
+
+
+def _validate_0(data: Any, path: str, errors: list[str]) -> bool:
+    if not isinstance(data, dict):
+        return _fail(errors, path, "is not of type 'object'")
+    valid = _check_required(data, _REQUIRED_0, path, errors)
+    valid = _check_properties(data, _PROPERTIES_0, path, errors) and valid
+    return valid
+
+
+# Schema tables, referenced by the validators above
+_REQUIRED_0 = ("configurations",)
+_REQUIRED_4 = (
+    "enabled",
+    "masterCommandSeed",
+    "workerCommandSeed",
+)
+_PROPERTIES_4: dict[str, _Validator] = {
+    "enabled": _validate_5,
+    "masterCommandSeed": _validate_6,
+    "workerCommandSeed": _validate_6,
+}
+_REQUIRED_10 = (
+    "users",
+    "spawn_rate",
+    "target_host",
+)
+_PATTERN_12 = re.compile("^(?:\\d+[hms])+\\Z")
+_PROPERTIES_10: dict[str, _Validator] = {
+    "users": _validate_11,
+    "spawn_rate": _validate_11,
+    "run_time": _validate_12,
+    "termination_timeout": _validate_11,
+    "target_host": _validate_13,
+}
+_ENUM_16 = ("auto",)
+_ANY_OF_15: tuple[_Validator, ...] = (
+    _validate_11,
+    _validate_16,
+)
+_PROPERTIES_18: dict[str, _Validator] = {
+    "users_per_worker": _validate_19,
+    "spawn_rate_per_worker": _validate_19,
+    "users": _validate_20,
+    "spawn_rate": _validate_20,
+}
+_PROPERTIES_22: dict[str, _Validator] = {
+    "master": _validate_23,
+    "worker": _validate_23,
+}
+_PROPERTIES_25: dict[str, _Validator] = {
+    "master": _validate_23,
+    "worker": _validate_23,
+}
+_REQUIRED_28 = (
+    "key",
+    "operator",
+    "effect",
+)
+_ENUM_29 = (
+    "Exists",
+    "Equal",
+)
+_ENUM_30 = (
+    "NoSchedule",
+    "PreferNoSchedule",
+    "NoExecute",
+)
+_PROPERTIES_28: dict[str, _Validator] = {
+    "key": _validate_6,
+    "operator": _validate_29,
+    "effect": _validate_30,
+    "value": _validate_7,
+}
+_PROPERTIES_34: dict[str, _Validator] = {
+    "requiredDuringSchedulingIgnoredDuringExecution": _validate_23,
+}
+_PROPERTIES_32: dict[str, _Validator] = {
+    "nodeAffinity": _validate_33,
+}
+_PROPERTIES_36: dict[str, _Validator] = {
+    "users": _validate_37,
+    "spawn_rate": _validate_37,
+    "run_time": _validate_39,
+    "termination_timeout": _validate_37,
+    "target_host": _validate_41,
+    "worker_replicas": _validate_37,
+}
+_PROPERTIES_2: dict[str, _Validator] = {
+    "expert_mode": _validate_3,
+    "entry_point": _validate_7,
+    "custom_load_shapes": _validate_8,
+    "vanilla_specs": _validate_9,
+    "image": _validate_7,
+    "worker_replicas": _validate_14,
+    "worker_capacity": _validate_17,
+    "configmap": _validate_7,
+    "labels": _validate_21,
+    "annotations": _validate_24,
+    "tolerations": _validate_26,
+    "affinity": _validate_31,
+    "matrix": _validate_35,
+}
+_REQUIRED_44 = ("expert_mode",)
+_REQUIRED_45 = ("enabled",)
+_PROPERTIES_45: dict[str, _Validator] = {
+    "enabled": _validate_46,
+}
+_PROPERTIES_44: dict[str, _Validator] = {
+    "expert_mode": _validate_45,
+}
+_REQUIRED_47 = ("entry_point",)
+_PROPERTIES_47: dict[str, _Validator] = {
+    "entry_point": _validate_6,
+}
+_REQUIRED_50 = ("custom_load_shapes",)
+_PROPERTIES_50: dict[str, _Validator] = {
+    "custom_load_shapes": _validate_51,
+}
+_ANY_OF_49: tuple[_Validator, ...] = (
+    _validate_44,
+    _validate_50,
+)
+_REQUIRED_53 = ("vanilla_specs",)
+_PROPERTIES_53: dict[str, _Validator] = {
+    "vanilla_specs": _validate_54,
+}
+_REQUIRED_56 = ("worker_replicas",)
+_PROPERTIES_56: dict[str, _Validator] = {
+    "worker_replicas": _validate_57,
+}
+_REQUIRED_59 = ("vanilla_specs",)
+_PROPERTIES_59: dict[str, _Validator] = {
+    "vanilla_specs": _validate_54,
+}
+_REQUIRED_60 = ("worker_capacity",)
+_REQUIRED_61 = ("users",)
+_PROPERTIES_61: dict[str, _Validator] = {
+    "users": _validate_11,
+}
+_PROPERTIES_60: dict[str, _Validator] = {
+    "worker_capacity": _validate_61,
+}
+_ANY_OF_58: tuple[_Validator, ...] = (
+    _validate_59,
+    _validate_60,
+)
+_REQUIRED_63 = ("matrix",)
+_REQUIRED_65 = ("users",)
+_PROPERTIES_65: dict[str, _Validator] = {
+    "users": _validate_66,
+}
+_REQUIRED_67 = ("spawn_rate",)
+_PROPERTIES_67: dict[str, _Validator] = {
+    "spawn_rate": _validate_66,
+}
+_REQUIRED_68 = ("run_time",)
+_PROPERTIES_68: dict[str, _Validator] = {
+    "run_time": _validate_66,
+}
+_REQUIRED_69 = ("termination_timeout",)
+_PROPERTIES_69: dict[str, _Validator] = {
+    "termination_timeout": _validate_66,
+}
+_REQUIRED_70 = ("target_host",)
+_PROPERTIES_70: dict[str, _Validator] = {
+    "target_host": _validate_66,
+}
+_ANY_OF_64: tuple[_Validator, ...] = (
+    _validate_65,
+    _validate_67,
+    _validate_68,
+    _validate_69,
+    _validate_70,
+)
+_PROPERTIES_63: dict[str, _Validator] = {
+    "matrix": _validate_64,
+}
+_PROPERTIES_0: dict[str, _Validator] = {
+    "configurations": _validate_1,
+}
@@ -0,0 +1,477 @@
+"""
+JSON Schema compiler package.
+
+Run as `python -m intensive_brew.core.schema.compiler` to regenerate the compiled configuration validator.
+"""
+import json
+import logging
+import pathlib
+from typing import Any
+
+from intensive_brew.core.schema.constants import COMPILED_VALIDATOR_MODULE
+
+log = logging.getLogger(__name__)
+
+# Keywords carrying no validation
+IGNORED_KEYWORDS = frozenset({"$schema", "$id", "title", "description", "default", "examples", "definitions"})
+
+# Python check of each JSON type, JSON booleans are not numbers
+TYPE_CHECKS = {
+    "object": "isinstance(data, dict)",
+    "array": "isinstance(data, list)",
+    "string": "isinstance(data, str)",
+    "integer": "_is_integer(data)",
+    "number": "_is_number(data)",
+    "boolean": "isinstance(data, bool)",
+    "null": "data is None",
+}
+
+_HEADER = '''"""
+Configuration validator, compiled from the configuration JSON Schema.
+
+Generated by `intensive_brew.core.schema.compiler`, do not edit. Regenerate it with `poe generate-validator`.
+"""
+import re
+from collections.abc import Callable
+from typing import Any
+
+_Validator = Callable[[Any, str, list[str]], bool]
+
+# URI with a scheme and a host, surrounding whitespace is ignored
+_URI = re.compile(r"[a-zA-Z][a-zA-Z0-9+\\-.]+://(?:[^\\s/?#@]*@)?(?:\\[[0-9a-fA-F:.]+\\]|[^\\s/:?#@\\[\\]]+)(?::\\d+)?(?:[/?#]\\S*)?")
+
+_NO_PROPERTIES: dict[str, _Validator] = {}
+
+
+def validate(data: Any) -> list[str]:
+    """
+    Validate a configuration against the configuration JSON Schema.
+
+    :param data: configuration, as loaded from a YAML or JSON file
+    :return: Validation errors, `<path>: <message>`, empty when the configuration is valid
+    """
+    errors: list[str] = []
+    _validate_0(data, "$", errors)
+    # A value may fail the same check through several subschemas
+    return list(dict.fromkeys(errors))
+
+
+def _fail(errors: list[str], path: str, message: str) -> bool:
+    """Record an error."""
+    errors.append(f"{path}: {message}")
+    return False
+
+
+def _check(condition: bool, errors: list[str], path: str, message: str) -> bool:
+    """Record an error unless the condition holds."""
+    return condition or _fail(errors, path, message)
+
+
+def _is_integer(data: Any) -> bool:
+    """Check if a value is a JSON integer."""
+    return isinstance(data, int) and not isinstance(data, bool)
+
+
+def _is_number(data: Any) -> bool:
+    """Check if a value is a JSON number."""
+    return isinstance(data, (int, float)) and not isinstance(data, bool)
+
+
+def _equals(data: Any, value: Any) -> bool:
+    """Compare two values as JSON values, booleans are not equal to numbers."""
+    return isinstance(data, bool) == isinstance(value, bool) and bool(data == value)
+
+
+def _check_required(data: Any, names: tuple[str, ...], path: str, errors: list[str]) -> bool:
+    """Check that an object has the required properties."""
+    missing = [name for name in names if name not in data] if isinstance(data, dict) else []
+    for name in missing:
+        _fail(errors, path, f"'{name}' is a required property")
+    return not missing
+
+
+def _check_properties(data: Any, properties: dict[str, _Validator], path: str, errors: list[str]) -> bool:
+    """Check the declared properties of an object."""
+    valid = True
+    if isinstance(data, dict):
+        # Objects usually set a few of their declared properties, only those are looked up
+        for name, value in data.items():
+            validator = properties.get(name)
+            if validator is not None:
+                valid = validator(value, f"{path}.{name}", errors) and valid
+    return valid
+
+
+def _check_additional_properties(data: Any, properties: dict[str, _Validator], validator: _Validator, path: str, errors: list[str]) -> bool:
+    """Check the properties of an object that aren't declared."""
+    valid = True
+    if isinstance(data, dict):
+        for name, value in data.items():
+            if name not in properties:
+                valid = validator(value, f"{path}.{name}", errors) and valid
+    return valid
+
+
+def _check_items(data: Any, validator: _Validator, path: str, errors: list[str]) -> bool:
+    """Check the items of an array."""
+    valid = True
+    if isinstance(data, list):
+        for index, item in enumerate(data):
+            valid = validator(item, f"{path}[{index}]", errors) and valid
+    return valid
+
+
+def _check_min_items(data: Any, minimum: int, path: str, errors: list[str]) -> bool:
+    """Check the length of an array."""
+    return not isinstance(data, list) or _check(len(data) >= minimum, errors, path, f"should have at least {minimum} items")
+
+
+def _check_unique_items(data: Any, path: str, errors: list[str]) -> bool:
+    """Check that the items of an array are distinct."""
+    if not isinstance(data, list):
+        return True
+    unique = all(not _equals(item, other) for index, item in enumerate(data) for other in data[index + 1 :])
+    return _check(unique, errors, path, "has non-unique items")
+
+
+def _check_length(data: Any, minimum: int, maximum: int | None, path: str, errors: list[str]) -> bool:
+    """Check the length of a string."""
+    if not isinstance(data, str):
+        return True
+    valid = _check(len(data) >= minimum, errors, path, f"should have at least {minimum} characters")
+    return _check(maximum is None or len(data) <= maximum, errors, path, f"should have at most {maximum} characters") and valid
+
+
+def _check_minimum(data: Any, minimum: float, exclusive: bool, path: str, errors: list[str]) -> bool:
+    """Check the lower bound of a number."""
+    if not _is_number(data):
+        return True
+    if exclusive:
+        return _check(data > minimum, errors, path, f"should be greater than {minimum}")
+    return _check(data >= minimum, errors, path, f"should be greater than or equal to {minimum}")
+
+
+def _check_pattern(data: Any, pattern: re.Pattern[str], path: str, errors: list[str]) -> bool:
+    """Check that a string matches a pattern."""
+    return not isinstance(data, str) or _check(bool(pattern.search(data)), errors, path, f"does not match '{pattern.pattern}'")
+
+
+def _check_uri(data: Any, path: str, errors: list[str]) -> bool:
+    """Check that a string is a URI."""
+    return not isinstance(data, str) or _check(bool(_URI.fullmatch(data.strip())), errors, path, "is not a valid URI")
+
+
+def _check_enum(data: Any, values: tuple[Any, ...], path: str, errors: list[str]) -> bool:
+    """Check that a value is one of the allowed values."""
+    return _check(any(_equals(data, value) for value in values), errors, path, f"is not one of {list(values)}")
+
+
+def _check_const(data: Any, value: Any, path: str, errors: list[str]) -> bool:
+    """Check that a value is the allowed value."""
+    return _check(_equals(data, value), errors, path, f"should be {value!r}")
+
+
+def _check_any_of(data: Any, validators: tuple[_Validator, ...], path: str, errors: list[str]) -> bool:
+    """Check that a value is valid under at least one of the schemas."""
+    valid = any(validator(data, path, []) for validator in validators)
+    return _check(valid, errors, path, "is not valid under any of the given schemas")
+
+
+def _check_nullable(data: Any, validator: _Validator, path: str, errors: list[str]) -> bool:
+    """Check a value that may be null."""
+    return data is None or validator(data, path, errors)
+
+
+def _check_not(data: Any, validator: _Validator, path: str, errors: list[str]) -> bool:
+    """Check that a value is not valid under the schema."""
+    return _check(not validator(data, path, []), errors, path, "should not be valid under the given schema")
+
+
+def _check_if(
+    data: Any, condition: _Validator, then: _Validator | None, otherwise: _Validator | None, path: str, errors: list[str]
+) -> bool:
+    """Check a value against the schema selected by the condition."""
+    validator = then if condition(data, path, []) else otherwise
+    return validator is None or validator(data, path, errors)
+
+
+def _validate_any(data: Any, path: str, errors: list[str]) -> bool:
+    """Accept any value."""
+    return True
+
+
+def _reject(data: Any, path: str, errors: list[str]) -> bool:
+    """Reject any value."""
+    return _fail(errors, path, "is not allowed")
+'''
+
+
+class SchemaCompiler:
+    """
+    JSON Schema to Python compiler.
+
+    Every schema node is compiled to a function checking a value against it, calling the functions of its subschemas,
+    definitions are compiled once. The generated module needs nothing but the standard library, and checks a value
+    without interpreting the schema. The supported keywords cover the configuration schema, other keywords are rejected
+    rather than silently ignored.
+    """
+
+    def __init__(self, schema: dict[str, Any]) -> None:
+        """
+        Initialize the compiler.
+
+        :param schema: JSON Schema, its definitions may be referenced with `#/definitions/<name>`
+        """
+        self.schema = schema
+        self._functions: list[str] = []
+        self._tables: list[str] = []
+        self._references: dict[str, str] = {}
+        # Validators of the anonymous nodes compiled so far, keyed by their canonical JSON
+        self._nodes: dict[str, str] = {}
+        self._count = 0
+
+    @staticmethod
+    def write_module(path: str = "") -> None:
+        """
+        Compile the configuration schema to the compiled validator module.
+
+        :param path: module path, defaults to the module of the package
+        """
+        from intensive_brew.core.schema.schema import ConfigurationSchema
+
+        path = path or str(pathlib.Path(__file__).parents[2] / COMPILED_VALIDATOR_MODULE)
+        pathlib.Path(path).write_text(SchemaCompiler(ConfigurationSchema.build()).compile())
+        log.info(f"Wrote the compiled configuration validator at {path}.")
+
+    def compile(self) -> str:
+        """
+        Compile the schema.
+
+        :return: Source of a module whose `validate(data)` function returns the validation errors of a value
+        :raises ValueError: if the schema uses an unsupported keyword
+        """
+        self._node(self.schema, self._name())
+        functions = "\n\n\n".join([_HEADER.rstrip("\n"), *self._functions])
+        return "\n".join([functions, "", "", "# Schema tables, referenced by the validators above", *self._tables]) + "\n"
+
+    def _name(self) -> str:
+        """Get the name of a new validator function."""
+        name = f"_validate_{self._count}"
+        self._count += 1
+        return name
+
+    def _node(self, schema: dict[str, Any] | bool, name: str = "") -> str:
+        """
+        Compile a schema node.
+
+        :param schema: schema node
+        :param name: name of the validator, nodes that only reference a definition reuse its validator when not set
+        :return: Name of the validator function
+        """
+        if isinstance(schema, bool):
+            return "_validate_any" if schema else "_reject"
+        keywords = {key: value for key, value in schema.items() if key not in IGNORED_KEYWORDS}
+        if not name and set(keywords) == {"$ref"}:
+            return self._reference(keywords["$ref"])
+        if not name and not keywords:
+            return "_validate_any"
+        # Identical subschemas, e.g. the null branch of every optional field, share their validator
+        key = json.dumps(keywords, sort_keys=True)
+        if not name and key in self._nodes:
+            return self._nodes[key]
+
+        name = name or self._nodes.setdefault(key, self._name())
+        # The name is taken before compiling subschemas, keeping the numbering in document order
+        checks = self._checks(name, keywords)
+        lines = [f"def {name}(data: Any, path: str, errors: list[str]) -> bool:"]
+        if "type" in keywords:
+            types = [keywords["type"]] if isinstance(keywords["type"], str) else keywords["type"]
+            condition = " or ".join(TYPE_CHECKS[json_type] for json_type in types)
+            condition = (
+                "data is not None" if condition == TYPE_CHECKS["null"] else f"not ({condition})" if len(types) > 1 else f"not {condition}"
+            )
+            message = json.dumps("is not of type " + ", ".join(f"'{json_type}'" for json_type in types))
+            lines += [f"    if {condition}:", f"        return _fail(errors, path, {message})"]
+        if not checks:
+            lines.append("    return True")
+        elif len(checks) == 1:
+            lines.append(f"    return {checks[0]}")
+        else:
+            lines.append(f"    valid = {checks[0]}")
+            lines += [f"    valid = {check} and valid" for check in checks[1:]]
+            lines.append("    return valid")
+        self._functions.append("\n".join(lines))
+        return name
+
+    def _checks(self, name: str, keywords: dict[str, Any]) -> list[str]:
+        """Compile the keywords of a schema node, other than its type, into boolean expressions."""
+        unsupported = set(keywords) - set(_KEYWORD_COMPILERS) - {"type", "then", "else"}
+        if unsupported:
+            raise ValueError(f"Unsupported JSON Schema keywords: {sorted(unsupported)}")
+        suffix = name.rsplit("_", 1)[1]
+        checks: list[str] = []
+        # Some compilers handle several related keywords at once
+        for compile_keyword in dict.fromkeys(
+            compile_keyword for keyword, compile_keyword in _KEYWORD_COMPILERS.items() if keyword in keywords
+        ):
+            checks += compile_keyword(self, suffix, keywords)
+        return checks
+
+    def _reference(self, reference: str) -> str:
+        """Compile a referenced definition, once."""
+        if reference not in self._references:
+            if reference == "#":
+                target = self.schema
+            elif reference.startswith("#/definitions/"):
+                target = self.schema["definitions"][reference.removeprefix("#/definitions/")]
+            else:
+                raise ValueError(f"Unsupported reference: {reference}")
+            # Registered before compiling, so that recursive definitions reference themselves
+            self._references[reference] = self._name()
+            self._node(target, self._references[reference])
+        return self._references[reference]
+
+    def _table(self, declaration: str, entries: list[str], opening: str = "(", closing: str = ")") -> None:
+        """Add a module level table, one entry per line so that the generated source is formatted already."""
+        if opening == "(" and len(entries) == 1:
+            self._tables.append(f"{declaration} = ({entries[0]},)")
+        else:
+            self._tables.append("\n".join([f"{declaration} = {opening}", *(f"    {entry}," for entry in entries), closing]))
+
+    def _required(self, suffix: str, keywords: dict[str, Any]) -> list[str]:
+        """Compile `required`."""
+        if not keywords["required"]:
+            return []
+        self._table(f"_REQUIRED_{suffix}", [_literal(name) for name in keywords["required"]])
+        return [f"_check_required(data, _REQUIRED_{suffix}, path, errors)"]
+
+    def _properties(self, suffix: str, keywords: dict[str, Any]) -> list[str]:
+        """Compile `properties`."""
+        if not keywords["properties"]:
+            return []
+        entries = [f"{_literal(key)}: {self._node(subschema)}" for key, subschema in keywords["properties"].items()]
+        self._table(f"_PROPERTIES_{suffix}: dict[str, _Validator]", entries, "{", "}")
+        return [f"_check_properties(data, _PROPERTIES_{suffix}, path, errors)"]
+
+    def _additional_properties(self, suffix: str, keywords: dict[str, Any]) -> list[str]:
+        """Compile `additionalProperties`."""
+        if keywords["additionalProperties"] is True:
+            return []
+        properties = f"_PROPERTIES_{suffix}" if keywords.get("properties") else "_NO_PROPERTIES"
+        if keywords["additionalProperties"] is False:
+            return [f"_check_additional_properties(data, {properties}, _reject, path, errors)"]
+        validator = self._node(keywords["additionalProperties"])
+        return [f"_check_additional_properties(data, {properties}, {validator}, path, errors)"]
+
+    def _items(self, suffix: str, keywords: dict[str, Any]) -> list[str]:
+        """Compile `items`, a single schema for every item."""
+        if isinstance(keywords["items"], list):
+            raise ValueError("Unsupported JSON Schema keyword: items as an array of schemas")
+        return [f"_check_items(data, {self._node(keywords['items'])}, path, errors)"]
+
+    def _min_items(self, suffix: str, keywords: dict[str, Any]) -> list[str]:
+        """Compile `minItems`."""
+        return [f"_check_min_items(data, {keywords['minItems']}, path, errors)"]
+
+    def _unique_items(self, suffix: str, keywords: dict[str, Any]) -> list[str]:
+        """Compile `uniqueItems`."""
+        return ["_check_unique_items(data, path, errors)"] if keywords["uniqueItems"] else []
+
+    def _length(self, suffix: str, keywords: dict[str, Any]) -> list[str]:
+        """Compile `minLength` and `maxLength`."""
+        return [f"_check_length(data, {keywords.get('minLength', 0)}, {keywords.get('maxLength')}, path, errors)"]
+
+    def _minimum(self, suffix: str, keywords: dict[str, Any]) -> list[str]:
+        """Compile `minimum` and `exclusiveMinimum`."""
+        checks = []
+        if "minimum" in keywords:
+            checks.append(f"_check_minimum(data, {keywords['minimum']!r}, False, path, errors)")
+        if "exclusiveMinimum" in keywords:
+            checks.append(f"_check_minimum(data, {keywords['exclusiveMinimum']!r}, True, path, errors)")
+        return checks
+
+    def _pattern(self, suffix: str, keywords: dict[str, Any]) -> list[str]:
+        """Compile `pattern`, anchors keep their ECMA 262 meaning."""
+        pattern: str = keywords["pattern"]
+        # Unlike its ECMA 262 counterpart, `$` also matches before a trailing newline
+        if pattern.endswith("$") and not pattern.endswith("\\$"):
+            pattern = pattern[:-1] + "\\Z"
+        self._tables.append(f"_PATTERN_{suffix} = re.compile({_literal(pattern)})")
+        return [f"_check_pattern(data, _PATTERN_{suffix}, path, errors)"]
+
+    def _format(self, suffix: str, keywords: dict[str, Any]) -> list[str]:
+        """Compile `format`, only URIs are checked, other formats are annotations."""
+        return ["_check_uri(data, path, errors)"] if keywords["format"] == "uri" else []
+
+    def _enum(self, suffix: str, keywords: dict[str, Any]) -> list[str]:
+        """Compile `enum`."""
+        self._table(f"_ENUM_{suffix}", [_literal(value) for value in keywords["enum"]])
+        return [f"_check_enum(data, _ENUM_{suffix}, path, errors)"]
+
+    def _const(self, suffix: str, keywords: dict[str, Any]) -> list[str]:
+        """Compile `const`."""
+        return [f"_check_const(data, {_literal(keywords['const'])}, path, errors)"]
+
+    def _ref(self, suffix: str, keywords: dict[str, Any]) -> list[str]:
+        """Compile `$ref`."""
+        return [f"{self._reference(keywords['$ref'])}(data, path, errors)"]
+
+    def _all_of(self, suffix: str, keywords: dict[str, Any]) -> list[str]:
+        """Compile `allOf`, each subschema is checked in turn."""
+        return [f"{self._node(subschema)}(data, path, errors)" for subschema in keywords["allOf"]]
+
+    def _any_of(self, suffix: str, keywords: dict[str, Any]) -> list[str]:
+        """Compile `anyOf`, a schema or null is checked directly so that the errors of the schema are reported."""
+        if len(keywords["anyOf"]) == 2 and keywords["anyOf"][1] == {"type": "null"}:
+            return [f"_check_nullable(data, {self._node(keywords['anyOf'][0])}, path, errors)"]
+        self._table(f"_ANY_OF_{suffix}: tuple[_Validator, ...]", [self._node(subschema) for subschema in keywords["anyOf"]])
+        return [f"_check_any_of(data, _ANY_OF_{suffix}, path, errors)"]
+
+    def _not(self, suffix: str, keywords: dict[str, Any]) -> list[str]:
+        """Compile `not`."""
+        return [f"_check_not(data, {self._node(keywords['not'])}, path, errors)"]
+
+    def _if(self, suffix: str, keywords: dict[str, Any]) -> list[str]:
+        """Compile `if`, `then` and `else`."""
+        condition = self._node(keywords["if"])
+        then = self._node(keywords["then"]) if "then" in keywords else "None"
+        otherwise = self._node(keywords["else"]) if "else" in keywords else "None"
+        return [f"_check_if(data, {condition}, {then}, {otherwise}, path, errors)"]
+
+
+def _literal(value: Any) -> str:
+    """Write a JSON scalar as a Python literal, strings in double quotes as the code formatter would."""
+    if isinstance(value, str):
+        return json.dumps(value)
+    if value is None or isinstance(value, (bool, int, float)):
+        return repr(value)
+    raise ValueError(f"Unsupported JSON Schema value: {value!r}")
+
+
+# Compilers of the keywords of a schema node, in the order their checks are made
+_KEYWORD_COMPILERS = {
+    "$ref": SchemaCompiler._ref,
+    "required": SchemaCompiler._required,
+    "properties": SchemaCompiler._properties,
+    "additionalProperties": SchemaCompiler._additional_properties,
+    "items": SchemaCompiler._items,
+    "minItems": SchemaCompiler._min_items,
+    "uniqueItems": SchemaCompiler._unique_items,
+    "minLength": SchemaCompiler._length,
+    "maxLength": SchemaCompiler._length,
+    "minimum": SchemaCompiler._minimum,
+    "exclusiveMinimum": SchemaCompiler._minimum,
+    "pattern": SchemaCompiler._pattern,
+    "format": SchemaCompiler._format,
+    "enum": SchemaCompiler._enum,
+    "const": SchemaCompiler._const,
+    "allOf": SchemaCompiler._all_of,
+    "anyOf": SchemaCompiler._any_of,
+    "not": SchemaCompiler._not,
+    "if": SchemaCompiler._if,
+}
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    SchemaCompiler.write_module()
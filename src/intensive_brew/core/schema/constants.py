@@ -0,0 +1,14 @@
+"""Constants for configuration schema package."""
+from intensive_brew.core.yaml.matrix import MATRIX_AXES
+
+# JSON Schema dialect of the exported schema
+JSON_SCHEMA_DIALECT = "http://json-schema.org/draft-07/schema#"
+
+# Identifier of the exported schema
+CONFIGURATION_SCHEMA_ID = "https://github.com/AbdelrhmanHamouda/intensive-brew/configuration.schema.json"
+
+# Module generated from the configuration schema, relative to the package root
+COMPILED_VALIDATOR_MODULE = "core/schema/compiled_validator.py"
+
+# Fields of the vanilla specs a test matrix may list values for, every matrix axis but the worker replicas of the test
+VANILLA_MATRIX_AXES = tuple(name for name in MATRIX_AXES if name != "worker_replicas")
@@ -0,0 +1,113 @@
+"""Configuration JSON Schema package."""
+import copy
+from typing import Any
+
+from pydantic import BaseModel
+
+from intensive_brew.core.dto.utils.duration import DURATION_PATTERN
+from intensive_brew.core.dto.yaml.configuration import Configuration
+from intensive_brew.core.schema.constants import CONFIGURATION_SCHEMA_ID, JSON_SCHEMA_DIALECT, VANILLA_MATRIX_AXES
+
+# Test configuration running in expert mode
+_EXPERT_MODE: dict[str, Any] = {
+    "required": ["expert_mode"],
+    "properties": {"expert_mode": {"type": "object", "required": ["enabled"], "properties": {"enabled": {"const": True}}}},
+}
+
+# Run time of the vanilla specs, matched as a whole
+_RUN_TIME: dict[str, Any] = {"pattern": f"^{DURATION_PATTERN.pattern}$"}
+
+
+class ConfigurationSchema:
+    """
+    JSON Schema of the configuration format.
+
+    The schema starts from the one pydantic derives from the configuration models and adds what their validators check in
+    code: nullable fields, run time durations, matrix axes and the rules tying the sections of a test together, e.g. the
+    entry point being required outside of expert mode. It describes canonical YAML types, the lax coercions pydantic also
+    accepts, e.g. quoted numbers or numbers as strings, are rejected.
+    """
+
+    @staticmethod
+    def build() -> dict[str, Any]:
+        """
+        Build the schema.
+
+        :return: JSON Schema of the configuration
+        """
+        schema = copy.deepcopy(Configuration.schema())
+        definitions = schema["definitions"]
+
+        for model in ConfigurationSchema._models(Configuration):
+            target = schema if model is Configuration else definitions[model.__name__]
+            ConfigurationSchema._allow_null(model, target)
+
+        definitions["VanillaSpecs"]["properties"]["run_time"].update(_RUN_TIME)
+        for name, axis in definitions["Matrix"]["properties"].items():
+            axis["anyOf"][0].update({"minItems": 1, "uniqueItems": True})
+            if name == "run_time":
+                axis["anyOf"][0]["items"].update(_RUN_TIME)
+        definitions["TestConfig"]["allOf"] = ConfigurationSchema._test_rules()
+
+        return {"$schema": JSON_SCHEMA_DIALECT, "$id": CONFIGURATION_SCHEMA_ID, **schema}
+
+    @staticmethod
+    def _models(model: type[BaseModel]) -> list[type[BaseModel]]:
+        """Get a model and every model nested in its fields, each once."""
+        models = [model]
+        for current in models:
+            for field in current.__fields__.values():
+                nested = field.type_
+                if isinstance(nested, type) and issubclass(nested, BaseModel) and nested not in models:
+                    models.append(nested)
+        return models
+
+    @staticmethod
+    def _allow_null(model: type[BaseModel], schema: dict[str, Any]) -> None:
+        """Allow null values for the optional fields of a model."""
+        properties = schema["properties"]
+        for field in model.__fields__.values():
+            if field.allow_none:
+                prop = properties[field.alias]
+                annotations = {key: prop.pop(key) for key in ("title", "default") if key in prop}
+                properties[field.alias] = {**annotations, "anyOf": [prop, {"type": "null"}]}
+
+    @staticmethod
+    def _test_rules() -> list[dict[str, Any]]:
+        """Get the rules tying the sections of a test configuration together, checked by its validators."""
+        has_vanilla_specs = {"not": _EXPERT_MODE, "required": ["vanilla_specs"], "properties": {"vanilla_specs": {"type": "object"}}}
+        vanilla_axes = [{"required": [name], "properties": {name: {"type": "array"}}} for name in VANILLA_MATRIX_AXES]
+        return [
+            # check_entry_point
+            {"if": _EXPERT_MODE, "else": {"required": ["entry_point"], "properties": {"entry_point": {"type": "string"}}}},
+            # check_vanilla_specs
+            {
+                "if": {
+                    "anyOf": [
+                        _EXPERT_MODE,
+                        {"required": ["custom_load_shapes"], "properties": {"custom_load_shapes": {"not": {"const": False}}}},
+                    ]
+                },
+                "else": {"required": ["vanilla_specs"], "properties": {"vanilla_specs": {"type": "object"}}},
+            },
+            # check_worker_capacity
+            {
+                "if": {"required": ["worker_replicas"], "properties": {"worker_replicas": {"const": "auto"}}},
+                "then": {
+                    "anyOf": [
+                        has_vanilla_specs,
+                        {
+                            "required": ["worker_capacity"],
+                            "properties": {
+                                "worker_capacity": {"type": "object", "required": ["users"], "properties": {"users": {"type": "integer"}}}
+                            },
+                        },
+                    ]
+                },
+            },
+            # check_matrix
+            {
+                "if": {"required": ["matrix"], "properties": {"matrix": {"type": "object", "anyOf": vanilla_axes}}},
+                "then": has_vanilla_specs,
+            },
+        ]
@@ -0,0 +1,67 @@
+"""Schema validation package."""
+import logging
+from typing import IO, Any
+
+import yaml
+
+from intensive_brew.core.codec.codecs import Codec, YamlCodec, get_codec
+from intensive_brew.core.codec.formats import DataFormat
+from intensive_brew.core.schema.compiled_validator import validate
+from intensive_brew.core.yaml.sources import ConfigurationSources
+
+log = logging.getLogger(__name__)
+
+
+class SchemaValidation:
+    """
+    Configuration files check against the configuration JSON Schema.
+
+    Files are checked with the compiled validator, without building the configuration models, which is far faster and
+    suited to editors and pre-commit hooks. Matrices aren't expanded, so tests colliding with each other aren't reported.
+    """
+
+    @staticmethod
+    def validate_files(paths: list[str], input_format: DataFormat = DataFormat.YAML) -> dict[str, list[str]]:
+        """
+        Check configuration files against the schema.
+
+        Each document of a multi-document file is checked on its own, errors of a file holding several documents are
+        prefixed with the document number. Files that can't be parsed are reported along with the invalid ones.
+
+        :param paths: files, directories or glob patterns
+        :param input_format: configuration files format
+        :return: Validation errors of each invalid file
+        """
+        codec = get_codec(input_format)
+        errors: dict[str, list[str]] = {}
+        for file in ConfigurationSources.expand(paths, input_format):
+            try:
+                with open(file) as configuration_file:
+                    documents = SchemaValidation._load_documents(configuration_file, codec)
+            except (ValueError, yaml.YAMLError) as error:
+                file_errors = [str(error)]
+            else:
+                file_errors = [
+                    f"document {index}: {error}" if len(documents) > 1 else error
+                    for index, document in enumerate(documents, start=1)
+                    for error in validate(document)
+                ]
+            if file_errors:
+                log.error(f"Configuration file {file} doesn't match the configuration schema.")
+                errors[file] = file_errors
+        return errors
+
+    @staticmethod
+    def _load_documents(configuration_file: IO[str], codec: Codec) -> list[Any]:
+        """Load every document of an open configuration file, empty documents are skipped as the streaming loader does."""
+        if not isinstance(codec, YamlCodec):
+            return [codec.load(configuration_file)]
+
+        loader = codec.streaming_loader(configuration_file)
+        documents = []
+        try:
+            while loader.check_node():
+                documents.append(loader.construct_document(loader.get_node()))
+        finally:
+            loader.dispose()
+        return [document for document in documents if document is not None]
@@ -0,0 +1,81 @@
+"""Test matrix expansion package."""
+import itertools
+import logging
+import math
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from intensive_brew.core.dto.yaml.test_config import TestConfig
+
+log = logging.getLogger(__name__)
+
+# Matrix axes in expansion order, with the abbreviation naming them in the test key of each combination
+MATRIX_AXES = {"users": "u", "spawn_rate": "sr", "run_time": "rt", "termination_timeout": "tt", "target_host": "h", "worker_replicas": "w"}
+
+# Axes whose values can't be part of a resource name, combinations are named after the value index instead
+INDEXED_AXES = frozenset({"target_host"})
+
+
+class MatrixExpansion:
+    """
+    Lazy test matrix expansion.
+
+    A test declaring a `matrix` stands for one test per combination of the matrix values. Combinations are generated one at
+    a time, so that a sweep of thousands of points streams through build and write without being held in memory. Each one
+    is keyed by the test key followed by a suffix naming its values, e.g. `TLM-u100-sr10`, which in turn makes the
+    generated `metadata.name` unique.
+    """
+
+    @staticmethod
+    def expand(entries: Iterable[tuple[str, TestConfig]]) -> Iterator[tuple[str, TestConfig]]:
+        """
+        Expand the matrix of every test.
+
+        :param entries: (test key, TestConfig) pairs
+        :return: Iterator of (test key, TestConfig) pairs, tests without a matrix are passed through
+        """
+        for test_key, test_config in entries:
+            if test_config.matrix is None:
+                yield test_key, test_config
+            else:
+                yield from MatrixExpansion.combinations(test_key, test_config)
+
+    @staticmethod
+    def combinations(test_key: str, test_config: TestConfig) -> Iterator[tuple[str, TestConfig]]:
+        """
+        Generate the combinations of a test matrix.
+
+        :param test_key: test key
+        :param test_config: test configuration declaring a matrix
+        :return: Iterator of (combination test key, combination TestConfig) pairs
+        """
+        axes = MatrixExpansion._axes(test_config)
+        log.debug(f"Expanding the matrix of test {test_key} into {MatrixExpansion.size(test_config)} tests.")
+
+        for indexes in itertools.product(*(range(len(values)) for _, values in axes)):
+            point = {name: values[index] for (name, values), index in zip(axes, indexes)}
+            suffix = "-".join(
+                f"{MATRIX_AXES[name]}{index if name in INDEXED_AXES else point[name]}" for (name, _), index in zip(axes, indexes)
+            )
+
+            update: dict[str, Any] = {"matrix": None}
+            vanilla_values = {name: value for name, value in point.items() if name != "worker_replicas"}
+            if vanilla_values:
+                # Values were validated one axis at a time along with the test configuration
+                update["vanilla_specs"] = test_config.vanilla_specs.copy(update=vanilla_values)  # type: ignore[union-attr]
+            if "worker_replicas" in point:
+                update["worker_replicas"] = point["worker_replicas"]
+
+            yield f"{test_key}-{suffix}", test_config.copy(update=update)
+
+    @staticmethod
+    def size(test_config: TestConfig) -> int:
+        """Get the number of tests a test configuration stands for, without expanding it."""
+        return math.prod(len(values) for _, values in MatrixExpansion._axes(test_config))
+
+    @staticmethod
+    def _axes(test_config: TestConfig) -> list[tuple[str, list[Any]]]:
+        """Get the non-empty axes of the test matrix, in expansion order."""
+        if test_config.matrix is None:
+            return []
+        return [(name, values) for name in MATRIX_AXES if (values := getattr(test_config.matrix, name))]
@@ -0,0 +1,237 @@
+"""Configuration sources package."""
+import functools
+import glob
+import logging
+import os
+import pathlib
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from intensive_brew.core.cache.configuration_cache import ConfigurationCache
+from intensive_brew.core.codec.formats import DataFormat
+from intensive_brew.core.custom_resource.utils.helpers import Helpers
+from intensive_brew.core.dto.yaml.configuration import Configuration
+from intensive_brew.core.dto.yaml.test_config import TestConfig
+from intensive_brew.core.yaml.matrix import MatrixExpansion
+from intensive_brew.core.yaml.validation import Validation, ValidationIssue, ValidationReport
+
+log = logging.getLogger(__name__)
+
+# Extensions of the configuration files collected from directories
+CONFIGURATION_FILE_EXTENSIONS = {DataFormat.YAML: (".yaml", ".yml"), DataFormat.JSON: (".json",)}
+
+GLOB_CHARACTERS = ("*", "?", "[")
+
+
+@dataclass(frozen=True)
+class Collision:
+    """Two tests that would produce the same custom resource."""
+
+    # Either `test key` or `metadata.name`
+    kind: str
+    value: str
+    test_key: str
+    source: str
+    first_test_key: str
+    first_source: str
+
+    def __str__(self) -> str:
+        """Describe the collision."""
+        return (
+            f"Duplicate {self.kind} '{self.value}': test '{self.test_key}' ({self.source}) "
+            f"collides with test '{self.first_test_key}' ({self.first_source})."
+        )
+
+
+class ConfigurationCollisionError(ValueError):
+    """Raised when tests collide, their custom resources would overwrite each other."""
+
+    def __init__(self, collisions: list[Collision]) -> None:
+        """
+        Initialize the error.
+
+        :param collisions: detected collisions
+        """
+        self.collisions = collisions
+        super().__init__("\n".join(str(collision) for collision in collisions))
+
+
+class ConfigurationIndex:
+    """Index of the test keys and generated resource names of a configuration, detects colliding tests in a single pass."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.test_keys: dict[str, str] = {}
+        self.names: dict[str, tuple[str, str]] = {}
+        self.collisions: list[Collision] = []
+
+    def add(self, test_key: str, entry_point: str | None, source: str) -> list[Collision]:
+        """
+        Index a test.
+
+        :param test_key: test key
+        :param entry_point: test entry point, the resource name can't be derived without it
+        :param source: configuration file declaring the test
+        :return: Collisions of the test
+        """
+        collisions = []
+        if test_key in self.test_keys:
+            collisions.append(Collision("test key", test_key, test_key, source, test_key, self.test_keys[test_key]))
+        else:
+            self.test_keys[test_key] = source
+
+        if entry_point is not None:
+            name = Helpers.cr_name(test_key, entry_point)
+            if name in self.names:
+                first_test_key, first_source = self.names[name]
+                # Same key declared twice is already reported as a duplicated key
+                if first_test_key != test_key:
+                    collisions.append(Collision("metadata.name", name, test_key, source, first_test_key, first_source))
+            else:
+                self.names[name] = (test_key, source)
+
+        self.collisions.extend(collisions)
+        return collisions
+
+    def raise_on_collisions(self) -> None:
+        """Raise if any collision was detected."""
+        if self.collisions:
+            raise ConfigurationCollisionError(self.collisions)
+
+
+class ConfigurationSources:
+    """
+    Configuration spread over several files.
+
+    Paths may be files, directories, searched recursively for configuration files, or glob patterns. The tests of every
+    file are merged into a single configuration, tests whose key or generated resource name collide are rejected.
+    """
+
+    @staticmethod
+    def expand(paths: list[str], input_format: DataFormat = DataFormat.YAML) -> list[str]:
+        """
+        Expand paths into the list of configuration files they designate.
+
+        :param paths: files, directories or glob patterns
+        :param input_format: configuration files format, selects the files collected from directories
+        :return: Configuration files, in a deterministic order and without duplicates
+        """
+        extensions = CONFIGURATION_FILE_EXTENSIONS[DataFormat(input_format)]
+        files: dict[str, str] = {}
+        for path in paths:
+            if any(character in path for character in GLOB_CHARACTERS):
+                candidates = [match for match in sorted(glob.glob(path, recursive=True)) if os.path.isfile(match)]
+                if not candidates:
+                    raise FileNotFoundError(f"No configuration file matches '{path}'.")
+            elif os.path.isdir(path):
+                candidates = sorted(str(file) for file in pathlib.Path(path).rglob("*") if file.suffix in extensions and file.is_file())
+                if not candidates:
+                    raise FileNotFoundError(f"No configuration file found in directory '{path}'.")
+            else:
+                candidates = [path]
+
+            for candidate in candidates:
+                files.setdefault(os.path.realpath(candidate), candidate)
+
+        log.debug(f"Configuration files: {list(files.values())}")
+        return list(files.values())
+
+    @staticmethod
+    def load(
+        paths: list[str], input_format: DataFormat = DataFormat.YAML, jobs: int = 1, cache: ConfigurationCache | None = None
+    ) -> Configuration:
+        """
+        Load and merge the configuration files.
+
+        :param paths: files, directories or glob patterns
+        :param input_format: configuration files format
+        :param jobs: number of worker processes loading files, files are loaded in-process when set to 1
+        :param cache: cache of validated configurations
+        :return: Merged configuration, with test matrices expanded
+        :raises ConfigurationCollisionError: when tests collide
+        """
+        files = ConfigurationSources.expand(paths, input_format)
+        load_file = functools.partial(Validation.generate_configuration_object, input_format=input_format, cache=cache)
+        if jobs > 1 and len(files) > 1:
+            log.info(f"Loading {len(files)} configuration files across {jobs} processes.")
+            with ProcessPoolExecutor(max_workers=min(jobs, len(files))) as executor:
+                configurations = list(executor.map(load_file, files))
+        else:
+            configurations = [load_file(file) for file in files]
+
+        index = ConfigurationIndex()
+        merged: dict[str, TestConfig] = {}
+        for file, configuration in zip(files, configurations):
+            # Matrix combinations are indexed as well, their names could collide with other tests
+            for test_key, test_config in MatrixExpansion.expand(configuration.configurations.items()):
+                index.add(test_key, test_config.entry_point, file)
+                merged.setdefault(test_key, test_config)
+        index.raise_on_collisions()
+
+        if len(configurations) == 1 and all(test_config.matrix is None for test_config in configurations[0].configurations.values()):
+            return configurations[0]
+        # Test configurations are already validated
+        return Configuration.construct(configurations=merged)
+
+    @staticmethod
+    def stream_test_configs(paths: list[str], input_format: DataFormat = DataFormat.YAML) -> Iterator[tuple[str, TestConfig]]:
+        """
+        Stream the test configurations of the configuration files one entry at a time.
+
+        :param paths: files, directories or glob patterns
+        :param input_format: configuration files format
+        :return: Iterator of (test key, TestConfig) pairs, in file order
+        :raises ConfigurationCollisionError: as soon as a test collides with a previous one
+        """
+        index = ConfigurationIndex()
+        for file in ConfigurationSources.expand(paths, input_format):
+            for test_key, test_config in Validation.stream_test_configs(file, input_format):
+                index.add(test_key, test_config.entry_point, file)
+                index.raise_on_collisions()
+                yield test_key, test_config
+
+    @staticmethod
+    def validate(
+        paths: list[str], input_format: DataFormat = DataFormat.YAML, jobs: int = 1, cache: ConfigurationCache | None = None
+    ) -> Configuration:
+        """Validate the configuration files, stopping at the first error."""
+        try:
+            return ConfigurationSources.load(paths, input_format, jobs, cache)
+        except Exception as error:
+            log.error("Failed to validate YAML configuration.")
+            raise error
+
+    @staticmethod
+    def validate_all(
+        paths: list[str], input_format: DataFormat = DataFormat.YAML, jobs: int = 1, cache: ConfigurationCache | None = None
+    ) -> ValidationReport:
+        """
+        Validate every test of the configuration files, collecting all errors and collisions.
+
+        :param paths: files, directories or glob patterns
+        :param input_format: configuration files format
+        :param jobs: number of worker processes, spread over files when there are several, over tests otherwise
+        :param cache: cache of validated configurations
+        :return: Merged validation report
+        """
+        files = ConfigurationSources.expand(paths, input_format)
+        if jobs > 1 and len(files) > 1:
+            validate_file = functools.partial(Validation.validate_all, input_format=input_format, cache=cache)
+            with ProcessPoolExecutor(max_workers=min(jobs, len(files))) as executor:
+                reports = list(executor.map(validate_file, files))
+        else:
+            reports = [Validation.validate_all(file, input_format, jobs=jobs, cache=cache) for file in files]
+
+        merged = ValidationReport()
+        index = ConfigurationIndex()
+        for file, report in zip(files, reports):
+            merged.tests += report.tests
+            merged.issues.extend(report.issues)
+            merged.identities.extend(report.identities)
+            for test_key, entry_point in report.identities:
+                merged.issues.extend(
+                    ValidationIssue(test_key=test_key, location=[], message=str(collision), type=f"collision.{collision.kind}")
+                    for collision in index.add(test_key, entry_point, file)
+                )
+        return merged
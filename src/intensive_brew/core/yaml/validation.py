@@ -1,31 +1,384 @@
 """Main validation package."""
-import logging as log
+import functools
+import io
+import json
+import logging
+import math
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import IO, Any
 
 import yaml
+from pydantic import ValidationError
 
+from intensive_brew.core.cache.configuration_cache import ConfigurationCache
+from intensive_brew.core.codec.codecs import Codec, StreamingLoader, YamlCodec, get_codec
+from intensive_brew.core.codec.formats import DataFormat
+from intensive_brew.core.custom_resource.utils.constants import PARALLEL_CHUNKS_PER_JOB
 from intensive_brew.core.dto.yaml.configuration import Configuration
+from intensive_brew.core.dto.yaml.test_config import TestConfig
+from intensive_brew.core.metrics.recorder import span
+from intensive_brew.core.yaml.matrix import MatrixExpansion
+
+log = logging.getLogger(__name__)
+
+CONFIGURATIONS_SECTION = "configurations"
+
+
+@dataclass
+class ValidationIssue:
+    """A single validation error."""
+
+    # Key of the invalid test, `None` for errors affecting the whole configuration document
+    test_key: str | None
+    location: list[str | int]
+    message: str
+    type: str
+
+
+@dataclass
+class ValidationReport:
+    """Outcome of a fail-late validation run."""
+
+    # Number of tests found in the configuration, a test matrix counting one test per combination
+    tests: int = 0
+    issues: list[ValidationIssue] = field(default_factory=list)
+
+    # (test key, entry point) of every test in configuration order, matrices expanded, used to detect colliding tests
+    identities: list[tuple[str, str | None]] = field(default_factory=list, repr=False)
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether no error was found."""
+        return not self.issues
+
+    @property
+    def invalid_tests(self) -> list[str]:
+        """Keys of the invalid tests, in configuration order."""
+        return list(dict.fromkeys(issue.test_key for issue in self.issues if issue.test_key is not None))
+
+    def to_json(self) -> str:
+        """Render the report as JSON."""
+        report = {
+            "valid": self.is_valid,
+            "tests": self.tests,
+            "invalid_tests": self.invalid_tests,
+            "issues": [asdict(issue) for issue in self.issues],
+        }
+        return json.dumps(report, indent=2) + "\n"
+
+    def summary(self) -> str:
+        """Human readable list of every error."""
+        lines = [f"{len(self.invalid_tests)} of {self.tests} tests are invalid."]
+        for issue in self.issues:
+            location = ".".join(str(part) for part in issue.location)
+            prefix = issue.test_key if issue.test_key is not None else "<document>"
+            lines.append(f"  - {prefix}{f' -> {location}' if location else ''}: {issue.message}")
+        return "\n".join(lines)
 
 
 class Validation:
     """Main validation class."""
 
     @staticmethod
-    def generate_configuration_object(file_path: str) -> Configuration:
-        """Generate a mapped Configuration object."""
-        # Open configuration file
+    def generate_configuration_object(
+        file_path: str, input_format: DataFormat = DataFormat.YAML, cache: ConfigurationCache | None = None
+    ) -> Configuration:
+        """
+        Generate a mapped Configuration object.
+
+        :param file_path: configuration file path
+        :param input_format: configuration file format
+        :param cache: cache of validated configurations, parsing and validation are skipped when the file is cached
+        :return: Configuration object
+        """
+        # Read configuration file
+        content = Validation._read(file_path)
+
+        if cache is not None:
+            with span("cache"):
+                cache_key = cache.key(content, input_format)
+                cached_configuration = cache.load(cache_key)
+            if cached_configuration is not None:
+                return cached_configuration
+
+        # Parsed through the streaming loader, so that multi-document files load the same whether they are cached or not
+        parsed_entries = Validation._stream_parsed_entries(io.StringIO(content.decode()), get_codec(input_format))
+        test_configs = [Validation._map_parsed_entry(test_key, parsed_entry) for test_key, parsed_entry in parsed_entries]
+
+        # Test configurations are already validated
+        configuration = Configuration.construct(configurations=dict(test_configs))
+
+        if cache is not None:
+            with span("cache"):
+                cache.store(cache_key, configuration)
+        return configuration
+
+    @staticmethod
+    def stream_test_configs(file_path: str, input_format: DataFormat = DataFormat.YAML) -> Iterator[tuple[str, TestConfig]]:
+        """
+        Stream test configurations one entry at a time.
+
+        The YAML file is walked through PyYAML's event / compose API so that only the entry currently being mapped is held in
+        memory. Multi-document streams are supported, each document contributing its own `configurations` entries.
+        JSON documents are loaded at once and then mapped one entry at a time.
+
+        Test matrices are expanded lazily, each combination being yielded as its own test.
+
+        :param file_path: configuration file path
+        :param input_format: configuration file format
+        :return: Iterator of (test key, TestConfig) pairs in file order
+        """
+        entries = (
+            Validation._map_parsed_entry(test_key, parsed_entry)
+            for test_key, parsed_entry in Validation.stream_parsed_entries(file_path, input_format)
+        )
+        yield from MatrixExpansion.expand(entries)
+
+    @staticmethod
+    def stream_parsed_entries(file_path: str, input_format: DataFormat = DataFormat.YAML) -> Iterator[tuple[str, Any]]:
+        """
+        Stream the parsed, not yet validated, `configurations` entries one at a time.
+
+        :param file_path: configuration file path
+        :param input_format: configuration file format
+        :return: Iterator of (test key, parsed entry) pairs in file order
+        """
         with open(file_path) as configuration_file:
-            # Safe load yaml
-            parsed_yaml = yaml.safe_load(configuration_file)
-            log.debug(f"Parsed YAML object:\n{parsed_yaml}")
+            yield from Validation._stream_parsed_entries(configuration_file, get_codec(input_format))
+
+    @staticmethod
+    def _stream_parsed_entries(configuration_file: IO[str], codec: Codec) -> Iterator[tuple[str, Any]]:
+        """Stream the parsed `configurations` entries of an open configuration file."""
+        if not isinstance(codec, YamlCodec):
+            with span("parse"):
+                parsed_document = codec.load(configuration_file)
+            yield from Validation._stream_parsed_document(parsed_document)
+            return
+
+        loader = codec.streaming_loader(configuration_file)
+        try:
+            # Consume `StreamStartEvent`
+            Validation._consume_event(loader)
+
+            while not loader.check_event(yaml.StreamEndEvent):
+                # Consume `DocumentStartEvent`
+                Validation._consume_event(loader)
+
+                yield from Validation._stream_document(loader)
+
+                # Consume `DocumentEndEvent`, anchors are scoped to a single document
+                Validation._consume_event(loader)
+                loader.anchors = {}
+        finally:
+            loader.dispose()
+
+    @staticmethod
+    def _read(file_path: str) -> bytes:
+        """Read the raw content of a configuration file."""
+        with span("read"), open(file_path, "rb") as configuration_file:
+            return configuration_file.read()
+
+    @staticmethod
+    def _stream_parsed_document(parsed_document: Any) -> Iterator[tuple[str, Any]]:
+        """Stream the `configurations` entries of an already loaded document."""
+        if not isinstance(parsed_document, dict):
+            raise ValueError("Each configuration document must be a mapping.")
+        if CONFIGURATIONS_SECTION not in parsed_document:
+            raise ValueError(f"The section '{CONFIGURATIONS_SECTION}' must be provided.")
+        if not isinstance(parsed_document[CONFIGURATIONS_SECTION], dict):
+            raise ValueError(f"The section '{CONFIGURATIONS_SECTION}' must be a mapping.")
+
+        for test_key, parsed_entry in parsed_document[CONFIGURATIONS_SECTION].items():
+            yield str(test_key), parsed_entry
+
+    @staticmethod
+    def _stream_document(loader: StreamingLoader) -> Iterator[tuple[str, Any]]:
+        """Stream the `configurations` entries of the document the loader is positioned on."""
+        # Empty documents (e.g. a trailing `---`) don't contribute any test
+        if not loader.check_event(yaml.MappingStartEvent):
+            if loader.construct_document(Validation._compose_node(loader)) is None:
+                return
+            raise ValueError("Each configuration document must be a mapping.")
+
+        # Consume `MappingStartEvent`
+        Validation._consume_event(loader)
+
+        has_configurations = False
+        while not loader.check_event(yaml.MappingEndEvent):
+            key = loader.construct_document(Validation._compose_node(loader))
+
+            if key == CONFIGURATIONS_SECTION:
+                has_configurations = True
+                yield from Validation._stream_entries(loader)
+            else:
+                # Other top level sections are composed so that their anchors are registered, then dropped
+                Validation._compose_node(loader)
+
+        # Consume `MappingEndEvent`
+        Validation._consume_event(loader)
+
+        if not has_configurations:
+            raise ValueError(f"The section '{CONFIGURATIONS_SECTION}' must be provided.")
+
+    @staticmethod
+    def _stream_entries(loader: StreamingLoader) -> Iterator[tuple[str, Any]]:
+        """Stream the entries of a `configurations` mapping."""
+        if loader.check_event(yaml.MappingStartEvent):
+            # Consume `MappingStartEvent`
+            Validation._consume_event(loader)
+            while not loader.check_event(yaml.MappingEndEvent):
+                key_node = Validation._compose_node(loader)
+                value_node = Validation._compose_node(loader)
+                yield Validation._construct_entry(loader, key_node, value_node)
+
+            # Consume `MappingEndEvent`
+            Validation._consume_event(loader)
+            return
+
+        # Section provided through an alias or not provided as a mapping at all
+        node = Validation._compose_node(loader)
+        if not isinstance(node, yaml.MappingNode):
+            raise ValueError(f"The section '{CONFIGURATIONS_SECTION}' must be a mapping.")
+        for key_node, value_node in node.value:
+            yield Validation._construct_entry(loader, key_node, value_node)
+
+    @staticmethod
+    def _construct_entry(loader: StreamingLoader, key_node: yaml.Node, value_node: yaml.Node) -> tuple[str, Any]:
+        """Construct a single composed `configurations` entry."""
+        with span("parse"):
+            return str(loader.construct_document(key_node)), loader.construct_document(value_node)
+
+    @staticmethod
+    def _map_parsed_entry(test_key: str, parsed_entry: Any) -> tuple[str, TestConfig]:
+        """Map a single parsed `configurations` entry to its TestConfig."""
+        log.debug(f"Parsed YAML entry for test {test_key}:\n{parsed_entry}")
+
+        try:
+            with span("validation"):
+                return test_key, TestConfig.parse_obj(parsed_entry)
+        except ValidationError as error:
+            log.error(f"Failed to validate configuration for test: {test_key}.")
+            raise error
+
+    @staticmethod
+    def _consume_event(loader: StreamingLoader) -> None:
+        """Consume the next parser event."""
+        loader.get_event()
+
+    @staticmethod
+    def _compose_node(loader: StreamingLoader) -> yaml.Node:
+        """Compose the next complete node, registering any anchor it declares."""
+        with span("parse"):
+            return loader.compose_node(None, None)  # type: ignore[arg-type,return-value]
+
+    @staticmethod
+    def validate_all(
+        file_path: str, input_format: DataFormat = DataFormat.YAML, jobs: int = 1, cache: ConfigurationCache | None = None
+    ) -> ValidationReport:
+        """
+        Validate every test of a configuration independently, collecting all errors instead of stopping at the first one.
+
+        :param file_path: configuration file path
+        :param input_format: configuration file format
+        :param jobs: number of worker processes, tests are validated in-process when set to 1
+        :param cache: cache of validated configurations, a cached file is known to be valid
+        :return: Validation report
+        """
+        content = Validation._read(file_path)
+        if cache is not None:
+            with span("cache"):
+                cache_key = cache.key(content, input_format)
+                cached_configuration = cache.load(cache_key)
+            if cached_configuration is not None:
+                identities = [
+                    (test_key, test_config.entry_point)
+                    for test_key, test_config in MatrixExpansion.expand(cached_configuration.configurations.items())
+                ]
+                return ValidationReport(tests=len(identities), identities=identities)
+
+        report = ValidationReport()
+        entries: list[tuple[str, Any]] = []
+        document_issues = []
+        try:
+            for entry in Validation._stream_parsed_entries(io.StringIO(content.decode()), get_codec(input_format)):
+                entries.append(entry)
+        except (ValueError, yaml.YAMLError) as error:
+            # Entries parsed before a malformed part of the document are still validated
+            document_issues.append(ValidationIssue(test_key=None, location=[], message=str(error), type=type(error).__name__))
+
+        # Validated test configurations are only sent back from the workers when they are about to be cached
+        check_chunk = functools.partial(Validation._check_chunk, keep_test_configs=cache is not None)
+        test_configs: list[tuple[str, TestConfig]] = []
+        if jobs > 1 and len(entries) > 1:
+            chunk_size = math.ceil(len(entries) / (jobs * PARALLEL_CHUNKS_PER_JOB))
+            chunks = [entries[index : index + chunk_size] for index in range(0, len(entries), chunk_size)]
+            log.info(f"Validating {len(entries)} tests in {len(chunks)} chunks across {jobs} processes.")
+            with span("validation"), ProcessPoolExecutor(max_workers=jobs) as executor:
+                for chunk_test_configs, identities, issues in executor.map(check_chunk, chunks):
+                    test_configs.extend(chunk_test_configs)
+                    report.identities.extend(identities)
+                    report.issues.extend(issues)
+        else:
+            test_configs, report.identities, issues = check_chunk(entries)
+            report.issues.extend(issues)
+        report.issues.extend(document_issues)
+        # Test matrices count as one test per combination
+        report.tests = len(report.identities)
+
+        if cache is not None and report.is_valid:
+            with span("cache"):
+                cache.store(cache_key, Configuration.construct(configurations=dict(test_configs)))
+
+        log.info(f"Validated {report.tests} tests, {len(report.invalid_tests)} invalid.")
+        return report
+
+    @staticmethod
+    def _raw_entry_point(parsed_entry: Any) -> str | None:
+        """Get the entry point of a parsed, not yet validated, entry."""
+        entry_point = parsed_entry.get("entry_point") if isinstance(parsed_entry, dict) else None
+        return entry_point if isinstance(entry_point, str) else None
+
+    @staticmethod
+    def _check_chunk(
+        entries: list[tuple[str, Any]], keep_test_configs: bool = False
+    ) -> tuple[list[tuple[str, TestConfig]], list[tuple[str, str | None]], list[ValidationIssue]]:
+        """
+        Validate a chunk of parsed entries.
 
-        # Map object to model
-        return Configuration.parse_obj(parsed_yaml)
+        :param entries: (test key, parsed entry) pairs
+        :param keep_test_configs: return the validated test configurations
+        :return: Validated test configurations when kept, (test key, entry point) of every test with matrices expanded,
+            errors of the invalid entries
+        """
+        test_configs: list[tuple[str, TestConfig]] = []
+        identities: list[tuple[str, str | None]] = []
+        issues: list[ValidationIssue] = []
+        for test_key, parsed_entry in entries:
+            try:
+                with span("validation"):
+                    test_config = TestConfig.parse_obj(parsed_entry)
+                if keep_test_configs:
+                    test_configs.append((test_key, test_config))
+                identities.extend(
+                    (expanded_key, expanded_config.entry_point)
+                    for expanded_key, expanded_config in MatrixExpansion.expand([(test_key, test_config)])
+                )
+            except ValidationError as error:
+                # The matrix of an invalid entry can't be expanded, it is counted as a single test
+                identities.append((test_key, Validation._raw_entry_point(parsed_entry)))
+                issues.extend(
+                    ValidationIssue(test_key=test_key, location=list(detail["loc"]), message=detail["msg"], type=detail["type"])
+                    for detail in error.errors()
+                )
+        return test_configs, identities, issues
 
     @staticmethod
-    def validate(file_path: str) -> Configuration:
+    def validate(file_path: str, input_format: DataFormat = DataFormat.YAML, cache: ConfigurationCache | None = None) -> Configuration:
         """Validate a YAML configuration."""
         try:
-            configuration = Validation.generate_configuration_object(file_path)
+            configuration = Validation.generate_configuration_object(file_path, input_format, cache)
             log.debug(f"Parsed Configuration:\n{configuration}")
 
             return configuration
@@ -1,8 +1,17 @@
 """System Configuration package."""
 
-import logging as log
+import importlib.metadata
+import logging
 import os
 
+log = logging.getLogger(__name__)
+
+# Default maximum size of the parsed configuration cache
+DEFAULT_CACHE_MAX_BYTES = 256 * 2**20
+
+# Default modification time of archive entries, 1980-01-01 00:00:00 UTC is the earliest a zip entry can record
+DEFAULT_ARCHIVE_MTIME = 315532800
+
 
 def get_logging_level() -> str:
     """Get desired logging level for the project."""
@@ -10,3 +19,47 @@ def get_logging_level() -> str:
     log.debug(f"{logging_level=}")
 
     return logging_level.upper()
+
+
+def get_package_version() -> str:
+    """Get the installed version of the project."""
+    try:
+        return importlib.metadata.version("intensive-brew")
+    except importlib.metadata.PackageNotFoundError:
+        log.debug("Package metadata not found, running from source.")
+        return "0+unknown"
+
+
+def get_cache_dir() -> str:
+    """Get the directory of the parsed configuration cache, following the XDG base directory specification."""
+    cache_dir = os.environ.get("INTENSIVE_BREW_CACHE_DIR")
+    if not cache_dir:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        cache_dir = os.path.join(cache_home, "intensive-brew")
+    log.debug(f"{cache_dir=}")
+
+    return cache_dir
+
+
+def get_cache_max_bytes() -> int:
+    """Get the maximum size of the parsed configuration cache, least recently used entries are evicted beyond it."""
+    cache_max_bytes = int(os.environ.get("INTENSIVE_BREW_CACHE_MAX_BYTES", default=DEFAULT_CACHE_MAX_BYTES))
+    log.debug(f"{cache_max_bytes=}")
+
+    return cache_max_bytes
+
+
+def get_output_validation() -> bool:
+    """Check whether generated custom resources are re-validated, rather than trusted as built from a validated configuration."""
+    output_validation = os.environ.get("INTENSIVE_BREW_VALIDATE_OUTPUT", default="").lower() in ("1", "true", "yes")
+    log.debug(f"{output_validation=}")
+
+    return output_validation
+
+
+def get_archive_mtime() -> int:
+    """Get the modification time recorded for archive entries, `SOURCE_DATE_EPOCH` when set, as in reproducible builds."""
+    archive_mtime = int(os.environ.get("SOURCE_DATE_EPOCH", default=DEFAULT_ARCHIVE_MTIME))
+    log.debug(f"{archive_mtime=}")
+
+    return archive_mtime
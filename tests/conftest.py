@@ -0,0 +1,8 @@
+"""Test package."""
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the configuration cache of the tests out of the user's cache directory."""
+    monkeypatch.setenv("INTENSIVE_BREW_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
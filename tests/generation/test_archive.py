@@ -0,0 +1,115 @@
+"""Test package."""
+import io
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from intensive_brew.cli import app
+from intensive_brew.core.custom_resource.generation import Generation
+from intensive_brew.core.custom_resource.layout import OutputLayout
+from intensive_brew.core.yaml.sources import ConfigurationCollisionError
+
+CONFIGURATION = """
+configurations:
+  TLM:
+    entry_point: src/my_test.py
+    custom_load_shapes: true
+  search:
+    entry_point: src/my_test.py
+    custom_load_shapes: true
+"""
+
+runner = CliRunner()
+
+
+def _archive_members(archive_path: Path) -> dict[str, bytes]:
+    """Read every member of an archive, in archive order."""
+    if archive_path.suffix == ".zip":
+        with zipfile.ZipFile(archive_path) as archive:
+            return {name: archive.read(name) for name in archive.namelist()}
+    with tarfile.open(archive_path) as tar_archive:
+        return {member.name: tar_archive.extractfile(member).read() for member in tar_archive.getmembers()}  # type: ignore[union-attr]
+
+
+@pytest.mark.parametrize("archive_name", ["out.tar.gz", "out.tgz", "out.tar", "out.zip"])
+def test_archive_is_reproducible(tmp_path: Path, archive_name: str) -> None:
+    """Check that archives hold the same files as the output directory, and are byte-identical across runs."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(CONFIGURATION)
+    Generation.generate(str(config_file), str(tmp_path / "out"))
+
+    # * Act
+    Generation.generate_archive(str(config_file), str(tmp_path / "first" / archive_name))
+    Generation.generate_archive(str(config_file), str(tmp_path / "second" / archive_name))
+
+    # * Assert
+    first = (tmp_path / "first" / archive_name).read_bytes()
+    assert first == (tmp_path / "second" / archive_name).read_bytes()
+    assert sorted(path.name for path in (tmp_path / "first").iterdir()) == [archive_name]
+    assert _archive_members(tmp_path / "first" / archive_name) == {
+        "tlm.my-test.yaml": (tmp_path / "out" / "tlm.my-test.yaml").read_bytes(),
+        "search.my-test.yaml": (tmp_path / "out" / "search.my-test.yaml").read_bytes(),
+    }
+
+
+def test_archive_entries_metadata(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that entries record fixed ownership and permissions, and the `SOURCE_DATE_EPOCH` timestamp."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(CONFIGURATION)
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+
+    # * Act
+    Generation.generate_archive(str(config_file), str(tmp_path / "out.tar.gz"), layout=OutputLayout.TEAM)
+
+    # * Assert
+    with tarfile.open(tmp_path / "out.tar.gz") as tar_archive:
+        members = tar_archive.getmembers()
+    assert [member.name for member in members] == [
+        "tlm/tlm.my-test.yaml",
+        "search/search.my-test.yaml",
+        "kustomization.yaml",
+        "search/kustomization.yaml",
+        "tlm/kustomization.yaml",
+    ]
+    assert {(member.mtime, member.mode, member.uid, member.gid, member.uname) for member in members} == {(1700000000, 0o644, 0, 0, "")}
+    with open(tmp_path / "out.tar.gz", "rb") as raw:
+        assert raw.read(10)[4:8] == (1700000000).to_bytes(4, "little")
+
+
+def test_failed_archive_is_discarded(tmp_path: Path) -> None:
+    """Check that no archive, complete or partial, is left when generation fails."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(CONFIGURATION + "  tlm:\n    entry_point: src/my_test.py\n    custom_load_shapes: true\n")
+
+    # * Act
+    with pytest.raises(ConfigurationCollisionError):
+        Generation.generate_archive(str(config_file), str(tmp_path / "out.zip"))
+
+    # * Assert
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["config.yaml"]
+
+
+def test_cli_output_archive(tmp_path: Path) -> None:
+    """Check that `--output-archive` writes an archive, and can't be combined with an output directory."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(CONFIGURATION)
+    archive_path = tmp_path / "out.zip"
+
+    # * Act
+    result = runner.invoke(app, ["generate", "-f", str(config_file), "--output-archive", str(archive_path)])
+    both_result = runner.invoke(app, ["generate", "-f", str(config_file), "-o", str(tmp_path), "--output-archive", str(archive_path)])
+    bad_extension_result = runner.invoke(app, ["generate", "-f", str(config_file), "--output-archive", str(tmp_path / "out.rar")])
+
+    # * Assert
+    assert result.exit_code == 0
+    assert list(_archive_members(archive_path)) == ["tlm.my-test.yaml", "search.my-test.yaml"]
+    assert zipfile.ZipFile(io.BytesIO(archive_path.read_bytes())).testzip() is None
+    assert both_result.exit_code == 2
+    assert bad_extension_result.exit_code == 2
@@ -0,0 +1,48 @@
+"""Test package."""
+import pickle  # nosec B403
+from pathlib import Path
+
+from benchmarks.synthetic import synthetic_configuration
+
+from intensive_brew.core.custom_resource.compact import CompactCustomResource, CustomResourceBatch
+from intensive_brew.core.custom_resource.utils.helpers import Helpers
+from intensive_brew.core.dto.custom_resource.locust_test_custom_resource import LocustTest
+from intensive_brew.core.dto.yaml.configuration import Configuration
+
+
+def test_batch_matches_models(tmp_path: Path) -> None:
+    """Check that a compact batch converts to the same custom resources, and writes the same files, as the model list."""
+    # * Setup
+    configuration = Configuration.parse_obj(synthetic_configuration(30, seed=5))
+    models = Helpers.build_custom_resources(configuration)
+
+    # * Act
+    batch = Helpers.build_custom_resource_batch(configuration)
+    Helpers.write_cr_files(models, str(tmp_path / "models"))
+    Helpers.write_cr_files(batch, str(tmp_path / "batch"))
+
+    # * Assert
+    assert len(batch) == 30
+    assert batch == models
+    assert batch.names == [custom_resource.metadata.name for custom_resource in models]
+    assert isinstance(batch[3], LocustTest) and batch[3] == models[3]
+    assert isinstance(batch[2:5], CustomResourceBatch) and batch[2:5] == models[2:5]
+    assert {path.name: path.read_bytes() for path in (tmp_path / "batch").iterdir()} == {
+        path.name: path.read_bytes() for path in (tmp_path / "models").iterdir()
+    }
+
+
+def test_compact_record_round_trip() -> None:
+    """Check that records convert back and forth with LocustTest models, and survive pickling to worker processes."""
+    # * Setup
+    configuration = Configuration.parse_obj(synthetic_configuration(6, seed=1))
+    models = Helpers.build_custom_resources(configuration)
+
+    # * Act
+    records = [CompactCustomResource.from_locust_test(custom_resource) for custom_resource in models]
+    unpickled = pickle.loads(pickle.dumps(records))  # nosec B301
+
+    # * Assert
+    assert unpickled == records
+    assert [record.to_locust_test() for record in unpickled] == models
+    assert not hasattr(records[0], "__dict__")
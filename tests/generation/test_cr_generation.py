@@ -5,6 +5,8 @@ import shutil
 from pathlib import Path
 
 import pytest
+from benchmarks.synthetic import synthetic_configuration
+from pydantic import ValidationError
 
 from intensive_brew.core.custom_resource.utils.helpers import Helpers
 from intensive_brew.core.dto.custom_resource.toleration import Toleration
@@ -127,3 +129,56 @@ def test_cr_file_generation(dir_cleanup) -> None:  # type: ignore[no-untyped-def
     # * Assert
     assert directory_path.is_dir()  # Check directory got created
     assert file_path.is_file()  # check file got created
+
+
+def test_parallel_cr_generation_matches_serial(tmp_path: Path) -> None:
+    """Check that building custom resources across a process pool keeps order and writes byte-identical files."""
+    # * Setup
+    configuration = Configuration(
+        configurations={f"team{index}": prepare_test_config(("custom", "vanilla")[index % 2]) for index in range(20)}
+    )
+    serial_dir = tmp_path / "serial"
+    parallel_dir = tmp_path / "parallel"
+
+    # * Act
+    serial_list = Helpers.build_custom_resources(configuration)
+    parallel_list = Helpers.build_custom_resources(configuration, jobs=3)
+    Helpers.write_cr_files(serial_list, str(serial_dir))
+    Helpers.write_cr_files(parallel_list, str(parallel_dir))
+
+    # * Assert
+    assert [cr.metadata.name for cr in parallel_list] == [cr.metadata.name for cr in serial_list]
+    assert parallel_list == serial_list
+    for serial_file in serial_dir.iterdir():
+        assert (parallel_dir / serial_file.name).read_bytes() == serial_file.read_bytes()
+
+
+def test_trusted_construction_matches_validation(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that custom resources constructed without validation equal validated ones, and serialize the same."""
+    # * Setup
+    configuration = Configuration.parse_obj(synthetic_configuration(30, seed=3))
+    monkeypatch.setenv("INTENSIVE_BREW_VALIDATE_OUTPUT", "1")
+    validated_list = Helpers.build_custom_resources(configuration)
+    monkeypatch.delenv("INTENSIVE_BREW_VALIDATE_OUTPUT")
+
+    # * Act
+    trusted_list = Helpers.build_custom_resources(configuration)
+
+    # * Assert
+    assert trusted_list == validated_list
+    assert [Helpers.serialize_custom_resource(cr) for cr in trusted_list] == [
+        Helpers.serialize_custom_resource(cr) for cr in validated_list
+    ]
+    assert [cr.dict(by_alias=True, exclude_none=True) for cr in trusted_list] == [
+        cr.dict(by_alias=True, exclude_none=True) for cr in validated_list
+    ]
+
+
+def test_trusted_construction_still_rejects_missing_required_fields() -> None:
+    """Check that fields optional in the configuration but required in the spec are still reported."""
+    # * Setup
+    test_config = prepare_test_config("custom").copy(update={"image": None})
+
+    # * Act & Assert
+    with pytest.raises(ValidationError):
+        Helpers.build_custom_resource("TLM", test_config)
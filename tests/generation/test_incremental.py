@@ -0,0 +1,110 @@
+"""Test package."""
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+from intensive_brew.core.custom_resource.generation import Generation
+from intensive_brew.core.custom_resource.incremental import MANIFEST_FILE_NAME, IncrementalGeneration
+from intensive_brew.core.dto.yaml.test_config import TestConfig
+from tests.generation.fixtures import prepare_test_config
+
+# Arbitrary past timestamp used to detect rewritten files
+OLD_MTIME = 1_000_000_000
+
+
+def _entries(*keys: str, users: int | None = None) -> Iterable[tuple[str, TestConfig]]:
+    """Prepare configuration entries, optionally overriding the users of the first one."""
+    entries = {key: prepare_test_config("vanilla") for key in keys}
+    if users is not None:
+        first = entries[keys[0]]
+        entries[keys[0]] = first.copy(update={"vanilla_specs": first.vanilla_specs.copy(update={"users": users})})  # type: ignore[union-attr]
+    return entries.items()
+
+
+def _age_files(output_dir: Path) -> None:
+    """Set the modification time of every generated file to a past timestamp."""
+    for path in output_dir.glob("*.yaml"):
+        os.utime(path, (OLD_MTIME, OLD_MTIME))
+
+
+def test_incremental_generation_first_run(tmp_path: Path) -> None:
+    """Check that a first run writes every test and a manifest."""
+    # * Act
+    summary = IncrementalGeneration.generate(_entries("TLM", "search"), str(tmp_path))
+
+    # * Assert
+    assert summary.written == 2
+    assert sorted(path.name for path in tmp_path.glob("*.yaml")) == ["search.my-test.yaml", "tlm.my-test.yaml"]
+    assert (tmp_path / MANIFEST_FILE_NAME).is_file()
+
+
+def test_incremental_generation_only_rewrites_changed_tests(tmp_path: Path) -> None:
+    """Check that unchanged tests are skipped and keep their modification time."""
+    # * Setup
+    IncrementalGeneration.generate(_entries("TLM", "search"), str(tmp_path))
+    _age_files(tmp_path)
+
+    # * Act
+    summary = IncrementalGeneration.generate(_entries("TLM", "search", users=42), str(tmp_path))
+
+    # * Assert
+    assert (summary.written, summary.skipped) == (1, 1)
+    assert os.stat(tmp_path / "tlm.my-test.yaml").st_mtime != OLD_MTIME
+    assert os.stat(tmp_path / "search.my-test.yaml").st_mtime == OLD_MTIME
+    assert "--users 42" in (tmp_path / "tlm.my-test.yaml").read_text()
+
+
+def test_incremental_generation_prunes_removed_tests(tmp_path: Path) -> None:
+    """Check that files of tests removed from the configuration are deleted."""
+    # * Setup
+    IncrementalGeneration.generate(_entries("TLM", "search"), str(tmp_path))
+
+    # * Act
+    summary = IncrementalGeneration.generate(_entries("TLM"), str(tmp_path))
+
+    # * Assert
+    assert summary.pruned == 1
+    assert [path.name for path in tmp_path.glob("*.yaml")] == ["tlm.my-test.yaml"]
+
+
+def test_incremental_generation_force(tmp_path: Path) -> None:
+    """Check that forcing a run rewrites every test."""
+    # * Setup
+    IncrementalGeneration.generate(_entries("TLM", "search"), str(tmp_path))
+    _age_files(tmp_path)
+
+    # * Act
+    summary = IncrementalGeneration.generate(_entries("TLM", "search"), str(tmp_path), force=True)
+
+    # * Assert
+    assert summary.written == 2
+    assert all(os.stat(path).st_mtime != OLD_MTIME for path in tmp_path.glob("*.yaml"))
+
+
+def test_incremental_generation_recovers_deleted_files(tmp_path: Path) -> None:
+    """Check that a file deleted behind the manifest's back is regenerated."""
+    # * Setup
+    IncrementalGeneration.generate(_entries("TLM"), str(tmp_path))
+    (tmp_path / "tlm.my-test.yaml").unlink()
+
+    # * Act
+    summary = IncrementalGeneration.generate(_entries("TLM"), str(tmp_path))
+
+    # * Assert
+    assert summary.written == 1
+    assert (tmp_path / "tlm.my-test.yaml").is_file()
+
+
+def test_untracked_generation_invalidates_manifest(tmp_path: Path) -> None:
+    """Check that a non incremental run drops the manifest it can't keep up to date."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("configurations:\n  TLM:\n    entry_point: a.py\n    custom_load_shapes: true\n")
+    output_dir = tmp_path / "out"
+    Generation.generate(str(config_file), str(output_dir), incremental=True)
+
+    # * Act
+    Generation.generate(str(config_file), str(output_dir))
+
+    # * Assert
+    assert not (output_dir / MANIFEST_FILE_NAME).exists()
@@ -0,0 +1,122 @@
+"""Test package."""
+import pathlib
+from pathlib import Path
+
+import pytest
+
+from intensive_brew.core.custom_resource.generation import Generation
+from intensive_brew.core.custom_resource.incremental import MANIFEST_FILE_NAME, IncrementalGeneration
+from intensive_brew.core.custom_resource.layout import OutputLayout
+from intensive_brew.core.custom_resource.utils.constants import KUSTOMIZATION_FILE_NAME
+from tests.generation.fixtures import prepare_test_config
+
+CONFIGURATION = """
+configurations:
+  TLM:
+    entry_point: src/my_test.py
+    custom_load_shapes: true
+  search:
+    entry_point: src/my_test.py
+    custom_load_shapes: true
+  checkout:
+    entry_point: src/other_test.py
+    custom_load_shapes: true
+"""
+
+
+def _tree(output_dir: Path) -> list[str]:
+    """List the files of an output directory, relative to it."""
+    return sorted(str(path.relative_to(output_dir)) for path in output_dir.rglob("*") if path.is_file())
+
+
+@pytest.mark.parametrize(
+    "stream,pipeline,incremental", [(False, False, False), (True, False, False), (False, True, False), (False, False, True)]
+)
+def test_team_layout(tmp_path: Path, stream: bool, pipeline: bool, incremental: bool) -> None:
+    """Check that every generation mode writes a directory per team, each indexed by a kustomization."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(CONFIGURATION)
+    output_dir = tmp_path / "out"
+
+    # * Act
+    Generation.generate(
+        str(config_file), str(output_dir), stream=stream, pipeline=pipeline, incremental=incremental, layout=OutputLayout.TEAM
+    )
+
+    # * Assert
+    assert [path for path in _tree(output_dir) if path != MANIFEST_FILE_NAME] == [
+        "checkout/checkout.other-test.yaml",
+        "checkout/kustomization.yaml",
+        "kustomization.yaml",
+        "search/kustomization.yaml",
+        "search/search.my-test.yaml",
+        "tlm/kustomization.yaml",
+        "tlm/tlm.my-test.yaml",
+    ]
+    assert (output_dir / KUSTOMIZATION_FILE_NAME).read_text() == (
+        "apiVersion: kustomize.config.k8s.io/v1beta1\nkind: Kustomization\nresources:\n  - checkout\n  - search\n  - tlm\n"
+    )
+    assert (output_dir / "tlm" / KUSTOMIZATION_FILE_NAME).read_text().endswith("resources:\n  - tlm.my-test.yaml\n")
+
+
+def test_sharded_layout_creates_directories_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that files are spread over hashed prefix directories, each created once and up front."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "configurations:\n"
+        + "".join(f"  team{index}:\n    entry_point: src/my_test.py\n    custom_load_shapes: true\n" for index in range(300))
+    )
+    created: list[str] = []
+    mkdir = pathlib.Path.mkdir
+
+    def counting_mkdir(path: pathlib.Path, *args: bool, **kwargs: bool) -> None:
+        created.append(str(path))
+        mkdir(path, *args, **kwargs)
+
+    monkeypatch.setattr(pathlib.Path, "mkdir", counting_mkdir)
+
+    # * Act
+    Generation.generate(str(config_file), str(tmp_path / "out"), layout=OutputLayout.SHARDED)
+
+    # * Assert
+    files = _tree(tmp_path / "out")
+    directories = {file.split("/")[0] for file in files}
+    assert len(files) == 300
+    assert all(len(directory) == 2 for directory in directories)
+    assert len(created) == len(set(created)) == len(directories) + 1
+
+
+def test_incremental_team_layout_prunes_empty_directories(tmp_path: Path) -> None:
+    """Check that removing a team's last test removes its directory, and that its index is dropped from the root one."""
+    # * Setup
+    entries = {key: prepare_test_config("vanilla") for key in ("TLM", "search")}
+    IncrementalGeneration.generate(entries.items(), str(tmp_path), layout=OutputLayout.TEAM)
+
+    # * Act
+    summary = IncrementalGeneration.generate([("TLM", entries["TLM"])], str(tmp_path), layout=OutputLayout.TEAM)
+
+    # * Assert
+    assert (summary.skipped, summary.pruned) == (1, 1)
+    assert not (tmp_path / "search").exists()
+    assert _tree(tmp_path) == [MANIFEST_FILE_NAME, "kustomization.yaml", "tlm/kustomization.yaml", "tlm/tlm.my-test.yaml"]
+    assert (tmp_path / KUSTOMIZATION_FILE_NAME).read_text().endswith("resources:\n  - tlm\n")
+
+
+def test_incremental_layout_change_moves_files(tmp_path: Path) -> None:
+    """Check that switching layouts writes the files at their new place and prunes the old ones, along with their index."""
+    # * Setup
+    entries = [("TLM", prepare_test_config("vanilla"))]
+    IncrementalGeneration.generate(entries, str(tmp_path))
+
+    # * Act
+    summary = IncrementalGeneration.generate(entries, str(tmp_path), layout=OutputLayout.TEAM)
+    team_tree = _tree(tmp_path)
+    flat_summary = IncrementalGeneration.generate(entries, str(tmp_path))
+
+    # * Assert
+    assert (summary.written, summary.pruned) == (1, 1)
+    assert team_tree == [MANIFEST_FILE_NAME, "kustomization.yaml", "tlm/kustomization.yaml", "tlm/tlm.my-test.yaml"]
+    assert (flat_summary.written, flat_summary.pruned) == (1, 1)
+    assert _tree(tmp_path) == [MANIFEST_FILE_NAME, "tlm.my-test.yaml"]
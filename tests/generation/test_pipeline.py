@@ -0,0 +1,46 @@
+"""Test package."""
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from intensive_brew.core.custom_resource.pipeline import Pipeline
+from intensive_brew.core.custom_resource.utils.helpers import Helpers
+from intensive_brew.core.dto.yaml.configuration import Configuration
+from intensive_brew.core.dto.yaml.test_config import TestConfig
+from tests.generation.fixtures import prepare_test_config
+
+
+def test_pipeline_matches_serial_generation(tmp_path: Path) -> None:
+    """Check that the pipelined engine writes the same files as serial generation, with backpressure on tiny queues."""
+    # * Setup
+    configuration = Configuration(
+        configurations={f"team{index}": prepare_test_config(("custom", "vanilla")[index % 2]) for index in range(25)}
+    )
+    serial_dir = tmp_path / "serial"
+    pipeline_dir = tmp_path / "pipeline"
+    Helpers.write_cr_files(Helpers.build_custom_resources(configuration), str(serial_dir))
+
+    # * Act
+    stats = Pipeline(str(pipeline_dir), queue_size=1, write_workers=3).run(configuration.configurations.items())
+
+    # * Assert
+    assert {path.name: path.read_bytes() for path in pipeline_dir.iterdir()} == {
+        path.name: path.read_bytes() for path in serial_dir.iterdir()
+    }
+    assert [stage.processed for stage in stats.values()] == [25, 25, 25, 25]
+    assert all(stage.max_queue_depth <= 1 for stage in stats.values())
+
+
+def test_pipeline_propagates_stage_failure(tmp_path: Path) -> None:
+    """Check that a failing stage aborts the pipeline and surfaces the original error."""
+
+    # * Setup
+    def entries() -> Iterator[tuple[str, TestConfig]]:
+        yield "TLM", prepare_test_config("vanilla")
+        raise ValidationError([], Configuration)
+
+    # * Act & Assert
+    with pytest.raises(ValidationError):
+        Pipeline(str(tmp_path), queue_size=1, write_workers=2).run(entries())
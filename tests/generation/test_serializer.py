@@ -0,0 +1,132 @@
+"""Test package."""
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from intensive_brew.core.codec.codecs import JsonCodec
+from intensive_brew.core.custom_resource.utils.helpers import Helpers
+from intensive_brew.core.custom_resource.utils.serializer import CustomResourceSerializer, FragmentCache
+from intensive_brew.core.dto.custom_resource.locust_test_custom_resource import LocustTest
+from intensive_brew.core.dto.yaml.configuration import Configuration
+from intensive_brew.core.dto.yaml.test_config import TestConfig
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+
+VANILLA_SPECS = {"users": 10000, "spawn_rate": 20, "run_time": "55h", "target_host": "http://localhost:8080", "termination_timeout": 10}
+
+# Test key and configuration of each golden file
+GOLDEN_CASES = {
+    "vanilla": ("TLM", {"entry_point": "src/my_test.py", "vanilla_specs": VANILLA_SPECS}),
+    "custom-load-shapes": ("checkout", {"entry_point": "src/ACamelCaseTest.py", "custom_load_shapes": True, "configmap": "tests"}),
+    "expert-mode": (
+        "search",
+        {
+            "entry_point": "src/search.py",
+            "worker_replicas": 0,
+            "expert_mode": {"enabled": True, "masterCommandSeed": "--locustfile a.py --u 1000", "workerCommandSeed": "--locustfile a.py"},
+        },
+    ),
+    "labels-and-annotations": (
+        "TLM",
+        {
+            "entry_point": "my_test.py",
+            "custom_load_shapes": True,
+            "labels": {"master": {"team": "tlm", "version": "012", "enabled": "true", "empty": ""}, "worker": {}},
+            "annotations": {"worker": {"description": "a very long annotation value " * 5, "note": "a: b", "hash": "#tag"}},
+        },
+    ),
+    "affinity-and-tolerations": (
+        "TLM",
+        {
+            "entry_point": "my_test.py",
+            "vanilla_specs": VANILLA_SPECS,
+            "image": "registry.example.com/locust:2.15.1",
+            "affinity": {"nodeAffinity": {"requiredDuringSchedulingIgnoredDuringExecution": {"nodeGroup-label": "performance"}}},
+            "tolerations": [
+                {"key": "hardware", "operator": "Equal", "effect": "NoSchedule", "value": "ssd"},
+                {"key": "dedicated", "operator": "Exists", "effect": "NoExecute"},
+                {"key": "null", "operator": "Equal", "effect": "PreferNoSchedule", "value": "1.5"},
+            ],
+        },
+    ),
+    "special-characters": (
+        "TLM",
+        {
+            "entry_point": "src/tëst_ünicode.py",
+            "custom_load_shapes": True,
+            "labels": {"master": {"multi": "line\nvalue", "tab": "\tvalue", "quote": 'it\'s "quoted"', "yes": "no", "null": "~"}},
+        },
+    ),
+}
+
+
+def _build(case: str) -> LocustTest:
+    """Build the custom resource of a golden case."""
+    test_key, raw_config = GOLDEN_CASES[case]
+    return Helpers.build_custom_resource(test_key, TestConfig.parse_obj(raw_config))
+
+
+@pytest.mark.parametrize("case", GOLDEN_CASES)
+def test_serializer_matches_golden_file(case: str) -> None:
+    """Check that the direct serializer emits exactly the golden file content."""
+    # * Setup
+    custom_resource = _build(case)
+    golden = (GOLDEN_DIR / f"{case}.yaml").read_text()
+
+    # * Act
+    emitted = Helpers.serialize_custom_resource(custom_resource)
+
+    # * Assert
+    assert emitted == golden
+
+
+@pytest.mark.parametrize("case", GOLDEN_CASES)
+@pytest.mark.parametrize("dumper", [yaml.Dumper, yaml.SafeDumper, yaml.CSafeDumper])
+def test_serializer_matches_dict_dump(case: str, dumper: type[yaml.Dumper]) -> None:
+    """Check that the direct serializer emits the same document as dumping the `.dict()` copy, with every emitter."""
+    # * Setup
+    custom_resource = _build(case)
+
+    # * Act
+    emitted = CustomResourceSerializer.dump(custom_resource, dumper)
+
+    # * Assert
+    assert emitted == yaml.dump(custom_resource.dict(by_alias=True, exclude_none=True), Dumper=yaml.Dumper)
+
+
+@pytest.mark.parametrize("case", GOLDEN_CASES)
+def test_json_serializer_matches_codec_dump(case: str) -> None:
+    """Check that JSON documents with spliced fragments are the same as the codec dump of the `.dict()` copy."""
+    # * Setup
+    custom_resource = _build(case)
+
+    # * Act
+    emitted = CustomResourceSerializer.dump_json(custom_resource)
+
+    # * Assert
+    assert emitted == JsonCodec().dump(custom_resource.dict(by_alias=True, exclude_none=True))
+
+
+def test_shared_blocks_are_interned_and_serialized_once() -> None:
+    """Check that blocks shared through YAML anchors are stored once and their fragments are only rendered once."""
+    # * Setup
+    tests = "\n".join(f"  team{index}:\n    <<: *defaults\n    entry_point: src/test_{index}.py" for index in range(20))
+    raw = yaml.safe_load(
+        "defaults: &defaults\n  custom_load_shapes: true\n  labels: {master: {team: perf}}\n"
+        "  tolerations: [{key: hardware, operator: Exists, effect: NoSchedule}]\n"
+        f"configurations:\n{tests}\n"
+    )
+    configuration = Configuration.parse_obj({"configurations": raw["configurations"]})
+    fragments = FragmentCache()
+
+    # * Act
+    with patch("intensive_brew.core.custom_resource.utils.serializer.FRAGMENTS", fragments):
+        documents = [Helpers.serialize_custom_resource(cr) for cr in Helpers.build_custom_resources(configuration)]
+
+    # * Assert
+    assert len({id(test_config.labels) for test_config in configuration.configurations.values()}) == 1
+    assert len({id(test_config.tolerations) for test_config in configuration.configurations.values()}) == 1
+    assert fragments.misses == 2
+    assert all("    master:\n      team: perf\n" in document for document in documents)
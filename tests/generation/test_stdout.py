@@ -0,0 +1,86 @@
+"""Test package."""
+import io
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from intensive_brew.cli import app
+from intensive_brew.core.codec.formats import DataFormat
+from intensive_brew.core.custom_resource.utils.helpers import Helpers
+from intensive_brew.core.dto.custom_resource.locust_test_custom_resource import LocustTest
+from intensive_brew.core.dto.yaml.configuration import Configuration
+from tests.generation.fixtures import prepare_test_config
+
+CONFIGURATION = """
+configurations:
+  TLM:
+    entry_point: src/my_test.py
+    custom_load_shapes: true
+  checkout:
+    entry_point: src/checkout_test.py
+    custom_load_shapes: true
+"""
+
+runner = CliRunner(mix_stderr=False)
+
+
+def test_generate_to_stdout_matches_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that `-o -` writes the same documents as the output directory, without creating any file."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(CONFIGURATION)
+    runner.invoke(app, ["generate", "-f", str(config_file), "-o", str(tmp_path / "out")])
+    monkeypatch.chdir(tmp_path)
+
+    # * Act
+    result = runner.invoke(app, ["generate", "-f", str(config_file), "-o", "-"])
+
+    # * Assert
+    assert result.exit_code == 0
+    assert result.stdout.startswith("---\n")
+    assert list(yaml.safe_load_all(result.stdout)) == [
+        yaml.safe_load((tmp_path / "out" / file_name).read_text()) for file_name in ("tlm.my-test.yaml", "checkout.checkout-test.yaml")
+    ]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["config.yaml", "out"]
+
+
+def test_write_cr_stream_flushes_each_document() -> None:
+    """Check that each document is written before the next custom resource is built."""
+    # * Setup
+    stream = io.StringIO()
+    written_before_build = []
+
+    def custom_resources() -> Iterator[LocustTest]:
+        for index in range(3):
+            written_before_build.append(stream.getvalue().count("---\n"))
+            yield Helpers.build_custom_resource(f"team{index}", prepare_test_config("custom"))
+
+    # * Act
+    count = Helpers.write_cr_stream(custom_resources(), stream)
+
+    # * Assert
+    assert count == 3
+    assert written_before_build == [0, 1, 2]
+
+
+def test_write_cr_stream_json() -> None:
+    """Check that JSON documents are concatenated without YAML separators."""
+    # * Setup
+    configuration = Configuration(configurations={"TLM": prepare_test_config("custom"), "search": prepare_test_config("vanilla")})
+    stream = io.StringIO()
+
+    # * Act
+    Helpers.write_cr_stream(Helpers.iter_custom_resources(configuration.configurations.items()), stream, DataFormat.JSON)
+
+    # * Assert
+    decoder = json.JSONDecoder()
+    content, documents = stream.getvalue(), []
+    while content.strip():
+        document, end = decoder.raw_decode(content.lstrip())
+        documents.append(document["metadata"]["name"])
+        content = content.lstrip()[end:]
+    assert documents == ["tlm.my-test", "search.my-test"]
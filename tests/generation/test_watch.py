@@ -0,0 +1,202 @@
+"""Test package."""
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from intensive_brew.core.custom_resource.layout import OutputLayout
+from intensive_brew.core.custom_resource.watch import InotifyFileWatcher, PollingFileWatcher, Watcher
+
+# Arbitrary past timestamp used to detect rewritten files
+OLD_MTIME = 1_000_000_000
+
+CONFIGURATION = """
+configurations:
+  TLM:
+    entry_point: src/my_test.py
+    custom_load_shapes: true
+  search:
+    entry_point: src/search_test.py
+    custom_load_shapes: true
+    worker_replicas: {search_workers}
+  checkout:
+    entry_point: src/checkout_test.py
+    custom_load_shapes: true
+"""
+
+
+def _write_configuration(config_file: Path, search_workers: str = "1", extra: str = "") -> None:
+    """Write the watched configuration file."""
+    config_file.write_text(CONFIGURATION.format(search_workers=search_workers) + extra)
+
+
+def _watcher(tmp_path: Path) -> tuple[Watcher, Path, Path]:
+    """Prepare a watcher of a fresh configuration file."""
+    config_file, output_dir = tmp_path / "config.yaml", tmp_path / "out"
+    _write_configuration(config_file)
+    watcher = Watcher(str(config_file), str(output_dir), file_watcher=PollingFileWatcher(str(config_file), poll_interval=0.01))
+    return watcher, config_file, output_dir
+
+
+def test_watch_initial_refresh_writes_every_test(tmp_path: Path) -> None:
+    """Check that the first refresh generates every configured test."""
+    # * Setup
+    watcher, _, output_dir = _watcher(tmp_path)
+
+    # * Act
+    summary = watcher.refresh()
+
+    # * Assert
+    assert summary is not None
+    assert sorted(summary.written) == ["TLM", "checkout", "search"]
+    assert sorted(path.name for path in output_dir.iterdir()) == [
+        "checkout.checkout-test.yaml",
+        "search.search-test.yaml",
+        "tlm.my-test.yaml",
+    ]
+
+
+def test_watch_refresh_only_rewrites_changed_tests(tmp_path: Path) -> None:
+    """Check that only changed tests are rewritten and removed tests are deleted."""
+    # * Setup
+    watcher, config_file, output_dir = _watcher(tmp_path)
+    watcher.refresh()
+    for path in output_dir.iterdir():
+        os.utime(path, (OLD_MTIME, OLD_MTIME))
+    config_file.write_text(CONFIGURATION.format(search_workers="3").replace("  checkout:", "  removed:"))
+
+    # * Act
+    summary = watcher.refresh()
+
+    # * Assert
+    assert summary is not None
+    assert sorted(summary.written) == ["removed", "search"]
+    assert summary.removed == ["checkout"]
+    assert not (output_dir / "checkout.checkout-test.yaml").exists()
+    assert os.stat(output_dir / "tlm.my-test.yaml").st_mtime == OLD_MTIME
+    assert os.stat(output_dir / "search.search-test.yaml").st_mtime != OLD_MTIME
+
+
+def test_watch_refresh_keeps_output_on_invalid_configuration(tmp_path: Path) -> None:
+    """Check that an invalid configuration is reported without touching the previous output."""
+    # * Setup
+    watcher, config_file, output_dir = _watcher(tmp_path)
+    watcher.refresh()
+    _write_configuration(config_file, search_workers="many")
+
+    # * Act
+    summary = watcher.refresh()
+
+    # * Assert
+    assert summary is None
+    assert len(list(output_dir.iterdir())) == 3
+
+    # A fixed configuration is picked up again
+    _write_configuration(config_file, search_workers="3")
+    summary = watcher.refresh()
+    assert summary is not None and summary.written == ["search"]
+
+
+def test_watch_refresh_rejects_colliding_tests(tmp_path: Path) -> None:
+    """Check that a test defined in two watched files is rejected instead of silently overwriting the other."""
+    # * Setup
+    config_dir, output_dir = tmp_path / "configs", tmp_path / "out"
+    config_dir.mkdir()
+    _write_configuration(config_dir / "a.yaml")
+    watcher = Watcher(str(config_dir), str(output_dir), file_watcher=PollingFileWatcher(str(config_dir), poll_interval=0.01))
+    watcher.refresh()
+    (config_dir / "b.yaml").write_text("configurations:\n  search:\n    entry_point: src/search_test.py\n    worker_replicas: 5\n")
+
+    # * Act
+    summary = watcher.refresh()
+
+    # * Assert
+    assert summary is None
+    assert "workerReplicas: 1" in (output_dir / "search.search-test.yaml").read_text()
+
+
+def test_watch_refresh_honours_the_team_layout(tmp_path: Path) -> None:
+    """Check that the team layout places files in team directories, indexes them and drops emptied directories."""
+    # * Setup
+    config_file, output_dir = tmp_path / "config.yaml", tmp_path / "out"
+    _write_configuration(config_file)
+    watcher = Watcher(
+        str(config_file),
+        str(output_dir),
+        file_watcher=PollingFileWatcher(str(config_file), poll_interval=0.01),
+        layout=OutputLayout.TEAM,
+    )
+    watcher.refresh()
+    assert (output_dir / "checkout" / "checkout.checkout-test.yaml").exists()
+    assert "checkout" in (output_dir / "kustomization.yaml").read_text()
+    config_file.write_text(CONFIGURATION.format(search_workers="3").replace("  checkout:", "  removed:"))
+
+    # * Act
+    summary = watcher.refresh()
+
+    # * Assert
+    assert summary is not None and summary.removed == ["checkout"]
+    assert not (output_dir / "checkout").exists()
+    assert (output_dir / "removed" / "removed.checkout-test.yaml").exists()
+    index = (output_dir / "kustomization.yaml").read_text()
+    assert "checkout" not in index and "removed" in index and "tlm" in index
+    assert "tlm.my-test.yaml" in (output_dir / "tlm" / "kustomization.yaml").read_text()
+
+
+def test_polling_file_watcher_detects_files_added_to_a_directory(tmp_path: Path) -> None:
+    """Check that polling a directory reports configuration files added to it."""
+    # * Setup
+    (tmp_path / "a.yaml").write_text("configurations: {}\n")
+    file_watcher = PollingFileWatcher(str(tmp_path), poll_interval=0.01)
+
+    # * Act & Assert
+    (tmp_path / "notes.txt").write_text("ignored")
+    assert not file_watcher.wait_for_change(0.05)
+    (tmp_path / "b.yaml").write_text("configurations: {}\n")
+    assert file_watcher.wait_for_change(1)
+
+
+def test_watch_run_regenerates_on_change(tmp_path: Path) -> None:
+    """Check that a running watch regenerates the custom resources once the configuration changes."""
+    # * Setup
+    watcher, config_file, output_dir = _watcher(tmp_path)
+    stop = threading.Event()
+    thread = threading.Thread(target=watcher.run, args=(stop, 0.01))
+    thread.start()
+
+    # * Act
+    try:
+        while not (output_dir / "tlm.my-test.yaml").exists():
+            time.sleep(0.01)
+        _write_configuration(config_file, extra="  new:\n    entry_point: src/new_test.py\n    custom_load_shapes: true\n")
+        deadline = time.monotonic() + 5
+        while not (output_dir / "new.new-test.yaml").exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        stop.set()
+        thread.join()
+
+    # * Assert
+    assert (output_dir / "new.new-test.yaml").exists()
+
+
+def test_inotify_file_watcher_detects_changes(tmp_path: Path) -> None:
+    """Check that the inotify watcher only reports changes of the watched file."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("configurations: {}\n")
+    try:
+        file_watcher = InotifyFileWatcher(str(config_file))
+    except OSError:
+        pytest.skip("inotify is not available")
+
+    # * Act & Assert
+    try:
+        (tmp_path / "other.yaml").write_text("other")
+        assert not file_watcher.wait_for_change(0.05)
+        config_file.write_text("configurations: {}\n# changed\n")
+        assert file_watcher.wait_for_change(1)
+    finally:
+        file_watcher.close()
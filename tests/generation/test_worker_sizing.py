@@ -0,0 +1,170 @@
+"""Test package."""
+from typing import Any
+
+import pytest
+import yaml
+from pydantic import ValidationError
+
+from intensive_brew.core.custom_resource.compact import CompactCustomResource
+from intensive_brew.core.custom_resource.sizing import SizingDecision, WorkerSizing
+from intensive_brew.core.custom_resource.utils.constants import WORKER_REPLICAS_ANNOTATION, WORKER_REPLICAS_REASON_ANNOTATION
+from intensive_brew.core.custom_resource.utils.helpers import Helpers
+from intensive_brew.core.dto.yaml.test_config import TestConfig
+from intensive_brew.core.yaml.matrix import MatrixExpansion
+
+EXPERT_MODE = {
+    "enabled": True,
+    "masterCommandSeed": "--locustfile src/my_test.py --users 4000",
+    "workerCommandSeed": "--locustfile src/my_test.py",
+}
+
+
+def _test_config(users: int, spawn_rate: int, **extra: Any) -> TestConfig:
+    """Prepare an automatically sized test configuration."""
+    vanilla_specs = {"users": users, "spawn_rate": spawn_rate, "target_host": "http://localhost:8080"}
+    return TestConfig.parse_obj({"entry_point": "src/my_test.py", "vanilla_specs": vanilla_specs, "worker_replicas": "auto", **extra})
+
+
+@pytest.mark.parametrize(
+    "users,spawn_rate,capacity,expected",
+    [
+        (10, 1, None, 1),
+        (10000, 50, None, 10),
+        (10001, 50, None, 11),
+        (500, 1000, None, 10),
+        (10000, 50, {"users_per_worker": 250}, 40),
+        (100, 100, {"spawn_rate_per_worker": 20}, 5),
+    ],
+)
+def test_auto_worker_replicas(users: int, spawn_rate: int, capacity: dict[str, int] | None, expected: int) -> None:
+    """Check that workers are sized by whichever of users and spawn rate needs the most of them."""
+    # * Setup
+    test_config = _test_config(users, spawn_rate, worker_capacity=capacity)
+
+    # * Act
+    custom_resource = Helpers.build_custom_resource("TLM", test_config)
+
+    # * Assert
+    assert custom_resource.spec.worker_replicas == expected
+    assert custom_resource.metadata.annotations is not None
+    assert custom_resource.metadata.annotations[WORKER_REPLICAS_ANNOTATION] == str(expected)
+    assert f"users {users} / " in custom_resource.metadata.annotations[WORKER_REPLICAS_REASON_ANNOTATION]
+
+
+def test_auto_worker_replicas_annotations_are_not_shared() -> None:
+    """Check that mutating the annotations of a custom resource leaves the ones of tests sized alike untouched."""
+    # * Setup
+    test_config = _test_config(10000, 50)
+    first = Helpers.build_custom_resource("TLM", test_config)
+    assert first.metadata.annotations is not None
+
+    # * Act
+    first.metadata.annotations[WORKER_REPLICAS_ANNOTATION] = "mutated"
+    second = Helpers.build_custom_resource("search", test_config)
+
+    # * Assert
+    assert second.metadata.annotations is not None
+    assert second.metadata.annotations[WORKER_REPLICAS_ANNOTATION] == "10"
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+def test_auto_worker_replicas_are_decided_once_per_test(monkeypatch: pytest.MonkeyPatch, trusted: bool) -> None:
+    """Check that the annotations and the replica count of a custom resource come from a single sizing decision."""
+    # * Setup
+    decide = WorkerSizing.decide
+    calls = []
+
+    def counting_decide(test_config: TestConfig) -> SizingDecision | None:
+        calls.append(test_config)
+        return decide(test_config)
+
+    monkeypatch.setattr(WorkerSizing, "decide", staticmethod(counting_decide))
+
+    # * Act
+    custom_resource = Helpers.build_custom_resource("TLM", _test_config(10000, 50), trusted)
+
+    # * Assert
+    assert len(calls) == 1
+    assert custom_resource.spec.worker_replicas == 10
+
+
+def test_auto_worker_replicas_annotations_are_serialized() -> None:
+    """Check that the sizing decision is written with the custom resource, and that both construction paths agree."""
+    # * Setup
+    test_config = _test_config(10000, 50)
+
+    # * Act
+    trusted = Helpers.build_custom_resource("TLM", test_config, trusted=True)
+    validated = Helpers.build_custom_resource("TLM", test_config, trusted=False)
+    document = Helpers.serialize_custom_resource(trusted)
+
+    # * Assert
+    assert trusted == validated
+    assert CompactCustomResource.from_locust_test(trusted).to_locust_test() == trusted
+    assert yaml.safe_load(document)["metadata"]["annotations"] == {
+        WORKER_REPLICAS_ANNOTATION: "10",
+        WORKER_REPLICAS_REASON_ANNOTATION: "users 10000 / 1000 per worker = 10, spawn rate 50 / 100 per worker = 1",
+    }
+
+
+def test_fixed_worker_replicas_are_not_annotated() -> None:
+    """Check that explicitly set replicas are used as is."""
+    # * Setup
+    test_config = _test_config(10000, 50, worker_replicas=3)
+
+    # * Act
+    custom_resource = Helpers.build_custom_resource("TLM", test_config)
+
+    # * Assert
+    assert custom_resource.spec.worker_replicas == 3
+    assert custom_resource.metadata.annotations is None
+    assert "annotations" not in Helpers.serialize_custom_resource(custom_resource).split("spec:")[0]
+
+
+def test_auto_worker_replicas_are_sized_per_matrix_combination() -> None:
+    """Check that each combination of a test matrix is sized from its own target load."""
+    # * Setup
+    test_config = _test_config(10, 1, matrix={"users": [1000, 5000]})
+
+    # * Act
+    replicas = [
+        Helpers.build_custom_resource(test_key, config).spec.worker_replicas
+        for test_key, config in MatrixExpansion.expand([("TLM", test_config)])
+    ]
+
+    # * Assert
+    assert replicas == [1, 5]
+
+
+def test_auto_worker_replicas_in_expert_mode() -> None:
+    """Check that expert mode tests are sized from the capacity hints."""
+    # * Setup
+    test_config = TestConfig.parse_obj(
+        {
+            "entry_point": "src/my_test.py",
+            "expert_mode": EXPERT_MODE,
+            "worker_replicas": "auto",
+            "worker_capacity": {"users": 4000, "spawn_rate": 20, "users_per_worker": 500},
+        }
+    )
+
+    # * Act
+    custom_resource = Helpers.build_custom_resource("TLM", test_config)
+
+    # * Assert
+    assert custom_resource.spec.worker_replicas == 8
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"expert_mode": EXPERT_MODE, "worker_replicas": "auto"},
+        {"expert_mode": EXPERT_MODE, "worker_replicas": "auto", "worker_capacity": {"spawn_rate": 20}},
+        {"entry_point": "src/my_test.py", "custom_load_shapes": True, "worker_replicas": "auto"},
+        {"entry_point": "src/my_test.py", "custom_load_shapes": True, "worker_replicas": "many"},
+    ],
+)
+def test_auto_worker_replicas_require_a_target_load(config: dict[str, Any]) -> None:
+    """Check that tests without vanilla specs need the target users hint to be sized."""
+    with pytest.raises(ValidationError):
+        TestConfig.parse_obj(config)
@@ -0,0 +1,135 @@
+"""Library API test module."""
+import builtins
+import json
+import subprocess  # nosec B404
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from intensive_brew.api import ConfigurationCollisionError, DataFormat, iter_custom_resources, load_configuration, serialize_custom_resource
+from intensive_brew.core.custom_resource.generation import Generation
+
+CONFIGURATION = """
+configurations:
+  TLM:
+    entry_point: src/my_test.py
+    vanilla_specs:
+      users: 100
+      spawn_rate: 10
+      target_host: http://localhost:8080
+    matrix:
+      users: [100, 500]
+  checkout:
+    entry_point: src/checkout_test.py
+    custom_load_shapes: true
+    worker_replicas: 3
+"""
+
+SIDE_EFFECTS_SNIPPET = """
+import logging
+import intensive_brew.cli
+from intensive_brew.api import iter_custom_resources, load_configuration, serialize_custom_resource
+configuration = load_configuration({"configurations": {"checkout": {"entry_point": "checkout.py", "custom_load_shapes": True}}})
+documents = [serialize_custom_resource(custom_resource) for custom_resource in iter_custom_resources(configuration)]
+root = logging.getLogger()
+print(len(documents), root.handlers, logging.getLevelName(root.level))
+"""
+
+
+def _generate(source: Any, input_format: DataFormat = DataFormat.YAML) -> dict[str, bytes]:
+    """Generate the documents of a configuration through the API, keyed by resource name."""
+    return {
+        custom_resource.metadata.name: serialize_custom_resource(custom_resource)
+        for custom_resource in iter_custom_resources(load_configuration(source, input_format))
+    }
+
+
+def test_api_generates_the_files_of_the_cli(tmp_path: Path) -> None:
+    """Check that the API generates the same documents as the files written by a generation run."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(CONFIGURATION)
+    Generation.generate(str(config_file), str(tmp_path / "out"))
+
+    # * Act
+    documents = _generate(CONFIGURATION)
+
+    # * Assert
+    assert list(documents) == ["tlm-u100.my-test", "tlm-u500.my-test", "checkout.checkout-test"]
+    assert documents == {path.stem: path.read_bytes() for path in (tmp_path / "out").iterdir()}
+
+
+def test_api_accepts_parsed_and_serialized_configurations() -> None:
+    """Check that mappings, YAML and JSON documents, as text or bytes, load to the same configuration."""
+    # * Setup
+    parsed = {"configurations": {"checkout": {"entry_point": "src/checkout_test.py", "custom_load_shapes": True}}}
+
+    # * Act
+    configurations = [
+        load_configuration(parsed),
+        load_configuration(json.dumps(parsed)),
+        load_configuration(json.dumps(parsed).encode(), DataFormat.JSON),
+    ]
+
+    # * Assert
+    assert configurations[0] == configurations[1] == configurations[2]
+
+
+def test_api_rejects_invalid_configurations() -> None:
+    """Check that validation errors are raised to the caller."""
+    # * Act, Assert
+    with pytest.raises(ValidationError, match="entry_point"):
+        load_configuration({"configurations": {"checkout": {"custom_load_shapes": True}}})
+
+
+def test_api_rejects_colliding_tests() -> None:
+    """Check that a matrix combination colliding with a declared test is reported."""
+    # * Setup
+    configuration = load_configuration(CONFIGURATION.replace("checkout:", "TLM-u500:"))
+
+    # * Act, Assert
+    with pytest.raises(ConfigurationCollisionError, match="TLM-u500"):
+        list(iter_custom_resources(configuration))
+
+
+def test_api_does_not_touch_the_filesystem(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that generating through the API never opens a file."""
+
+    # * Setup
+    def forbidden_open(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError(f"Opened {args}")
+
+    monkeypatch.setattr(builtins, "open", forbidden_open)
+
+    # * Act
+    documents = _generate(CONFIGURATION)
+
+    # * Assert
+    assert len(documents) == 3
+
+
+def test_api_has_no_global_side_effects() -> None:
+    """Check that importing the CLI and generating through the API leave the logging configuration untouched."""
+    # * Act
+    result = subprocess.run([sys.executable, "-c", SIDE_EFFECTS_SNIPPET], capture_output=True, text=True, check=True)  # nosec B603
+
+    # * Assert
+    assert result.stdout.strip() == "1 [] WARNING"
+    assert result.stderr == ""
+
+
+def test_api_is_thread_safe() -> None:
+    """Check that concurrent generations produce the same documents as a sequential one."""
+    # * Setup
+    expected = _generate(CONFIGURATION)
+
+    # * Act
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: _generate(CONFIGURATION), range(64)))
+
+    # * Assert
+    assert all(result == expected for result in results)
@@ -0,0 +1,68 @@
+"""Test the benchmark suite."""
+from pathlib import Path
+
+from benchmarks.construction import run_benchmark as run_construction_benchmark
+from benchmarks.generation import STAGES, compare, run_benchmark
+from benchmarks.memory import run_benchmark as run_memory_benchmark
+from benchmarks.schema import run_benchmark as run_schema_benchmark
+from benchmarks.synthetic import synthetic_configuration
+
+from intensive_brew.core.custom_resource.utils.helpers import Helpers
+from intensive_brew.core.dto.yaml.configuration import Configuration
+
+
+def test_synthetic_configuration_is_deterministic_and_valid() -> None:
+    """Check that synthetic configurations are reproducible and cover every mode."""
+    # * Act
+    raw = synthetic_configuration(60, seed=7)
+    configuration = Configuration.parse_obj(raw)
+
+    # * Assert
+    assert raw == synthetic_configuration(60, seed=7)
+    assert raw != synthetic_configuration(60, seed=8)
+    assert len(Helpers.build_custom_resources(configuration)) == 60
+    assert {test_config.expert_mode is not None for test_config in configuration.configurations.values()} == {True, False}
+    assert any(test_config.tolerations for test_config in configuration.configurations.values())
+
+
+def test_benchmark_results(tmp_path: Path) -> None:
+    """Check that every stage is timed and that regressions are detected."""
+    # * Act
+    results = run_benchmark((10,), repeat=1, seed=0, workdir=tmp_path)
+
+    # * Assert
+    assert set(results["results"]["10"]) == set(STAGES)
+    assert len(list((tmp_path / "out-10-0").iterdir())) == 10
+    assert compare(results, results) == []
+
+    slower = {"results": {"10": {stage: {"seconds": timing["seconds"] + 1} for stage, timing in results["results"]["10"].items()}}}
+    assert len(compare(slower, results)) == len(STAGES)
+
+
+def test_construction_benchmark() -> None:
+    """Check that both construction paths are timed."""
+    # * Act
+    results = run_construction_benchmark(20, repeat=1)
+
+    # * Assert
+    assert results["size"] == 20
+    assert results["trusted_per_cr_us"] > 0 and results["validated_per_cr_us"] > 0
+
+
+def test_memory_benchmark() -> None:
+    """Check that compact batches retain less memory than model lists."""
+    # * Act
+    results = run_memory_benchmark(200)
+
+    # * Assert
+    assert 0 < results["compact_bytes_per_cr"] < results["models_bytes_per_cr"]
+
+
+def test_schema_benchmark() -> None:
+    """Check that both validators are timed on the same configuration."""
+    # * Act
+    results = run_schema_benchmark(30, repeat=1)
+
+    # * Assert
+    assert results["size"] == 30
+    assert results["models_per_test_us"] > 0 and results["schema_per_test_us"] > 0
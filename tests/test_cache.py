@@ -0,0 +1,195 @@
+"""Test the parsed configuration cache."""
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from intensive_brew.cli import app
+from intensive_brew.core.cache import configuration_cache
+from intensive_brew.core.cache.configuration_cache import ENTRY_SUFFIX, ConfigurationCache
+from intensive_brew.core.codec.formats import DataFormat
+from intensive_brew.core.dto.yaml.configuration import Configuration
+from intensive_brew.core.metrics.recorder import MetricsRecorder
+from intensive_brew.core.yaml.validation import Validation
+from tests.generation.fixtures import prepare_test_config
+
+CONFIGURATION = """
+configurations:
+  TLM:
+    entry_point: src/my_test.py
+    custom_load_shapes: true
+"""
+
+
+def _configuration() -> Configuration:
+    """Prepare a validated configuration."""
+    return Configuration(configurations={"TLM": prepare_test_config("custom"), "search": prepare_test_config("vanilla")})
+
+
+def _entries(cache: ConfigurationCache) -> list[Path]:
+    """List the cache entries."""
+    return sorted(cache.entries_dir.glob(f"*{ENTRY_SUFFIX}"))
+
+
+def test_cache_round_trip(tmp_path: Path) -> None:
+    """Check that a stored configuration is loaded back identical."""
+    # * Setup
+    cache = ConfigurationCache(str(tmp_path))
+    key = cache.key(b"content")
+
+    # * Act
+    missed = cache.load(key)
+    cache.store(key, _configuration())
+
+    # * Assert
+    assert missed is None
+    assert cache.load(key) == _configuration()
+    assert ConfigurationCache(str(tmp_path)).load(key) == _configuration()
+
+
+def test_cache_key_depends_on_content_and_format(tmp_path: Path) -> None:
+    """Check that the key changes with the file content and format."""
+    # * Setup
+    cache = ConfigurationCache(str(tmp_path))
+
+    # * Act & Assert
+    assert cache.key(b"content") == cache.key(b"content", DataFormat.YAML)
+    assert cache.key(b"content") != cache.key(b"content ")
+    assert cache.key(b"content") != cache.key(b"content", DataFormat.JSON)
+
+
+def test_cache_discards_corrupt_and_foreign_entries(tmp_path: Path) -> None:
+    """Check that tampered, truncated or foreign entries are discarded instead of loaded."""
+    # * Setup
+    cache = ConfigurationCache(str(tmp_path / "cache"))
+    other_cache = ConfigurationCache(str(tmp_path / "other"))
+    for key in ("corrupt", "truncated", "foreign"):
+        cache.store(key, _configuration())
+    entry_path = cache.entries_dir / f"corrupt{ENTRY_SUFFIX}"
+    content = bytearray(entry_path.read_bytes())
+    content[-1] ^= 0xFF
+    entry_path.write_bytes(bytes(content))
+    (cache.entries_dir / f"truncated{ENTRY_SUFFIX}").write_bytes(b"IBC")
+    other_cache.store("foreign", _configuration())
+    os.replace(other_cache.entries_dir / f"foreign{ENTRY_SUFFIX}", cache.entries_dir / f"foreign{ENTRY_SUFFIX}")
+
+    # * Act & Assert
+    for key in ("corrupt", "truncated", "foreign"):
+        assert cache.load(key) is None
+    assert _entries(cache) == []
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    """Check that the least recently used entries are evicted beyond the maximum size."""
+    # * Setup
+    cache = ConfigurationCache(str(tmp_path))
+    cache.store("first", _configuration())
+    cache.max_bytes = 2 * (cache.entries_dir / f"first{ENTRY_SUFFIX}").stat().st_size
+    cache.store("second", _configuration())
+    os.utime(cache.entries_dir / f"first{ENTRY_SUFFIX}", (1, 1))
+    os.utime(cache.entries_dir / f"second{ENTRY_SUFFIX}", (2, 2))
+
+    # * Act
+    assert cache.load("first") is not None
+    cache.store("third", _configuration())
+
+    # * Assert
+    assert [path.stem for path in _entries(cache)] == ["first", "third"]
+
+
+def test_validation_uses_cache(tmp_path: Path) -> None:
+    """Check that an unchanged configuration is neither parsed nor validated again."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(CONFIGURATION)
+    cache = ConfigurationCache(str(tmp_path / "cache"))
+    first = Validation.generate_configuration_object(str(config_file), cache=cache)
+
+    # * Act
+    with MetricsRecorder() as recorder:
+        second = Validation.generate_configuration_object(str(config_file), cache=cache)
+        report = Validation.validate_all(str(config_file), cache=cache)
+
+    # * Assert
+    assert first == second
+    assert report.is_valid and report.tests == 1
+    assert set(recorder.stages) == {"read", "cache"}
+
+
+def test_validate_all_caches_valid_configurations_only(tmp_path: Path) -> None:
+    """Check that fail-late validation caches valid configurations and rebuilds invalid ones."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    cache = ConfigurationCache(str(tmp_path / "cache"))
+
+    # * Act
+    config_file.write_text(CONFIGURATION.replace("    entry_point: src/my_test.py\n", ""))
+    invalid_report = Validation.validate_all(str(config_file), cache=cache)
+    config_file.write_text(CONFIGURATION)
+    Validation.validate_all(str(config_file), cache=cache)
+
+    # * Assert
+    assert not invalid_report.is_valid
+    assert len(_entries(cache)) == 1
+    assert Validation.generate_configuration_object(str(config_file), cache=cache) == Validation.generate_configuration_object(
+        str(config_file)
+    )
+
+
+def test_cli_no_cache(tmp_path: Path) -> None:
+    """Check that the CLI caches validated configurations unless asked not to."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(CONFIGURATION)
+    cache = ConfigurationCache()
+
+    # * Act
+    CliRunner().invoke(app, ["validate-configuration", "-f", str(config_file), "--no-cache"])
+    uncached = _entries(cache)
+    result = CliRunner().invoke(app, ["validate-configuration", "-f", str(config_file)])
+
+    # * Assert
+    assert result.exit_code == 0
+    assert uncached == []
+    assert len(_entries(cache)) == 1
+
+
+def test_cli_generate_multi_document_with_and_without_cache(tmp_path: Path) -> None:
+    """Check that a multi-document configuration generates the same custom resources whether the cache is used or not."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(CONFIGURATION + "---" + CONFIGURATION.replace("TLM:", "search:"))
+    cache = ConfigurationCache()
+
+    # * Act
+    cached = CliRunner().invoke(app, ["generate", "-f", str(config_file), "-o", str(tmp_path / "cached")])
+    uncached = CliRunner().invoke(app, ["generate", "-f", str(config_file), "-o", str(tmp_path / "uncached"), "--no-cache"])
+
+    # * Assert
+    assert cached.exit_code == 0 and uncached.exit_code == 0
+    assert len(_entries(cache)) == 1
+    assert sorted(path.name for path in (tmp_path / "cached").glob("*.yaml")) == ["search.my-test.yaml", "tlm.my-test.yaml"]
+    assert [path.read_bytes() for path in sorted((tmp_path / "cached").glob("*.yaml"))] == [
+        path.read_bytes() for path in sorted((tmp_path / "uncached").glob("*.yaml"))
+    ]
+
+
+def test_cache_key_depends_on_validation_code(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that changing the code validating configurations invalidates the cache, whatever the package version."""
+    # * Setup
+    cache = ConfigurationCache(str(tmp_path / "cache"))
+    key = cache.key(b"content")
+    for version, validator in [("before", "# validators\n"), ("after", "# stricter validators\n")]:
+        validators_file = tmp_path / version / "dto" / "yaml" / "test_config.py"
+        validators_file.parent.mkdir(parents=True)
+        validators_file.write_text(validator)
+
+    # * Act
+    digests = [configuration_cache._validation_code_digest(tmp_path / version) for version in ("before", "after")]
+    monkeypatch.setattr(configuration_cache, "_validation_code_digest", lambda: digests[1])
+    changed_key = cache.key(b"content")
+
+    # * Assert
+    assert digests[0] != digests[1]
+    assert key != changed_key
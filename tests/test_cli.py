@@ -1,13 +1,35 @@
 """Test intensive brew CLI."""
+import subprocess  # nosec B404
+import sys
 
+import pytest
 from typer.testing import CliRunner
 
 from intensive_brew.cli import app
 
 runner = CliRunner()
 
+# Runs the CLI in a fresh interpreter and reports which heavy modules it loaded
+LAZY_IMPORTS_SNIPPET = """
+import sys
+from typer.testing import CliRunner
+from intensive_brew.cli import app
+CliRunner().invoke(app, sys.argv[1:])
+print(sorted({module.split(".")[0] for module in sys.modules} & {"pydantic", "yaml"}))
+"""
+
 
 def test_help() -> None:
     """Test that the --help command works as expected."""
     result = runner.invoke(app, ["--help"])
     assert result.exit_code == 0
+
+
+@pytest.mark.parametrize("args", [["--help"], ["generate", "--help"], ["generate", "--jobs", "0"], ["unknown-command"]])
+def test_cli_startup_does_not_load_subsystems(args: list[str]) -> None:
+    """Check that help and argument errors don't import pydantic nor PyYAML."""
+    # * Act
+    result = subprocess.run([sys.executable, "-c", LAZY_IMPORTS_SNIPPET, *args], capture_output=True, text=True, check=True)  # nosec B603
+
+    # * Assert
+    assert result.stdout.strip() == "[]"
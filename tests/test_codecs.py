@@ -0,0 +1,104 @@
+"""Codecs conformance test module."""
+import io
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+
+from intensive_brew.core.codec.codecs import Codec, JsonCodec, YamlCodec
+from intensive_brew.core.codec.formats import DataFormat
+from intensive_brew.core.custom_resource.utils.helpers import Helpers
+from intensive_brew.core.dto.yaml.configuration import Configuration
+from intensive_brew.core.dto.yaml.test_config import TestConfig
+from intensive_brew.core.yaml.validation import Validation
+
+CONFIGURATION = {
+    "configurations": {
+        "TLM": {
+            "entry_point": "src/my_test.py",
+            "vanilla_specs": {"users": 100, "spawn_rate": 10, "run_time": "1h30m", "target_host": "http://localhost:8080"},
+            "labels": {"master": {"team": "tlm", "quoted": "012"}},
+            "tolerations": [{"key": "dedicated", "operator": "Equal", "effect": "NoSchedule", "value": "true"}],
+        },
+        "search": {
+            "entry_point": "src/searchFlow.py",
+            "custom_load_shapes": True,
+            "image": "locustio/locust:2.15.1",
+            "affinity": {"nodeAffinity": {"requiredDuringSchedulingIgnoredDuringExecution": {"pool": "performance"}}},
+            "annotations": {"worker": {"description": "a long description " * 6}},
+        },
+    }
+}
+
+BACKENDS = [
+    pytest.param(YamlCodec(use_libyaml=True), id="libyaml"),
+    pytest.param(YamlCodec(use_libyaml=False), id="pure-python-yaml"),
+    pytest.param(JsonCodec(), id="json"),
+]
+
+
+def _reference_resources() -> list[dict]:  # type: ignore[type-arg]
+    """Build the reference custom resources through the legacy PyYAML path."""
+    configuration = Configuration.parse_obj(yaml.safe_load(yaml.dump(CONFIGURATION)))
+    return [cr.dict(by_alias=True, exclude_none=True) for cr in Helpers.build_custom_resources(configuration)]
+
+
+@pytest.mark.parametrize("codec", BACKENDS)
+def test_codec_round_trip_conformance(codec: Codec) -> None:
+    """Check that every backend loads the configuration and emits semantically identical resources."""
+    # * Setup
+    encoded_configuration = codec.dump(CONFIGURATION)
+
+    # * Act
+    configuration = Configuration.parse_obj(codec.load(io.StringIO(encoded_configuration)))
+    emitted = [codec.dump(cr.dict(by_alias=True, exclude_none=True)) for cr in Helpers.build_custom_resources(configuration)]
+
+    # * Assert
+    assert [yaml.safe_load(document) for document in emitted] == _reference_resources()
+
+
+@pytest.mark.parametrize("use_libyaml", [True, False])
+def test_yaml_streaming_loaders_conformance(tmp_path: Path, use_libyaml: bool) -> None:
+    """Check that both YAML streaming loaders map the same entries."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml.dump(CONFIGURATION))
+    codec = YamlCodec(use_libyaml=use_libyaml)
+
+    # * Act
+    with open(config_file) as stream:
+        loader = codec.streaming_loader(stream)
+        document = loader.get_single_data()
+        loader.dispose()
+
+    # * Assert
+    assert Configuration.parse_obj(document) == Configuration.parse_obj(CONFIGURATION)
+
+
+def test_default_yaml_output_is_unchanged() -> None:
+    """Check that the default YAML backend emits byte-identical files to the legacy `yaml.dump` path."""
+    # * Setup
+    configuration = Configuration(
+        configurations={key: TestConfig.parse_obj(value) for key, value in CONFIGURATION["configurations"].items()}
+    )
+
+    # * Act & Assert
+    for custom_resource in Helpers.build_custom_resources(configuration):
+        expected = yaml.dump(custom_resource.dict(by_alias=True, exclude_none=True))
+        assert Helpers.serialize_custom_resource(custom_resource) == expected
+
+
+def test_json_output_files(tmp_path: Path) -> None:
+    """Check that JSON output uses the `.json` extension and stays loadable by the JSON input path."""
+    # * Setup
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(CONFIGURATION))
+
+    # * Act
+    configuration = Validation.generate_configuration_object(str(config_file), DataFormat.JSON)
+    Helpers.write_cr_files(Helpers.build_custom_resources(configuration), str(tmp_path / "out"), DataFormat.JSON)
+
+    # * Assert
+    written = sorted(path.name for path in (tmp_path / "out").iterdir())
+    assert written == ["search.search-Flow.json", "tlm.my-test.json"]
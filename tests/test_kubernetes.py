@@ -0,0 +1,215 @@
+"""Kubernetes API client test module."""
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from intensive_brew.cli import app
+from intensive_brew.core.cache.configuration_cache import ENTRY_SUFFIX, ConfigurationCache
+from intensive_brew.core.custom_resource.utils.helpers import Helpers
+from intensive_brew.core.kubernetes.client import KubernetesClient
+from intensive_brew.core.kubernetes.connection import ClusterConnection
+from tests.generation.fixtures import prepare_test_config
+
+runner = CliRunner()
+
+
+class FakeApiServer(ThreadingHTTPServer):
+    """Stand-in for the API server, answering server-side applies of LocustTest custom resources."""
+
+    def __init__(self, throttled: dict[str, int] | None = None) -> None:
+        """
+        Start the server on a free port.
+
+        :param throttled: number of `429` answers sent for a resource name before it is applied
+        """
+        super().__init__(("127.0.0.1", 0), FakeApiHandler)
+        self.throttled = dict(throttled or {})
+        self.requests: list[dict[str, str]] = []
+        self.applied: dict[str, dict[str, object]] = {}
+        self.client_ports: set[int] = set()
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class FakeApiHandler(BaseHTTPRequestHandler):
+    """Request handler of the stand-in API server."""
+
+    protocol_version = "HTTP/1.1"
+    server: FakeApiServer
+
+    def do_PATCH(self) -> None:  # noqa: N802 - name required by BaseHTTPRequestHandler
+        """Handle a server-side apply."""
+        path, _, query = self.path.partition("?")
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        name = path.rsplit("/", 1)[-1]
+        with self.server.lock:
+            self.server.requests.append(
+                {
+                    "path": path,
+                    "query": query,
+                    "content_type": self.headers["Content-Type"],
+                    "authorization": self.headers.get("Authorization", ""),
+                }
+            )
+            self.server.client_ports.add(self.client_address[1])
+            throttled = self.server.throttled.get(name, 0)
+            if throttled:
+                self.server.throttled[name] = throttled - 1
+            else:
+                self.server.applied[name] = body
+
+        if throttled:
+            self._respond(429, {"kind": "Status", "message": "too many requests"}, {"Retry-After": "0"})
+        elif not path.startswith("/apis/locust.io/v1/namespaces/perf/locusttests/"):
+            self._respond(404, {"kind": "Status", "message": "not found"})
+        else:
+            self._respond(201, body)
+
+    def _respond(self, status: int, body: dict[str, object], headers: dict[str, str] | None = None) -> None:
+        """Send a JSON response."""
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        for key, value in {"Content-Type": "application/json", "Content-Length": str(len(content)), **(headers or {})}.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Silence request logs."""
+
+
+@pytest.fixture()
+def api_server() -> Iterator[FakeApiServer]:
+    """Run a stand-in API server."""
+    server = FakeApiServer(throttled={"team3.my-test": 2})
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_apply_all_reuses_pooled_connections(api_server: FakeApiServer) -> None:
+    """Check that every resource is server-side applied, over at most `concurrency` connections, retrying throttled ones."""
+    # * Setup
+    custom_resources = [Helpers.build_custom_resource(f"team{index}", prepare_test_config("custom")) for index in range(20)]
+    connection = ClusterConnection(api_server.url, token="secret")
+
+    # * Act
+    with KubernetesClient(connection, concurrency=3, sleep=lambda _: None) as client:
+        report = client.apply_all(custom_resources, "perf")
+
+    # * Assert
+    assert not report.failed
+    assert [result.name for result in report.results] == [f"team{index}.my-test" for index in range(20)]
+    assert [result.attempts for result in report.results if result.attempts > 1] == [3]
+    assert len(api_server.requests) == 22
+    assert len(api_server.client_ports) <= 3
+    assert api_server.applied["team0.my-test"]["kind"] == "LocustTest"
+    assert api_server.requests[0]["query"] == "fieldManager=intensive-brew&force=true"
+    assert api_server.requests[0]["content_type"] == "application/apply-patch+yaml"
+    assert api_server.requests[0]["authorization"] == "Bearer secret"
+
+
+def test_apply_reports_exhausted_retries_and_errors(api_server: FakeApiServer) -> None:
+    """Check that failures are reported rather than raised."""
+    # * Setup
+    throttled = Helpers.build_custom_resource("team3", prepare_test_config("custom"))
+    delays: list[float] = []
+
+    # * Act
+    with KubernetesClient(ClusterConnection(api_server.url), retries=1, sleep=delays.append) as client:
+        throttled_result = client.server_side_apply(throttled, "perf")
+        missing_result = client.server_side_apply(throttled, "other")
+
+    # * Assert
+    assert (throttled_result.status, throttled_result.attempts, throttled_result.error) == (429, 2, "too many requests")
+    assert delays == [0.0]
+    assert (missing_result.status, missing_result.attempts, missing_result.error) == (404, 1, "not found")
+
+
+def test_apply_reports_unreachable_server() -> None:
+    """Check that connection errors are retried with backoff, then reported."""
+    # * Setup
+    custom_resource = Helpers.build_custom_resource("TLM", prepare_test_config("custom"))
+    delays: list[float] = []
+
+    # * Act
+    with KubernetesClient(ClusterConnection("http://127.0.0.1:1"), retries=2, backoff=1.0, sleep=delays.append) as client:
+        result = client.server_side_apply(custom_resource, "perf")
+
+    # * Assert
+    assert (result.status, result.attempts, result.ok) == (0, 3, False)
+    assert 0.5 <= delays[0] <= 1.0 and 1.0 <= delays[1] <= 2.0
+
+
+def test_connection_from_kubeconfig(tmp_path: Path) -> None:
+    """Check that the current context of a kubeconfig is resolved."""
+    # * Setup
+    (tmp_path / "token").write_text("file-token\n")
+    kubeconfig = tmp_path / "config"
+    kubeconfig.write_text(
+        """
+current-context: perf
+contexts:
+  - name: perf
+    context: {cluster: perf-cluster, user: perf-user}
+clusters:
+  - name: perf-cluster
+    cluster: {server: "https://10.0.0.1:6443", certificate-authority: ca.crt}
+users:
+  - name: perf-user
+    user: {tokenFile: token}
+"""
+    )
+
+    # * Act
+    connection = ClusterConnection.from_kubeconfig(str(kubeconfig))
+
+    # * Assert
+    assert (connection.host, connection.port, connection.is_https) == ("10.0.0.1", 6443, True)
+    assert connection.token == "file-token"
+    assert connection.certificate_authority == str(tmp_path / "ca.crt")
+
+
+def test_cli_apply(tmp_path: Path, api_server: FakeApiServer) -> None:
+    """Check that the apply command applies every test of the configuration and reports their latency."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("configurations:\n  TLM:\n    entry_point: src/my_test.py\n    custom_load_shapes: true\n")
+
+    # * Act
+    result = runner.invoke(app, ["apply", "-f", str(config_file), "-n", "perf", "--server", api_server.url, "--dry-run"])
+
+    # * Assert
+    assert result.exit_code == 0
+    assert "tlm.my-test: 201 in" in result.stdout
+    assert "Applied 1/1 custom resources" in result.stdout
+    assert api_server.requests[0]["query"].endswith("dryRun=All")
+
+
+@pytest.mark.parametrize("no_cache", [True, False])
+def test_cli_apply_no_cache(tmp_path: Path, api_server: FakeApiServer, no_cache: bool) -> None:
+    """Check that the apply command caches validated configurations unless asked not to."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("configurations:\n  TLM:\n    entry_point: src/my_test.py\n    custom_load_shapes: true\n")
+    cache = ConfigurationCache()
+
+    # * Act
+    result = runner.invoke(
+        app, ["apply", "-f", str(config_file), "-n", "perf", "--server", api_server.url, "--dry-run", *(["--no-cache"] if no_cache else [])]
+    )
+
+    # * Assert
+    assert result.exit_code == 0
+    assert len(list(cache.entries_dir.glob(f"*{ENTRY_SUFFIX}"))) == (0 if no_cache else 1)
@@ -0,0 +1,149 @@
+"""Test generation metrics."""
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from intensive_brew.cli import app
+from intensive_brew.core.custom_resource.generation import Generation
+from intensive_brew.core.metrics.recorder import MetricsFormat, MetricsRecorder, Span, active_recorder, span
+
+CONFIGURATION = """
+configurations:
+  TLM:
+    entry_point: src/my_test.py
+    custom_load_shapes: true
+  search:
+    entry_point: src/search_test.py
+    vanilla_specs:
+      users: 100
+      spawn_rate: 10
+      target_host: http://localhost:8080
+"""
+
+# Sample line of the Prometheus text exposition format
+PROMETHEUS_SAMPLE = re.compile(r'^[a-z_]+(\{stage="[a-z]+"\})? [0-9.e+-]+$')
+
+
+def _write_configuration(tmp_path: Path) -> str:
+    """Write a configuration file and return its path."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(CONFIGURATION)
+    return str(config_file)
+
+
+def test_recorder_records_every_stage(tmp_path: Path) -> None:
+    """Check that a generation run reports every stage and per test metrics."""
+    # * Setup
+    config_file, output_dir = _write_configuration(tmp_path), tmp_path / "out"
+
+    # * Act
+    with MetricsRecorder() as recorder:
+        Generation.generate(config_file, str(output_dir))
+
+    # * Assert
+    assert list(recorder.stages) == ["read", "parse", "validation", "build", "serialize", "write"]
+    assert recorder.stages["build"].calls == 2
+    assert all(stage.wall_seconds >= 0 and stage.cpu_seconds >= 0 for stage in recorder.stages.values())
+    assert set(recorder.tests) == {"tlm.my-test", "search.search-test"}
+    assert recorder.tests["tlm.my-test"].output_bytes == (output_dir / "tlm.my-test.yaml").stat().st_size
+    assert recorder.tests["tlm.my-test"].build_seconds is not None
+    assert active_recorder() is None
+
+
+def test_recorder_hooks_and_custom_spans() -> None:
+    """Check that embedding code can attach hooks and record its own spans."""
+    # * Setup
+    recorder = MetricsRecorder()
+    finished: list[Span] = []
+    recorder.add_hook(finished.append)
+
+    # * Act
+    with span("outside"):
+        pass
+    with recorder, span("upload") as upload_span:
+        pass
+
+    # * Assert
+    assert upload_span is not None
+    assert [finished_span.name for finished_span in finished] == ["upload"]
+    assert list(recorder.stages) == ["upload"]
+
+
+def test_recorder_prometheus_output(tmp_path: Path) -> None:
+    """Check that the Prometheus output only holds valid comments and samples."""
+    # * Setup
+    with MetricsRecorder() as recorder:
+        Generation.generate(_write_configuration(tmp_path), str(tmp_path / "out"))
+
+    # * Act
+    recorder.write(str(tmp_path / "metrics.prom"), MetricsFormat.PROMETHEUS)
+
+    # * Assert
+    lines = (tmp_path / "metrics.prom").read_text().splitlines()
+    assert 'intensive_brew_stage_calls{stage="build"} 2' in lines
+    assert all(line.startswith("# ") or PROMETHEUS_SAMPLE.match(line) for line in lines)
+
+
+def test_cli_metrics_file(tmp_path: Path) -> None:
+    """Check that the CLI writes the metrics file."""
+    # * Setup
+    metrics_file = tmp_path / "metrics.json"
+
+    # * Act
+    result = CliRunner().invoke(
+        app, ["generate", "-f", _write_configuration(tmp_path), "-o", str(tmp_path / "out"), "--metrics-file", str(metrics_file)]
+    )
+
+    # * Assert
+    assert result.exit_code == 0
+    metrics = json.loads(metrics_file.read_text())
+    assert {"parse", "validation", "build", "serialize", "write"} <= set(metrics["stages"])
+    assert set(metrics["tests"]) == {"tlm.my-test", "search.search-test"}
+
+
+def test_recorders_of_concurrent_threads_are_isolated() -> None:
+    """Check that threads recording concurrently each report to their own recorder, and restore it on exit."""
+    # * Setup
+    barrier = threading.Barrier(2)
+
+    def record(name: str) -> tuple[MetricsRecorder, MetricsRecorder | None]:
+        # Both recorders are entered before either records a span, then the first thread exits first
+        with MetricsRecorder() as recorder:
+            barrier.wait()
+            with span(name):
+                pass
+            barrier.wait()
+            if name == "second":
+                barrier.wait()
+            with span(name):
+                pass
+        if name == "first":
+            barrier.wait()
+        return recorder, active_recorder()
+
+    # * Act
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(record, ["first", "second"]))
+
+    # * Assert
+    assert [list(recorder.stages) for recorder, _ in results] == [["first"], ["second"]]
+    assert all(recorder.stages[name].calls == 2 for (recorder, _), name in zip(results, ["first", "second"]))
+    assert [left_active for _, left_active in results] == [None, None]
+
+
+def test_recorder_collects_pipeline_threads(tmp_path: Path) -> None:
+    """Check that the stages running in the threads of the pipeline report to the recorder of the calling thread."""
+    # * Setup
+    config_file, output_dir = _write_configuration(tmp_path), tmp_path / "out"
+
+    # * Act
+    with MetricsRecorder() as recorder:
+        Generation.generate(config_file, str(output_dir), pipeline=True)
+
+    # * Assert
+    assert {"parse", "validation", "build", "serialize", "write"} <= set(recorder.stages)
+    assert set(recorder.tests) == {"tlm.my-test", "search.search-test"}
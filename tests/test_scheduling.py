@@ -0,0 +1,157 @@
+"""Wave scheduling test module."""
+import json
+import random
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+from typer.testing import CliRunner
+
+from intensive_brew.cli import app
+from intensive_brew.core.dto.utils.duration import format_duration, parse_duration
+from intensive_brew.core.dto.yaml.vanilla_specs import VanillaSpecs
+from intensive_brew.core.scheduling.scheduler import ScheduledTest, WaveScheduler
+
+runner = CliRunner()
+
+TEST_CONFIGURATION = """
+  {test_key}:
+    entry_point: src/my_test.py
+    worker_replicas: {worker_replicas}
+    vanilla_specs: {{users: {users}, spawn_rate: 10, run_time: {run_time}, target_host: 'http://localhost:8080'}}
+"""
+
+
+def _scheduled_test(index: int, worker_pods: int, users: int = 100, duration_seconds: int | None = 60) -> ScheduledTest:
+    """Prepare a scheduled test."""
+    return ScheduledTest(index, f"team{index}", f"team{index}.my-test", worker_pods, users, duration_seconds)
+
+
+@pytest.mark.parametrize("value,seconds", [("30s", 30), ("20m", 1200), ("3h", 10800), ("1h30m", 5400), ("44h44m60s", 161100)])
+def test_parse_duration(value: str, seconds: int) -> None:
+    """Check that durations are normalized to seconds."""
+    assert parse_duration(value) == seconds
+
+
+@pytest.mark.parametrize("value", ["", "30", "1h30", "44hw", "5m garbage"])
+def test_parse_duration_rejects_invalid_values(value: str) -> None:
+    """Check that values that aren't made of (number value + time unit) combinations only are rejected."""
+    with pytest.raises(ValueError):
+        parse_duration(value)
+
+
+def test_run_time_is_normalized() -> None:
+    """Check that vanilla specs expose their run time in seconds, and reject run times that can't be normalized."""
+    # * Setup
+    specs: dict[str, Any] = {"users": 10, "spawn_rate": 1, "target_host": "http://localhost:8080"}
+
+    # * Act
+    vanilla_specs = VanillaSpecs(**specs, run_time="1h30m")
+
+    # * Assert
+    assert vanilla_specs.run_time_seconds == 5400
+    assert format_duration(5400) == "1h30m"
+    assert format_duration(0) == "0s"
+    with pytest.raises(ValidationError):
+        VanillaSpecs(**specs, run_time="5m garbage")
+
+
+def test_pack_respects_caps() -> None:
+    """Check that waves stay under the caps, and that long tests share waves."""
+    # * Setup
+    tests = [
+        _scheduled_test(0, 4, duration_seconds=60),
+        _scheduled_test(1, 6, duration_seconds=3600),
+        _scheduled_test(2, 5, duration_seconds=60),
+        _scheduled_test(3, 4, duration_seconds=3600),
+        _scheduled_test(4, 1, duration_seconds=None),
+    ]
+
+    # * Act
+    plan = WaveScheduler.pack(tests, max_worker_pods=10)
+
+    # * Assert
+    assert [[test.index for test in wave.tests] for wave in plan.waves] == [[1, 3], [2, 0, 4]]
+    assert [(wave.worker_pods, wave.duration_seconds) for wave in plan.waves] == [(10, 3600), (10, 60)]
+    assert plan.duration_seconds == 3660
+
+
+def test_pack_isolates_tests_over_capacity() -> None:
+    """Check that a test larger than the caps on its own gets a wave to itself."""
+    # * Setup
+    tests = [_scheduled_test(0, 2, users=500), _scheduled_test(1, 2, users=5000), _scheduled_test(2, 2, users=500)]
+
+    # * Act
+    plan = WaveScheduler.pack(tests, max_users=1000)
+
+    # * Assert
+    assert [[test.index for test in wave.tests] for wave in plan.waves] == [[1], [0, 2]]
+    assert [plan.over_capacity(wave) for wave in plan.waves] == [True, False]
+
+
+@pytest.mark.parametrize("max_worker_pods,max_users", [(50, 0), (0, 20000), (50, 20000)])
+def test_pack_matches_first_fit(max_worker_pods: int, max_users: int) -> None:
+    """Check that packing places each test in the first wave it fits in, as a linear scan of the waves would."""
+    # * Setup
+    generator = random.Random(7)  # nosec B311
+    tests = [
+        _scheduled_test(index, generator.randint(1, 30), generator.randint(1, 10000), generator.choice([60, 600, 3600]))
+        for index in range(2000)
+    ]
+
+    # * Act
+    plan = WaveScheduler.pack(tests, max_worker_pods, max_users)
+
+    # * Assert
+    expected: list[list[int]] = []
+    remaining: list[tuple[float, float]] = []
+    for test in sorted(tests, key=lambda test: (-(test.duration_seconds or 0), -test.worker_pods, -test.users)):
+        for index, (worker_pods, users) in enumerate(remaining):
+            if worker_pods >= test.worker_pods and users >= test.users:
+                remaining[index] = (worker_pods - test.worker_pods, users - test.users)
+                expected[index].append(test.index)
+                break
+        else:
+            remaining.append(((max_worker_pods or float("inf")) - test.worker_pods, (max_users or float("inf")) - test.users))
+            expected.append([test.index])
+    assert [[test.index for test in wave.tests] for wave in plan.waves] == expected
+    assert not any(plan.over_capacity(wave) for wave in plan.waves)
+
+
+def test_cli_schedule(tmp_path: Path) -> None:
+    """Check that each wave is written to its own directory, along with an ordered plan, and stale waves are removed."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "configurations:"
+        + TEST_CONFIGURATION.format(test_key="a", worker_replicas=6, users=600, run_time="1h")
+        + TEST_CONFIGURATION.format(test_key="b", worker_replicas=6, users=600, run_time="10m")
+        + TEST_CONFIGURATION.format(test_key="c", worker_replicas="auto", users=4000, run_time="1h")
+    )
+    output_dir = tmp_path / "out"
+    (output_dir / "wave-007").mkdir(parents=True)
+
+    # * Act
+    result = runner.invoke(app, ["schedule", "-f", str(config_file), "-o", str(output_dir), "--max-worker-pods", "10"])
+
+    # * Assert
+    assert result.exit_code == 0
+    assert "Scheduled 3 tests in 2 waves, lasting 1h10m." in result.stdout
+    assert sorted(path.name for path in output_dir.iterdir()) == ["plan.json", "wave-001", "wave-002"]
+    assert sorted(path.name for path in (output_dir / "wave-001").iterdir()) == ["a.my-test.yaml", "c.my-test.yaml"]
+    plan = json.loads((output_dir / "plan.json").read_text())
+    assert [(wave["directory"], wave["worker_pods"], wave["duration_seconds"]) for wave in plan["waves"]] == [
+        ("wave-001", 10, 3600),
+        ("wave-002", 6, 600),
+    ]
+    assert plan["waves"][1]["tests"] == [{"test": "b", "name": "b.my-test", "worker_pods": 6, "users": 600, "duration_seconds": 600}]
+
+
+def test_cli_schedule_requires_a_cap(tmp_path: Path) -> None:
+    """Check that scheduling without any cap is rejected."""
+    # * Act
+    result = runner.invoke(app, ["schedule", "-f", str(tmp_path), "-o", str(tmp_path / "out")])
+
+    # * Assert
+    assert result.exit_code == 2
@@ -0,0 +1,253 @@
+"""Configuration JSON Schema test module."""
+import copy
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+from benchmarks.synthetic import synthetic_configuration
+from pydantic import ValidationError
+from typer.testing import CliRunner
+
+from intensive_brew.cli import app
+from intensive_brew.core.dto.yaml.configuration import Configuration
+from intensive_brew.core.schema.compiled_validator import validate
+from intensive_brew.core.schema.compiler import SchemaCompiler
+from intensive_brew.core.schema.constants import COMPILED_VALIDATOR_MODULE, JSON_SCHEMA_DIALECT
+from intensive_brew.core.schema.schema import ConfigurationSchema
+
+runner = CliRunner(mix_stderr=False)
+
+VANILLA_SPECS = {"users": 10, "spawn_rate": 1, "run_time": "1m", "target_host": "http://localhost:8080"}
+EXPERT_MODE = {"enabled": True, "masterCommandSeed": "--users 10", "workerCommandSeed": "--locustfile src/my_test.py"}
+
+
+def _configuration(**fields: Any) -> dict[str, Any]:
+    """Prepare a configuration of a single vanilla test, fields set to `...` are removed."""
+    test_config = {"entry_point": "src/my_test.py", "vanilla_specs": VANILLA_SPECS, **fields}
+    return {"configurations": {"my-test": {key: value for key, value in test_config.items() if value is not ...}}}
+
+
+# Configurations in canonical YAML types, and whether they are valid
+CORPUS: dict[str, tuple[dict[str, Any] | list[Any], bool]] = {
+    "vanilla": (_configuration(), True),
+    "missing entry point": (_configuration(entry_point=...), False),
+    "null entry point": (_configuration(entry_point=None), False),
+    "missing vanilla specs": (_configuration(vanilla_specs=...), False),
+    "null vanilla specs": (_configuration(vanilla_specs=None), False),
+    "custom load shapes": (_configuration(vanilla_specs=..., custom_load_shapes=True), True),
+    "disabled custom load shapes": (_configuration(vanilla_specs=..., custom_load_shapes=False), False),
+    "expert mode": (_configuration(entry_point=..., vanilla_specs=..., expert_mode=EXPERT_MODE), True),
+    "disabled expert mode": (_configuration(entry_point=..., vanilla_specs=..., expert_mode={**EXPERT_MODE, "enabled": False}), False),
+    "null expert mode": (_configuration(expert_mode=None), True),
+    "compound run time": (_configuration(vanilla_specs={**VANILLA_SPECS, "run_time": "1h30m"}), True),
+    "run time in days": (_configuration(vanilla_specs={**VANILLA_SPECS, "run_time": "1d"}), False),
+    "run time leftovers": (_configuration(vanilla_specs={**VANILLA_SPECS, "run_time": "30s5"}), False),
+    "run time trailing newline": (_configuration(vanilla_specs={**VANILLA_SPECS, "run_time": "30s\n"}), False),
+    "target host without scheme": (_configuration(vanilla_specs={**VANILLA_SPECS, "target_host": "localhost"}), False),
+    "empty target host": (_configuration(vanilla_specs={**VANILLA_SPECS, "target_host": ""}), False),
+    "target host with whitespace": (_configuration(vanilla_specs={**VANILLA_SPECS, "target_host": " http://a.example.com "}), True),
+    "missing users": (_configuration(vanilla_specs={key: value for key, value in VANILLA_SPECS.items() if key != "users"}), False),
+    "null users": (_configuration(vanilla_specs={**VANILLA_SPECS, "users": None}), False),
+    "automatic worker replicas": (_configuration(worker_replicas="auto"), True),
+    "unknown worker replicas": (_configuration(worker_replicas="many"), False),
+    "auto without load": (_configuration(vanilla_specs=..., custom_load_shapes=True, worker_replicas="auto"), False),
+    "auto with hint": (
+        _configuration(vanilla_specs=..., custom_load_shapes=True, worker_replicas="auto", worker_capacity={"users": 5000}),
+        True,
+    ),
+    "auto in expert mode": (_configuration(expert_mode=EXPERT_MODE, worker_replicas="auto"), False),
+    "zero users per worker": (_configuration(worker_capacity={"users_per_worker": 0}), False),
+    "tolerations": (_configuration(tolerations=[{"key": "k", "operator": "Equal", "effect": "NoSchedule", "value": "v"}]), True),
+    "unknown toleration operator": (_configuration(tolerations=[{"key": "k", "operator": "In", "effect": "NoSchedule"}]), False),
+    "null labels": (_configuration(labels={"master": None}), False),
+    "affinity": (_configuration(affinity={"nodeAffinity": {"requiredDuringSchedulingIgnoredDuringExecution": {"pool": "perf"}}}), True),
+    "matrix": (_configuration(matrix={"users": [1, 2], "run_time": ["1m", "2h"], "target_host": ["http://a", "http://b"]}), True),
+    "empty matrix axis": (_configuration(matrix={"users": []}), False),
+    "duplicate matrix values": (_configuration(matrix={"users": [1, 1]}), False),
+    "invalid matrix run time": (_configuration(matrix={"run_time": ["1m", "forever"]}), False),
+    "matrix without vanilla specs": (_configuration(vanilla_specs=..., custom_load_shapes=True, matrix={"users": [1, 2]}), False),
+    "worker replicas matrix": (_configuration(vanilla_specs=..., custom_load_shapes=True, matrix={"worker_replicas": [1, 2]}), True),
+    "matrix in expert mode": (_configuration(expert_mode=EXPERT_MODE, matrix={"users": [1, 2]}), False),
+    "unknown field": (_configuration(unknown=1), True),
+    "missing configurations": ({}, False),
+    "test not a mapping": ({"configurations": {"my-test": "src/my_test.py"}}, False),
+    "not a mapping": ([], False),
+}
+
+# Configurations pydantic coerces into valid ones, the schema sticks to canonical types
+COERCED: dict[str, dict[str, Any]] = {
+    "quoted users": _configuration(vanilla_specs={**VANILLA_SPECS, "users": "10"}),
+    "fractional users": _configuration(vanilla_specs={**VANILLA_SPECS, "users": 5.5}),
+    "numeric entry point": _configuration(entry_point=5),
+    "boolean worker replicas": _configuration(worker_replicas=True),
+    "numeric label": _configuration(labels={"master": {"team": 1}}),
+}
+
+
+def _pydantic_accepts(data: Any) -> bool:
+    """Check if the configuration models accept a configuration."""
+    try:
+        Configuration.parse_obj(copy.deepcopy(data))
+    except ValidationError:
+        return False
+    return True
+
+
+@pytest.mark.parametrize(("data", "valid"), CORPUS.values(), ids=CORPUS.keys())
+def test_compiled_validator_agrees_with_models(data: dict[str, Any], valid: bool) -> None:
+    """Check that the compiled validator and the configuration models accept and reject the same configurations."""
+    # * Act
+    errors = validate(data)
+
+    # * Assert
+    assert _pydantic_accepts(data) is valid
+    assert (not errors) is valid, errors
+
+
+@pytest.mark.parametrize("data", COERCED.values(), ids=COERCED.keys())
+def test_schema_rejects_coerced_values(data: dict[str, Any]) -> None:
+    """Check that values of the wrong YAML type are rejected, even those the models coerce."""
+    # * Act
+    errors = validate(data)
+
+    # * Assert
+    assert _pydantic_accepts(data)
+    assert errors
+
+
+def test_synthetic_configuration_is_valid() -> None:
+    """Check that every kind of synthetic test is valid under the schema."""
+    # * Act
+    errors = validate(synthetic_configuration(60, seed=3))
+
+    # * Assert
+    assert errors == []
+
+
+def test_errors_locate_the_invalid_value() -> None:
+    """Check that errors report the path of the invalid value, rather than the optional section holding it."""
+    # * Setup
+    data = _configuration(vanilla_specs={**VANILLA_SPECS, "run_time": "1d"}, tolerations=[{"key": "k", "operator": "Exists"}])
+
+    # * Act
+    errors = validate(data)
+
+    # * Assert
+    assert errors == [
+        "$.configurations.my-test.vanilla_specs.run_time: does not match '^(?:\\d+[hms])+\\Z'",
+        "$.configurations.my-test.tolerations[0]: 'effect' is a required property",
+    ]
+
+
+def test_compiled_validator_is_up_to_date() -> None:
+    """Check that the compiled validator was regenerated after the last change to the schema or the compiler."""
+    # * Setup
+    module = Path(__file__).parents[1] / "src" / "intensive_brew" / COMPILED_VALIDATOR_MODULE
+
+    # * Act
+    source = SchemaCompiler(ConfigurationSchema.build()).compile()
+
+    # * Assert
+    assert module.read_text() == source, "Regenerate the compiled validator with `poe generate-validator`."
+
+
+def test_compiler_rejects_unsupported_keywords() -> None:
+    """Check that keywords the compiler doesn't support are reported instead of ignored."""
+    # * Setup
+    schema = {"type": "object", "properties": {"name": {"type": "string", "contentEncoding": "base64"}}}
+
+    # * Act, Assert
+    with pytest.raises(ValueError, match="contentEncoding"):
+        SchemaCompiler(schema).compile()
+
+
+def test_compiler_supports_recursive_definitions() -> None:
+    """Check that definitions referencing themselves are compiled once."""
+    # * Setup
+    schema = {
+        "$ref": "#/definitions/Node",
+        "definitions": {"Node": {"type": "object", "required": ["name"], "properties": {"child": {"$ref": "#/definitions/Node"}}}},
+    }
+    namespace: dict[str, Any] = {}
+
+    # * Act
+    exec(SchemaCompiler(schema).compile(), namespace)  # nosec B102 - compiled from the schema above
+
+    # * Assert
+    assert namespace["validate"]({"name": "a", "child": {"name": "b"}}) == []
+    assert namespace["validate"]({"name": "a", "child": {"child": {}}}) == [
+        "$.child: 'name' is a required property",
+        "$.child.child: 'name' is a required property",
+    ]
+
+
+def test_export_schema(tmp_path: Path) -> None:
+    """Check that the schema is exported along with the rules checked by the model validators."""
+    # * Setup
+    schema_file = tmp_path / "configuration.schema.json"
+
+    # * Act
+    printed = runner.invoke(app, ["export-schema"])
+    written = runner.invoke(app, ["export-schema", "--output", str(schema_file)])
+
+    # * Assert
+    assert printed.exit_code == 0 and written.exit_code == 0
+    schema = json.loads(printed.stdout)
+    assert schema == json.loads(schema_file.read_text())
+    assert schema["$schema"] == JSON_SCHEMA_DIALECT
+    assert len(schema["definitions"]["TestConfig"]["allOf"]) == 4
+    assert schema["definitions"]["VanillaSpecs"]["properties"]["run_time"]["pattern"] == "^(?:\\d+[hms])+$"
+
+
+def test_validate_configuration_schema_only(tmp_path: Path) -> None:
+    """Check that configuration files are checked against the schema alone, reporting the errors of every file."""
+    # * Setup
+    valid_file, invalid_file = tmp_path / "valid.yaml", tmp_path / "invalid.yaml"
+    valid_file.write_text(yaml.safe_dump(_configuration()))
+    invalid_file.write_text(yaml.safe_dump(_configuration(entry_point=...)))
+
+    # * Act
+    valid = runner.invoke(app, ["validate-configuration", "-f", str(valid_file), "--schema-only"])
+    invalid = runner.invoke(app, ["validate-configuration", "-f", str(tmp_path), "--schema-only"])
+
+    # * Assert
+    assert valid.exit_code == 0
+    assert invalid.exit_code == 1
+    assert f"{invalid_file}: $.configurations.my-test: 'entry_point' is a required property" in invalid.stderr
+
+
+def test_validate_configuration_schema_only_multi_document(tmp_path: Path) -> None:
+    """Check that every document of a multi-document file is checked, as the default validator loads them all."""
+    # * Setup
+    valid_file, invalid_file = tmp_path / "valid.yaml", tmp_path / "invalid.yaml"
+    other_test = {"configurations": {"other-test": _configuration()["configurations"]["my-test"]}}
+    valid_file.write_text(yaml.safe_dump_all([_configuration(), other_test, None]))
+    invalid_file.write_text(yaml.safe_dump_all([_configuration(), _configuration(entry_point=...)]))
+
+    # * Act
+    valid = runner.invoke(app, ["validate-configuration", "-f", str(valid_file), "--schema-only"])
+    default = runner.invoke(app, ["validate-configuration", "-f", str(valid_file)])
+    invalid = runner.invoke(app, ["validate-configuration", "-f", str(invalid_file), "--schema-only"])
+
+    # * Assert
+    assert valid.exit_code == 0 and default.exit_code == 0
+    assert invalid.exit_code == 1
+    assert f"{invalid_file}: document 2: $.configurations.my-test: 'entry_point' is a required property" in invalid.stderr
+
+
+def test_validate_configuration_schema_only_malformed_file(tmp_path: Path) -> None:
+    """Check that a file that can't be parsed is reported as invalid, along with the errors of the other files."""
+    # * Setup
+    (tmp_path / "malformed.yaml").write_text("configurations: [unclosed\n")
+    (tmp_path / "invalid.yaml").write_text(yaml.safe_dump(_configuration(entry_point=...)))
+
+    # * Act
+    result = runner.invoke(app, ["validate-configuration", "-f", str(tmp_path), "--schema-only"])
+
+    # * Assert
+    assert result.exit_code == 1
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+    assert f"{tmp_path / 'malformed.yaml'}: while parsing a flow sequence" in result.stderr
+    assert f"{tmp_path / 'invalid.yaml'}: $.configurations.my-test: 'entry_point' is a required property" in result.stderr
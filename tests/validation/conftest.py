@@ -0,0 +1,17 @@
+"""Test package."""
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def write_configuration(tmp_path: Path) -> Callable[[str], str]:
+    """Get a function writing a configuration file and returning its path."""
+
+    def write(content: str) -> str:
+        file_path = tmp_path / "config.yaml"
+        file_path.write_text(content)
+        return str(file_path)
+
+    return write
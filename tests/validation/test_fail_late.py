@@ -0,0 +1,115 @@
+"""Fail-late validation test module."""
+import json
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+from typer.testing import CliRunner
+
+from intensive_brew.cli import app
+from intensive_brew.core.cache.configuration_cache import ConfigurationCache
+from intensive_brew.core.yaml.validation import Validation
+
+INVALID_CONFIGURATION = """
+configurations:
+  TLM:
+    entry_point: src/my_test.py
+    custom_load_shapes: true
+  checkout:
+    custom_load_shapes: true
+  search:
+    entry_point: src/search_test.py
+    vanilla_specs:
+      users: many
+      spawn_rate: 10
+      run_time: 3x
+      target_host: http://localhost:8080
+"""
+
+runner = CliRunner()
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_validate_all_reports_every_invalid_test(write_configuration: Callable[[str], str], jobs: int) -> None:
+    """Check that every error of every test is collected, in configuration order."""
+    # * Act
+    report = Validation.validate_all(write_configuration(INVALID_CONFIGURATION), jobs=jobs)
+
+    # * Assert
+    assert not report.is_valid
+    assert report.tests == 3
+    assert report.invalid_tests == ["checkout", "search"]
+    assert [(issue.test_key, issue.location) for issue in report.issues] == [
+        ("checkout", ["entry_point"]),
+        ("search", ["vanilla_specs", "users"]),
+        ("search", ["vanilla_specs", "run_time"]),
+    ]
+
+
+def test_validate_all_reports_document_errors(write_configuration: Callable[[str], str]) -> None:
+    """Check that a malformed document is reported along with the entries parsed before it."""
+    # * Setup
+    config_file = write_configuration("configurations:\n  checkout:\n    custom_load_shapes: true\n---\n- not a mapping\n")
+
+    # * Act
+    report = Validation.validate_all(config_file)
+
+    # * Assert
+    assert report.invalid_tests == ["checkout"]
+    assert [issue.test_key for issue in report.issues] == ["checkout", None]
+    assert report.issues[1].message == "Each configuration document must be a mapping."
+
+
+def test_cli_validation_report(tmp_path: Path, write_configuration: Callable[[str], str]) -> None:
+    """Check that the CLI fails, prints every error and writes the JSON report."""
+    # * Setup
+    report_file = tmp_path / "report.json"
+
+    # * Act
+    result = runner.invoke(app, ["validate-configuration", "-f", write_configuration(INVALID_CONFIGURATION), "--report", str(report_file)])
+
+    # * Assert
+    assert result.exit_code == 1
+    assert "2 of 3 tests are invalid." in result.output
+    report = json.loads(report_file.read_text())
+    assert report["valid"] is False
+    assert report["invalid_tests"] == ["checkout", "search"]
+    assert len(report["issues"]) == 3
+
+
+def test_cli_validation_fail_fast(write_configuration: Callable[[str], str]) -> None:
+    """Check that fail-fast mode stops at the first invalid test."""
+    # * Act
+    result = runner.invoke(app, ["validate-configuration", "-f", write_configuration(INVALID_CONFIGURATION), "--fail-fast"])
+
+    # * Assert
+    assert result.exit_code == 1
+    assert isinstance(result.exception, ValidationError)
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_cli_validation_reports_expanded_collisions(write_configuration: Callable[[str], str], cached: bool) -> None:
+    """Check that a matrix combination colliding with a declared test is reported, whether the file is cached or not."""
+    # * Setup
+    config_file = write_configuration(
+        "configurations:\n"
+        "  TLM:\n"
+        "    entry_point: src/my_test.py\n"
+        "    vanilla_specs: {users: 100, spawn_rate: 10, run_time: 1m, target_host: http://localhost:8080}\n"
+        "    matrix: {users: [100, 200]}\n"
+        "  TLM-u100:\n"
+        "    entry_point: src/my_test.py\n"
+        "    custom_load_shapes: true\n",
+    )
+    if cached:
+        # Cached by a run validating the file alone, collisions are only reported once files are merged
+        assert Validation.validate_all(config_file, cache=ConfigurationCache()).is_valid
+
+    # * Act
+    result = runner.invoke(app, ["validate-configuration", "-f", config_file])
+
+    # * Assert
+    assert result.exit_code == 1
+    assert "1 of 3 tests are invalid." in result.output
+    assert "Duplicate test key 'TLM-u100'" in result.output
@@ -0,0 +1,154 @@
+"""Test matrix expansion test module."""
+import itertools
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from intensive_brew.core.custom_resource.generation import Generation
+from intensive_brew.core.dto.yaml.configuration import Configuration
+from intensive_brew.core.dto.yaml.test_config import TestConfig
+from intensive_brew.core.yaml.matrix import MatrixExpansion
+from intensive_brew.core.yaml.sources import ConfigurationCollisionError, ConfigurationSources
+
+VANILLA_SPECS = {"users": 10, "spawn_rate": 1, "run_time": "1m", "target_host": "http://localhost:8080"}
+
+
+def _test_config(**matrix: list[object]) -> TestConfig:
+    """Prepare a test configuration declaring a matrix."""
+    return TestConfig.parse_obj({"entry_point": "src/my_test.py", "vanilla_specs": VANILLA_SPECS, "matrix": matrix})
+
+
+def test_expand_generates_every_combination() -> None:
+    """Check that a matrix is expanded into one test per combination, keyed after its values."""
+    # * Setup
+    test_config = _test_config(users=[100, 500], spawn_rate=[10, 50], worker_replicas=[2])
+    plain_config = TestConfig.parse_obj({"entry_point": "src/my_test.py", "custom_load_shapes": True})
+
+    # * Act
+    expanded = list(MatrixExpansion.expand([("TLM", test_config), ("checkout", plain_config)]))
+
+    # * Assert
+    assert MatrixExpansion.size(test_config) == 4
+    assert [test_key for test_key, _ in expanded] == [
+        "TLM-u100-sr10-w2",
+        "TLM-u100-sr50-w2",
+        "TLM-u500-sr10-w2",
+        "TLM-u500-sr50-w2",
+        "checkout",
+    ]
+    _, last = expanded[3]
+    assert (last.vanilla_specs.users, last.vanilla_specs.spawn_rate, last.worker_replicas) == (500, 50, 2)  # type: ignore[union-attr]
+    assert last.matrix is None
+    assert expanded[4] == ("checkout", plain_config)
+
+
+def test_expand_is_lazy() -> None:
+    """Check that combinations are generated one at a time, without expanding the whole matrix."""
+    # * Setup
+    test_config = _test_config(users=list(range(1, 1001)), spawn_rate=list(range(1, 1001)))
+
+    # * Act
+    first = list(itertools.islice(MatrixExpansion.combinations("TLM", test_config), 2))
+
+    # * Assert
+    assert MatrixExpansion.size(test_config) == 1_000_000
+    assert [test_key for test_key, _ in first] == ["TLM-u1-sr1", "TLM-u1-sr2"]
+
+
+def test_target_hosts_are_named_after_their_index() -> None:
+    """Check that URLs, which can't be part of a resource name, are named after their position."""
+    # * Setup
+    test_config = _test_config(target_host=["http://a.example.com", "http://b.example.com"])
+
+    # * Act
+    expanded = list(MatrixExpansion.combinations("TLM", test_config))
+
+    # * Assert
+    assert [(test_key, config.vanilla_specs.target_host) for test_key, config in expanded] == [  # type: ignore[union-attr]
+        ("TLM-h0", "http://a.example.com"),
+        ("TLM-h1", "http://b.example.com"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "matrix",
+    [
+        {"users": []},
+        {"users": [100, 100]},
+        {"users": ["many"]},
+        {"run_time": ["1m", "forever"]},
+    ],
+)
+def test_invalid_matrix_is_rejected(matrix: dict[str, list[object]]) -> None:
+    """Check that axes listing no value, duplicate values or values failing the field validation are rejected."""
+    with pytest.raises(ValidationError):
+        _test_config(**matrix)
+
+
+def test_matrix_requires_vanilla_specs() -> None:
+    """Check that a vanilla specs axis can't be declared without vanilla specs to expand."""
+    with pytest.raises(ValidationError, match="vanilla_specs"):
+        TestConfig.parse_obj({"entry_point": "src/my_test.py", "custom_load_shapes": True, "matrix": {"users": [100]}})
+
+
+def test_generate_writes_one_resource_per_combination(tmp_path: Path) -> None:
+    """Check that each combination is generated under its own unique name."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "configurations:\n"
+        "  TLM:\n"
+        "    entry_point: src/my_test.py\n"
+        "    vanilla_specs: {users: 10, spawn_rate: 1, run_time: 1m, target_host: 'http://localhost:8080'}\n"
+        "    matrix: {users: [100, 500], spawn_rate: [10, 50]}\n"
+    )
+    output_dir = tmp_path / "out"
+
+    # * Act
+    Generation.generate(str(config_file), str(output_dir))
+
+    # * Assert
+    assert sorted(path.name for path in output_dir.iterdir() if path.suffix == ".yaml") == [
+        "tlm-u100-sr10.my-test.yaml",
+        "tlm-u100-sr50.my-test.yaml",
+        "tlm-u500-sr10.my-test.yaml",
+        "tlm-u500-sr50.my-test.yaml",
+    ]
+
+
+def test_expanded_tests_collide_with_declared_ones(tmp_path: Path) -> None:
+    """Check that a combination deriving the name of a declared test is rejected."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "configurations:\n"
+        "  TLM:\n"
+        "    entry_point: src/my_test.py\n"
+        "    vanilla_specs: {users: 10, spawn_rate: 1, run_time: 1m, target_host: 'http://localhost:8080'}\n"
+        "    matrix: {users: [100]}\n"
+        "  tlm-u100:\n"
+        "    entry_point: src/my_test.py\n"
+        "    custom_load_shapes: true\n"
+    )
+
+    # * Act
+    with pytest.raises(ConfigurationCollisionError) as error:
+        ConfigurationSources.load([str(config_file)])
+
+    # * Assert
+    assert [(collision.kind, collision.value) for collision in error.value.collisions] == [("metadata.name", "tlm-u100.my-test")]
+
+
+def test_configuration_without_matrix_is_unchanged(tmp_path: Path) -> None:
+    """Check that a configuration declaring no matrix is loaded as is."""
+    # * Setup
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("configurations:\n  TLM:\n    entry_point: src/my_test.py\n    custom_load_shapes: true\n")
+
+    # * Act
+    configuration = ConfigurationSources.load([str(config_file)])
+
+    # * Assert
+    assert isinstance(configuration, Configuration)
+    assert list(configuration.configurations) == ["TLM"]
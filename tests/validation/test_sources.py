@@ -0,0 +1,137 @@
+"""Configuration sources test module."""
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from intensive_brew.cli import app
+from intensive_brew.core.custom_resource.generation import Generation
+from intensive_brew.core.yaml.sources import ConfigurationCollisionError, ConfigurationSources
+
+TEAM_CONFIGURATION = """
+configurations:
+  {test_key}:
+    entry_point: {entry_point}
+    custom_load_shapes: true
+"""
+
+runner = CliRunner()
+
+
+def _write_team(directory: Path, file_name: str, test_key: str, entry_point: str = "src/my_test.py") -> str:
+    """Write a single test configuration file and return its path."""
+    directory.mkdir(parents=True, exist_ok=True)
+    file_path = directory / file_name
+    file_path.write_text(TEAM_CONFIGURATION.format(test_key=test_key, entry_point=entry_point))
+    return str(file_path)
+
+
+def test_expand_directories_and_globs(tmp_path: Path) -> None:
+    """Check that directories are searched recursively, globs are expanded and files are only listed once."""
+    # * Setup
+    first = _write_team(tmp_path / "teams", "a.yaml", "TLM")
+    second = _write_team(tmp_path / "teams" / "nested", "b.yml", "checkout")
+    (tmp_path / "teams" / "notes.txt").write_text("not a configuration")
+
+    # * Act
+    files = ConfigurationSources.expand([str(tmp_path / "teams"), str(tmp_path / "teams" / "**" / "*.yml"), first])
+
+    # * Assert
+    assert files == [first, second]
+
+
+def test_expand_rejects_empty_glob(tmp_path: Path) -> None:
+    """Check that a glob matching no file is reported."""
+    with pytest.raises(FileNotFoundError):
+        ConfigurationSources.expand([str(tmp_path / "*.yaml")])
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_load_merges_files(tmp_path: Path, jobs: int) -> None:
+    """Check that the tests of every file are merged into a single configuration, in file order."""
+    # * Setup
+    _write_team(tmp_path, "a.yaml", "TLM")
+    _write_team(tmp_path, "b.yaml", "checkout")
+
+    # * Act
+    configuration = ConfigurationSources.load([str(tmp_path)], jobs=jobs)
+
+    # * Assert
+    assert list(configuration.configurations) == ["TLM", "checkout"]
+
+
+def test_load_rejects_duplicate_test_keys(tmp_path: Path) -> None:
+    """Check that a test key declared by two files is rejected."""
+    # * Setup
+    _write_team(tmp_path, "a.yaml", "TLM")
+    _write_team(tmp_path, "b.yaml", "TLM", entry_point="src/other_test.py")
+
+    # * Act
+    with pytest.raises(ConfigurationCollisionError) as error:
+        ConfigurationSources.load([str(tmp_path)])
+
+    # * Assert
+    assert [(collision.kind, collision.value) for collision in error.value.collisions] == [("test key", "TLM")]
+
+
+def test_load_rejects_duplicate_resource_names(tmp_path: Path) -> None:
+    """Check that two tests deriving the same `metadata.name` are rejected."""
+    # * Setup
+    _write_team(tmp_path, "a.yaml", "TLM")
+    _write_team(tmp_path, "b.yaml", "tlm")
+
+    # * Act
+    with pytest.raises(ConfigurationCollisionError) as error:
+        ConfigurationSources.load([str(tmp_path)])
+
+    # * Assert
+    assert [(collision.kind, collision.value) for collision in error.value.collisions] == [("metadata.name", "tlm.my-test")]
+
+
+def test_validate_all_reports_collisions(tmp_path: Path) -> None:
+    """Check that collisions are reported along with validation errors."""
+    # * Setup
+    _write_team(tmp_path, "a.yaml", "TLM")
+    _write_team(tmp_path, "b.yaml", "tlm")
+    (tmp_path / "c.yaml").write_text("configurations:\n  checkout:\n    custom_load_shapes: true\n")
+
+    # * Act
+    report = ConfigurationSources.validate_all([str(tmp_path)])
+
+    # * Assert
+    assert report.tests == 3
+    assert [(issue.test_key, issue.type) for issue in report.issues] == [
+        ("tlm", "collision.metadata.name"),
+        ("checkout", "value_error"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "stream,pipeline,incremental", [(False, False, False), (True, False, False), (False, True, False), (False, False, True)]
+)
+def test_generate_rejects_collisions(tmp_path: Path, stream: bool, pipeline: bool, incremental: bool) -> None:
+    """Check that no generation mode lets a test overwrite another one's custom resource."""
+    # * Setup
+    first = _write_team(tmp_path / "teams", "a.yaml", "TLM")
+    second = _write_team(tmp_path / "teams", "b.yaml", "tlm")
+
+    # * Act & Assert
+    with pytest.raises(ConfigurationCollisionError):
+        Generation.generate([first, second], str(tmp_path / "out"), stream=stream, pipeline=pipeline, incremental=incremental)
+
+
+def test_cli_accepts_several_configuration_files(tmp_path: Path) -> None:
+    """Check that `-f` can be repeated."""
+    # * Setup
+    first = _write_team(tmp_path / "teams", "a.yaml", "TLM")
+    second = _write_team(tmp_path / "teams", "b.yaml", "checkout")
+    output_dir = tmp_path / "out"
+
+    # * Act
+    validate_result = runner.invoke(app, ["validate-configuration", "-f", first, "-f", second])
+    generate_result = runner.invoke(app, ["generate", "-f", first, "-f", second, "-o", str(output_dir)])
+
+    # * Assert
+    assert validate_result.exit_code == 0
+    assert generate_result.exit_code == 0
+    assert sorted(path.name for path in output_dir.iterdir() if path.suffix == ".yaml") == ["checkout.my-test.yaml", "tlm.my-test.yaml"]
@@ -0,0 +1,111 @@
+"""Streaming configuration ingestion test module."""
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from intensive_brew.core.custom_resource.generation import Generation
+from intensive_brew.core.yaml.validation import Validation
+
+SINGLE_DOCUMENT = """
+defaults: &vanilla
+  entry_point: src/my_test.py
+  vanilla_specs:
+    users: 100
+    spawn_rate: 10
+    target_host: http://localhost:8080
+configurations:
+  TLM: *vanilla
+  checkout:
+    <<: *vanilla
+    entry_point: src/checkoutFlow.py
+    worker_replicas: 2
+  search:
+    entry_point: src/search_test.py
+    custom_load_shapes: true
+"""
+
+MULTI_DOCUMENT = """
+configurations:
+  TLM:
+    entry_point: src/my_test.py
+    custom_load_shapes: true
+---
+configurations:
+  search:
+    expert_mode:
+      enabled: true
+      masterCommandSeed: master
+      workerCommandSeed: worker
+---
+"""
+
+
+def test_stream_matches_full_load(write_configuration: Callable[[str], str]) -> None:
+    """Check that streamed entries are identical, and in the same order, as the fully loaded configuration."""
+    # * Setup
+    file_path = write_configuration(SINGLE_DOCUMENT)
+    configuration = Validation.generate_configuration_object(file_path)
+
+    # * Act
+    streamed = list(Validation.stream_test_configs(file_path))
+
+    # * Assert
+    assert streamed == list(configuration.configurations.items())
+
+
+def test_stream_multi_document(write_configuration: Callable[[str], str]) -> None:
+    """Check that every document of a multi-document stream contributes its entries."""
+    # * Setup
+    file_path = write_configuration(MULTI_DOCUMENT)
+
+    # * Act
+    streamed = dict(Validation.stream_test_configs(file_path))
+
+    # * Assert
+    assert list(streamed) == ["TLM", "search"]
+    assert streamed["search"].expert_mode.enabled  # type: ignore[union-attr]
+
+
+def test_stream_invalid_entry(write_configuration: Callable[[str], str]) -> None:
+    """Check that entries preceding an invalid one are yielded before the validation error is raised."""
+    # * Setup
+    file_path = write_configuration("configurations:\n  TLM:\n    custom_load_shapes: true\n    entry_point: a.py\n  bad:\n    image: x\n")
+    stream = Validation.stream_test_configs(file_path)
+
+    # * Act
+    test_key, _ = next(stream)
+
+    # * Assert
+    assert test_key == "TLM"
+    with pytest.raises(ValidationError):
+        next(stream)
+
+
+def test_stream_missing_configurations_section(write_configuration: Callable[[str], str]) -> None:
+    """Check that a document without a `configurations` section is rejected."""
+    # * Setup
+    file_path = write_configuration("tests:\n  TLM: {}\n")
+
+    # * Act & Assert
+    with pytest.raises(ValueError, match="configurations"):
+        list(Validation.stream_test_configs(file_path))
+
+
+def test_streaming_generation_matches_batch(tmp_path: Path, write_configuration: Callable[[str], str]) -> None:
+    """Check that streaming generation writes exactly the same files as batch generation."""
+    # * Setup
+    file_path = write_configuration(SINGLE_DOCUMENT)
+    batch_dir = tmp_path / "batch"
+    stream_dir = tmp_path / "stream"
+
+    # * Act
+    Generation.generate(file_path, str(batch_dir))
+    Generation.generate(file_path, str(stream_dir), stream=True)
+
+    # * Assert
+    batch_files = {path.name: path.read_bytes() for path in batch_dir.iterdir()}
+    stream_files = {path.name: path.read_bytes() for path in stream_dir.iterdir()}
+    assert len(batch_files) == 3
+    assert stream_files == batch_files